@@ -1,13 +1,15 @@
 import sqlite3
-import cloudscraper
 from bs4 import BeautifulSoup
 import sys
 import io
 import time
 from urllib.parse import urljoin
-import re
-import unicodedata
-from rapidfuzz import fuzz
+from fuzzy_matcher import match_brand
+from text_normalize import normalize_compact as normalize_text
+from fetcher import get_scraper, print_stats
+import html_extract
+from brand_index import find_in_index, resolve_brand
+from db_writer import WriteBuffer
 
 # Фикс кодировки для Windows консоли
 if sys.platform == 'win32':
@@ -31,20 +33,6 @@ def add_fragrantica_url_column():
     
     return conn
 
-def normalize_text(text):
-    """
-    Нормализует текст для сравнения с правильной обработкой диакритических знаков
-    é → e, ñ → n, ü → u и т.д.
-    """
-    # Удаляем диакритические знаки (é → e)
-    text = unicodedata.normalize('NFD', text)
-    text = ''.join(char for char in text if unicodedata.category(char) != 'Mn')
-    
-    # Оставляем только буквы и цифры
-    text = re.sub(r'[^a-z0-9]', '', text.lower())
-    
-    return text
-
 def search_fragrantica_final(scraper, brand, name, brand_cache):
     """
     Финальная версия поиска с fuzzy matching
@@ -53,60 +41,11 @@ def search_fragrantica_final(scraper, brand, name, brand_cache):
     # Стратегия 1: Проверяем кеш бренда
     brand_key = brand.lower().strip()
     if brand_key in brand_cache:
-        perfume_links = brand_cache[brand_key]
-        
-        # Нормализуем название для поиска
-        name_normalized = normalize_text(name)
-        name_lower = name.lower().strip()
-        
-        best_match = None
-        best_match_score = 0
+        perfume_links, candidates_normalized = brand_cache[brand_key]
         
-        for plink in perfume_links:
-            ptext_normalized = normalize_text(plink['text'])
-            ptext_lower = plink['text'].lower().strip()
-            
-            # Точное совпадение
-            if name_normalized == ptext_normalized:
-                return plink['url']
-            
-            # Fuzzy matching с несколькими методами
-            # 1. Token sort ratio (игнорирует порядок слов)
-            fuzzy_score = fuzz.token_sort_ratio(name_lower, ptext_lower)
-            
-            # 2. Partial ratio (частичное совпадение)
-            partial_score = fuzz.partial_ratio(name_lower, ptext_lower)
-            
-            # 3. Token set ratio (игнорирует дубликаты слов)
-            token_set_score = fuzz.token_set_ratio(name_lower, ptext_lower)
-            
-            # Берем максимальный score
-            max_fuzzy_score = max(fuzzy_score, partial_score, token_set_score)
-            
-            # Если совпадение достаточно хорошее
-            if max_fuzzy_score > best_match_score and max_fuzzy_score >= 70:  # Порог 70%
-                best_match = plink['url']
-                best_match_score = max_fuzzy_score
-            
-            # Дополнительная проверка: все слова из короткого названия есть в длинном
-            if len(name_normalized) > 5:
-                name_words = set(name_lower.split())
-                ptext_words = set(ptext_lower.split())
-                
-                # Считаем сколько слов совпадает
-                common_words = name_words & ptext_words
-                if len(name_words) > 0:
-                    word_match_ratio = len(common_words) / len(name_words) * 100
-                    
-                    if word_match_ratio > best_match_score and word_match_ratio >= 70:
-                        best_match = plink['url']
-                        best_match_score = word_match_ratio
-        
-        # Возвращаем лучшее совпадение если оно достаточно хорошее
-        if best_match and best_match_score >= 70:
-            return best_match
-        
-        return None
+        # Названия ароматов бренда нормализованы один раз при загрузке бренда
+        return match_brand([name], perfume_links, normalize_text,
+                           candidates_normalized=candidates_normalized)[0]
     
     # Стратегия 2: Формируем прямой URL страницы бренда
     # Пробуем только самые вероятные варианты для скорости
@@ -115,79 +54,21 @@ def search_fragrantica_final(scraper, brand, name, brand_cache):
         brand,  # Исходное название
     ]
     
-    brand_page_url = None
-    perfume_links = []
-    
-    for brand_variant in brand_variants:
-        test_url = f"https://www.fragrantica.ru/designers/{brand_variant}.html"
-        
-        try:
-            # Используем GET вместо HEAD
-            response = scraper.get(test_url, timeout=10)
-            
-            if response.status_code == 200:
-                brand_page_url = test_url
-                break
-        except Exception as e:
-            continue
-        
-        time.sleep(0.5)  # Небольшая пауза между попытками
+    # Один запрос на вариант URL: проверка существования и разбор страницы
+    # по одному ответу, варианты с известным 404 пропускаются без запроса
+    brand_page_url, perfume_links = resolve_brand(
+        [f"https://www.fragrantica.ru/designers/{variant}.html" for variant in brand_variants],
+        scraper
+    )
     
-    # Если нашли страницу бренда - парсим её
     if brand_page_url:
         try:
-            time.sleep(1)
-            response = scraper.get(brand_page_url, timeout=30)
-            response.encoding = 'utf-8'
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Ищем все ароматы
-            perfume_links_raw = soup.find_all('a', href=lambda x: x and '/perfume/' in x)
-            
-            name_normalized = normalize_text(name)
-            name_lower = name.lower().strip()
-            result_url = None
-            best_match_score = 0
-            
-            for plink in perfume_links_raw:
-                purl = urljoin('https://www.fragrantica.ru', plink.get('href'))
-                ptext = plink.get_text(strip=True)
-                perfume_links.append({'url': purl, 'text': ptext})
-                
-                # Проверяем совпадение с улучшенной нормализацией
-                ptext_normalized = normalize_text(ptext)
-                ptext_lower = ptext.lower().strip()
-                
-                # Точное совпадение
-                if name_normalized == ptext_normalized:
-                    result_url = purl
-                    break
-                
-                # Fuzzy matching
-                fuzzy_score = fuzz.token_sort_ratio(name_lower, ptext_lower)
-                partial_score = fuzz.partial_ratio(name_lower, ptext_lower)
-                token_set_score = fuzz.token_set_ratio(name_lower, ptext_lower)
-                
-                max_fuzzy_score = max(fuzzy_score, partial_score, token_set_score)
-                
-                if max_fuzzy_score > best_match_score and max_fuzzy_score >= 70:
-                    result_url = purl
-                    best_match_score = max_fuzzy_score
-                
-                # Проверка по словам
-                if len(name_normalized) > 5:
-                    name_words = set(name_lower.split())
-                    ptext_words = set(ptext_lower.split())
-                    common_words = name_words & ptext_words
-                    
-                    if len(name_words) > 0:
-                        word_match_ratio = len(common_words) / len(name_words) * 100
-                        if word_match_ratio > best_match_score and word_match_ratio >= 70:
-                            result_url = purl
-                            best_match_score = word_match_ratio
+            candidates_normalized = [normalize_text(plink['text']) for plink in perfume_links]
+            result_url = match_brand([name], perfume_links, normalize_text,
+                                     candidates_normalized=candidates_normalized)[0]
             
-            # Кешируем бренд
-            brand_cache[brand_key] = perfume_links
+            # Кешируем бренд вместе с нормализованными названиями
+            brand_cache[brand_key] = (perfume_links, candidates_normalized)
             
             if result_url:
                 return result_url
@@ -195,6 +76,13 @@ def search_fragrantica_final(scraper, brand, name, brand_cache):
         except Exception as e:
             pass
     
+    # Стратегия 2б: страница бренда не нашлась - токенный индекс
+    # всех загруженных брендов (без запросов в сеть)
+    if not brand_page_url:
+        result_url = find_in_index(brand, name)
+        if result_url:
+            return result_url
+    
     # Стратегия 3: Поиск через форму (точный запрос)
     try:
         search_url = "https://www.fragrantica.ru/search/"
@@ -259,51 +147,18 @@ def search_fragrantica_final(scraper, brand, name, brand_cache):
                     
                     # Парсим страницу бренда
                     time.sleep(1)
-                    response = scraper.get(brand_page_url, timeout=30)
-                    response.encoding = 'utf-8'
-                    soup = BeautifulSoup(response.text, 'html.parser')
-                    
-                    perfume_links_raw = soup.find_all('a', href=lambda x: x and '/perfume/' in x)
+                    # Без кеша - разбираем поток ответа, тело страницы целиком не загружается
+                    response = scraper.get(brand_page_url, timeout=30, stream=True)
+                    try:
+                        chunks = response.iter_content(html_extract.STREAM_CHUNK_SIZE)
+                        perfume_links = [{'url': urljoin('https://www.fragrantica.ru', href), 'text': text}
+                                         for href, text in html_extract.designer_links_stream(chunks)]
+                    finally:
+                        response.close()
                     
-                    name_normalized = normalize_text(name)
-                    name_lower = name.lower().strip()
-                    best_match = None
-                    best_score = 0
-                    
-                    for plink in perfume_links_raw:
-                        purl = urljoin('https://www.fragrantica.ru', plink.get('href'))
-                        ptext = plink.get_text(strip=True)
-                        ptext_normalized = normalize_text(ptext)
-                        ptext_lower = ptext.lower().strip()
-                        
-                        if name_normalized == ptext_normalized:
-                            return purl
-                        
-                        # Fuzzy matching
-                        fuzzy_score = fuzz.token_sort_ratio(name_lower, ptext_lower)
-                        partial_score = fuzz.partial_ratio(name_lower, ptext_lower)
-                        token_set_score = fuzz.token_set_ratio(name_lower, ptext_lower)
-                        
-                        max_fuzzy_score = max(fuzzy_score, partial_score, token_set_score)
-                        
-                        if max_fuzzy_score > best_score and max_fuzzy_score >= 70:
-                            best_match = purl
-                            best_score = max_fuzzy_score
-                        
-                        # Проверка по словам
-                        if len(name_normalized) > 5:
-                            name_words = set(name_lower.split())
-                            ptext_words = set(ptext_lower.split())
-                            common_words = name_words & ptext_words
-                            
-                            if len(name_words) > 0:
-                                word_match_ratio = len(common_words) / len(name_words) * 100
-                                if word_match_ratio > best_score and word_match_ratio >= 70:
-                                    best_match = purl
-                                    best_score = word_match_ratio
-                    
-                    if best_match and best_score >= 70:
-                        return best_match
+                    result_url = match_brand([name], perfume_links, normalize_text)[0]
+                    if result_url:
+                        return result_url
                     
                     break
                     
@@ -345,6 +200,15 @@ def process_all_products():
     
     total_batches = (len(products) + BATCH_SIZE - 1) // BATCH_SIZE
     
+    # Кеш брендов живет весь прогон, а не один пакет
+    brand_cache = {}
+    
+    # Один scraper на весь прогон: challenge и TLS проходятся один раз
+    scraper = get_scraper('https://www.fragrantica.ru')
+    
+    # Найденные URL пишем пачками, а не коммитом на каждый товар
+    writer = WriteBuffer()
+    
     for batch_num in range(0, len(products), BATCH_SIZE):
         batch_products = products[batch_num:batch_num + BATCH_SIZE]
         current_batch = batch_num // BATCH_SIZE + 1
@@ -353,18 +217,6 @@ def process_all_products():
         print(f"ПАКЕТ {current_batch}/{total_batches} (товары {batch_num + 1}-{min(batch_num + BATCH_SIZE, len(products))})")
         print(f"{'='*80}\n")
         
-        # Создаем НОВЫЙ scraper для каждого пакета (свежая сессия)
-        scraper = cloudscraper.create_scraper(
-            browser={
-                'browser': 'chrome',
-                'platform': 'windows',
-                'mobile': False
-            }
-        )
-        
-        # Новый кеш для каждого пакета
-        brand_cache = {}
-        
         for idx_in_batch, (product_id, brand, name) in enumerate(batch_products, 1):
             global_idx = batch_num + idx_in_batch
             
@@ -380,12 +232,11 @@ def process_all_products():
                 total_time += elapsed
                 
                 if fragrantica_url:
-                    cursor.execute('''
+                    writer.add('''
                         UPDATE randewoo_products 
                         SET fragrantica_url = ? 
                         WHERE id = ?
                     ''', (fragrantica_url, product_id))
-                    conn.commit()
                     
                     found += 1
                     print(f"  ✓ Найдено за {elapsed:.2f}с: {fragrantica_url}")
@@ -403,6 +254,7 @@ def process_all_products():
                 
             except KeyboardInterrupt:
                 print("\n\n⚠ Прервано пользователем")
+                writer.close()
                 conn.close()
                 return
             except Exception as e:
@@ -417,6 +269,7 @@ def process_all_products():
             print(f"\n⏸  Пауза {BATCH_PAUSE} сек перед следующим пакетом...\n")
             time.sleep(BATCH_PAUSE)
     
+    writer.close()
     conn.close()
     
     # Итоговая статистика
@@ -431,6 +284,8 @@ def process_all_products():
         print(f"  Мин. время: {min(times):.2f}с")
         print(f"  Макс. время: {max(times):.2f}с")
     print(f"{'='*80}")
+    
+    print_stats()
 
 if __name__ == '__main__':
     process_all_products()
@@ -0,0 +1,296 @@
+import os
+import sys
+import io
+import re
+import json
+import time
+import hashlib
+import threading
+from fnmatch import fnmatch
+from functools import partial
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+from urllib.parse import urljoin, urlparse
+
+import requests
+from bs4 import BeautifulSoup
+
+from browser_pool import (create_driver, wait_for_selector, READY_SELECTOR, PAGE_TIMEOUT,
+                          ALLOWED_DOMAINS, BLOCKED_RESOURCES)
+
+# Фикс кодировки для Windows консоли
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+
+# ============================================================================
+# НАСТРОЙКИ
+# ============================================================================
+
+# Урезанная фикстура в репозитории: 2 страницы по 12 товаров, ресурсы в assets/
+# (картинки, шрифты, CSS, JS; аналитика и виджет - сторонние домены).
+# --record перезаписывает ее страницами с живого сайта (нужны сеть и Chrome)
+FIXTURE_DIR = os.path.join('fixtures', 'randewoo_catalog')
+RUNS = 3   # Загрузок каждой страницы на профиль
+
+RECORD_URLS = [
+    'https://randewoo.ru/category/parfyumeriya?sorting=comments_count',
+    'https://randewoo.ru/category/parfyumeriya?sorting=comments_count&page=2',
+]
+
+# ============================================================================
+# ЗАПИСЬ ФИКСТУРЫ
+# ============================================================================
+
+def _asset_name(url):
+    path = urlparse(url).path
+    ext = os.path.splitext(path)[1][:8] or '.bin'
+    return hashlib.sha1(url.encode()).hexdigest()[:16] + ext
+
+def record_fixture(urls=RECORD_URLS):
+    """
+    Сохраняет страницы каталога и их ресурсы с randewoo.ru в FIXTURE_DIR.
+    Ссылки на ресурсы randewoo.ru переписываются на локальные копии,
+    сторонние домены (аналитика, виджеты) остаются как есть - как на живой странице
+    """
+    from fetcher import get_scraper
+
+    scraper = get_scraper('https://randewoo.ru')
+    assets_dir = os.path.join(FIXTURE_DIR, 'assets')
+    os.makedirs(assets_dir, exist_ok=True)
+    saved = {}
+
+    for page_num, page_url in enumerate(urls, 1):
+        print(f"Страница {page_num}: {page_url}")
+        response = scraper.get(page_url, timeout=30)
+        response.raise_for_status()
+        response.encoding = 'utf-8'
+        soup = BeautifulSoup(response.text, 'html.parser')
+
+        for tag, attr in (('img', 'src'), ('script', 'src'), ('link', 'href'), ('source', 'src')):
+            for element in soup.find_all(tag):
+                value = element.get(attr)
+                if not value or value.startswith('data:'):
+                    continue
+                asset_url = urljoin(page_url, value)
+                if not urlparse(asset_url).netloc.endswith('randewoo.ru'):
+                    continue
+                if tag == 'link' and not set(element.get('rel') or []) & {'stylesheet', 'icon', 'preload'}:
+                    continue
+
+                if asset_url not in saved:
+                    try:
+                        asset = scraper.get(asset_url, timeout=30)
+                        asset.raise_for_status()
+                    except Exception as e:
+                        print(f"  ⚠ {asset_url}: {e}")
+                        continue
+                    name = _asset_name(asset_url)
+                    with open(os.path.join(assets_dir, name), 'wb') as f:
+                        f.write(asset.content)
+                    saved[asset_url] = name
+
+                element[attr] = f"assets/{saved[asset_url]}"
+
+        # srcset не переписываем - убираем, иначе браузер пойдет за картинками на живой сайт
+        for element in soup.find_all(srcset=True):
+            del element['srcset']
+
+        with open(os.path.join(FIXTURE_DIR, f'page_{page_num}.html'), 'w', encoding='utf-8') as f:
+            f.write(str(soup))
+
+    print(f"\n✓ Фикстура: {len(urls)} страниц, {len(saved)} ресурсов в {FIXTURE_DIR}")
+
+# ============================================================================
+# ЗАМЕР
+# ============================================================================
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+def _serve_fixture():
+    """Локальный HTTP-сервер на свободном порту, отдает FIXTURE_DIR"""
+    handler = partial(_QuietHandler, directory=FIXTURE_DIR)
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def _network_totals(driver):
+    """Байты и запросы из performance-лога с прошлого вызова"""
+    transferred = 0
+    requests_count = 0
+    blocked = 0
+    for entry in driver.get_log('performance'):
+        message = json.loads(entry['message'])['message']
+        method = message.get('method')
+        if method == 'Network.requestWillBeSent':
+            requests_count += 1
+        elif method == 'Network.loadingFinished':
+            transferred += message['params'].get('encodedDataLength', 0)
+        elif method == 'Network.loadingFailed' and (message['params'].get('blockedReason')
+                                                   or 'NAME_NOT_RESOLVED' in message['params'].get('errorText', '')):
+            blocked += 1
+    return transferred, requests_count, blocked
+
+def measure_profile(lean, page_urls, runs=RUNS):
+    """Среднее время и байты на страницу для одного профиля"""
+    driver = create_driver(lean=lean, allowed_domains=('randewoo.ru', '127.0.0.1'), log_network=True)
+    try:
+        # Первая загрузка - прогрев драйвера, в замер не идет
+        driver.get(page_urls[0])
+        _network_totals(driver)
+
+        seconds = []
+        transferred = 0
+        requests_count = 0
+        blocked = 0
+        for _ in range(runs):
+            for url in page_urls:
+                # Кеш браузера сбрасываем, иначе повторная загрузка почти бесплатна
+                driver.execute_cdp_cmd('Network.clearBrowserCache', {})
+                start = time.time()
+                driver.get(url)
+                wait_for_selector(driver, READY_SELECTOR, PAGE_TIMEOUT)
+                seconds.append(time.time() - start)
+
+                page_bytes, page_requests, page_blocked = _network_totals(driver)
+                transferred += page_bytes
+                requests_count += page_requests
+                blocked += page_blocked
+    finally:
+        driver.quit()
+
+    loads = len(seconds)
+    return {
+        'seconds': sum(seconds) / loads,
+        'bytes': transferred / loads,
+        'requests': requests_count / loads,
+        'blocked': blocked / loads,
+    }
+
+# ============================================================================
+# ЗАМЕР БЕЗ БРАУЗЕРА
+# ============================================================================
+
+_CSS_URL = re.compile(r'url\(\s*[\'"]?([^\'")]+)')
+
+def _page_resources(html, page_url):
+    """Ресурсы из тегов страницы, которые запросил бы браузер (url() из CSS - при загрузке CSS)"""
+    soup = BeautifulSoup(html, 'html.parser')
+    resources = []
+    for tag, attr in (('img', 'src'), ('script', 'src'), ('link', 'href'), ('source', 'src'), ('iframe', 'src')):
+        for element in soup.find_all(tag):
+            value = element.get(attr)
+            if not value or value.startswith('data:'):
+                continue
+            if tag == 'link' and not set(element.get('rel') or []) & {'stylesheet', 'icon', 'preload'}:
+                continue
+            resources.append(urljoin(page_url, value))
+    return resources
+
+def _allowed(url, lean, allowed_domains):
+    """Пропустит ли профиль запрос: сторонний домен и BLOCKED_RESOURCES режутся в экономном"""
+    if not lean:
+        return True
+    host = urlparse(url).hostname or ''
+    if not any(host == domain or host.endswith('.' + domain) for domain in allowed_domains):
+        return False
+    path = url.split('?')[0]
+    return not any(fnmatch(path, pattern) for pattern in BLOCKED_RESOURCES)
+
+def measure_http(lean, page_urls, runs=RUNS, allowed_domains=ALLOWED_DOMAINS + ('127.0.0.1',)):
+    """
+    То же сравнение без Chrome: ресурсы страницы скачиваются HTTP-клиентом по правилам
+    профиля. Рендера и JS нет - секунды это только сеть, не время браузера.
+    Сторонние домены полного профиля считаются запросами без байтов (фикстура их не хранит)
+    """
+    session = requests.Session()
+    session.trust_env = False  # Фикстура на 127.0.0.1 - мимо прокси из окружения
+
+    seconds = []
+    transferred = 0
+    requests_count = 0
+    blocked = 0
+    for _ in range(runs):
+        for url in page_urls:
+            start = time.time()
+            response = session.get(url, timeout=30)
+            page_bytes = len(response.content)
+            page_requests = 1
+
+            pending = _page_resources(response.text, url)
+            seen = set()
+            while pending:
+                resource = pending.pop(0)
+                if resource in seen:
+                    continue
+                seen.add(resource)
+                if not _allowed(resource, lean, allowed_domains):
+                    blocked += 1
+                    continue
+                page_requests += 1
+                if urlparse(resource).hostname != '127.0.0.1':
+                    continue
+                asset = session.get(resource, timeout=30)
+                page_bytes += len(asset.content)
+                if resource.split('?')[0].endswith('.css'):
+                    pending.extend(urljoin(resource, found) for found in _CSS_URL.findall(asset.text)
+                                   if not found.startswith('data:'))
+
+            seconds.append(time.time() - start)
+            transferred += page_bytes
+            requests_count += page_requests
+
+    loads = len(seconds)
+    return {
+        'seconds': sum(seconds) / loads,
+        'bytes': transferred / loads,
+        'requests': requests_count / loads,
+        'blocked': blocked / loads,
+    }
+
+# ============================================================================
+# ЗАПУСК
+# ============================================================================
+
+def main():
+    if '--record' in sys.argv:
+        record_fixture()
+        return
+    # --no-browser: трафик по правилам профилей без Chrome (время - только сеть)
+    no_browser = '--no-browser' in sys.argv
+
+    pages = sorted(name for name in os.listdir(FIXTURE_DIR) if re.match(r'page_\d+\.html$', name)) \
+        if os.path.isdir(FIXTURE_DIR) else []
+    if not pages:
+        print(f"✗ Нет фикстуры в {FIXTURE_DIR}")
+        print(f"  Запишите страницы каталога: python {os.path.basename(__file__)} --record")
+        print("  Нужны доступ к randewoo.ru и установленный Chrome")
+        sys.exit(1)
+
+    mode = 'без браузера, HTTP' if no_browser else 'Chrome'
+    print(f"=== Бенчмарк профиля браузера: полный vs экономный ({mode}) ===\n")
+
+    server = _serve_fixture()
+    base = f"http://127.0.0.1:{server.server_address[1]}/"
+    page_urls = [base + name for name in pages]
+    print(f"Фикстура: {len(pages)} страниц, {RUNS} загрузок каждой\n")
+
+    results = {}
+    try:
+        for label, lean in (('Полный', False), ('Экономный', True)):
+            measure = measure_http if no_browser else measure_profile
+            results[label] = measure(lean, page_urls)
+            r = results[label]
+            print(f"{label:10s} {r['seconds']:.2f}с на страницу, {r['bytes']/1024:.0f} КБ, "
+                  f"запросов {r['requests']:.0f}, заблокировано {r['blocked']:.0f}")
+    finally:
+        server.shutdown()
+
+    full = results['Полный']
+    lean = results['Экономный']
+    print(f"\nТрафик: x{full['bytes'] / max(lean['bytes'], 1):.1f} меньше")
+    print(f"Время:  x{full['seconds'] / max(lean['seconds'], 0.001):.1f} быстрее")
+
+if __name__ == '__main__':
+    main()
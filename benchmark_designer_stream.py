@@ -0,0 +1,109 @@
+import os
+import sys
+import io
+import json
+import time
+import tempfile
+import subprocess
+
+import html_extract
+from check_html_extract import load_pages
+
+try:
+    import resource
+except ImportError:
+    resource = None  # Windows: пиковый RSS недоступен, меряем только время
+
+# Фикс кодировки для Windows консоли
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+
+ROUNDS = 5  # Повторов разбора, берется лучшее время
+
+# Способ разбора -> функция (байты страницы) -> [(href, text)]
+METHODS = {
+    'baseline': lambda data: [],   # Только чтение страницы - точка отсчета памяти
+    'bs4': lambda data: html_extract.designer_links(data.decode('utf-8'), 'bs4'),
+    'lxml': lambda data: html_extract.designer_links(data.decode('utf-8'), 'lxml'),
+    'selectolax': lambda data: html_extract.designer_links(data.decode('utf-8'), 'selectolax'),
+    'stream': lambda data: html_extract.designer_links_stream(html_extract.iter_chunks(data)),
+}
+
+def _peak_rss_kb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS отдает байты, Linux - килобайты
+    return peak / 1024 if sys.platform == 'darwin' else peak
+
+def run_child(method, path):
+    """Один способ в отдельном процессе: пик RSS не смешивается с другими способами"""
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    best = None
+    links = None
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        links = METHODS[method](data)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    print(json.dumps({
+        'seconds': best,
+        'rss_kb': _peak_rss_kb() if resource else None,
+        'links': links
+    }, ensure_ascii=False))
+
+def main():
+    if len(sys.argv) == 4 and sys.argv[1] == '--child':
+        run_child(sys.argv[2], sys.argv[3])
+        return
+
+    print("=== Бенчмарк разбора страницы бренда: дерево vs поток ===\n")
+
+    pages = load_pages().get('designer') or []
+    if not pages:
+        print("✗ Нет сохраненных страниц брендов (см. check_html_extract.py)")
+        sys.exit(1)
+
+    name, html, _ = max(pages, key=lambda page: len(page[1]))
+    data = html.encode('utf-8')
+    print(f"Самая большая страница: {name} ({len(data)/1024:.0f} КБ)\n")
+
+    with tempfile.NamedTemporaryFile(suffix='.html', delete=False) as f:
+        f.write(data)
+        path = f.name
+
+    try:
+        results = {}
+        for method in METHODS:
+            if method in ('lxml', 'selectolax') and method not in html_extract.available_backends():
+                continue
+            output = subprocess.run([sys.executable, os.path.abspath(__file__), '--child', method, path],
+                                    capture_output=True, text=True, encoding='utf-8', check=True).stdout
+            results[method] = json.loads(output)
+    finally:
+        os.remove(path)
+
+    baseline = results.pop('baseline')
+    reference = results['bs4']
+
+    # Пик RSS процесса минус пик процесса, который только прочитал страницу
+    def extra_mb(result):
+        return max(0.0, result['rss_kb'] - baseline['rss_kb']) / 1024
+
+    print(f"{'Способ':12s} {'Время':>10s} {'Память сверх чтения':>20s}  Ссылок")
+    for method, result in results.items():
+        rss = f"{extra_mb(result):9.1f} МБ" if resource else '        н/д'
+        same = '✓' if result['links'] == reference['links'] else '✗ расходится с bs4'
+        print(f"{method:12s} {result['seconds']*1000:7.1f} мс {rss:>20s}  {len(result['links'])} {same}")
+
+    stream = results['stream']
+    print(f"\nПоток против bs4: x{reference['seconds'] / stream['seconds']:.1f} по времени", end='')
+    if resource:
+        print(f", {extra_mb(reference):.1f} → {extra_mb(stream):.1f} МБ памяти")
+    else:
+        print()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,131 @@
+import os
+import sys
+import io
+import time
+import random
+from rapidfuzz import fuzz
+from full_parsing_cycle import normalize_text
+from fuzzy_matcher import match_brand
+from text_normalize import normalize_lower
+
+# Фикс кодировки для Windows консоли
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+
+PERFUMES_COUNT = 2000
+PRODUCTS_COUNT = 200
+
+WORDS = [
+    'rose', 'noir', 'oud', 'bleu', 'intense', 'eau', 'de', 'parfum', 'toilette', 'blanc',
+    'musk', 'amber', 'vanilla', 'santal', 'cuir', 'iris', 'jasmin', 'tobacco', 'leather',
+    'night', 'gold', 'silver', 'velvet', 'orchid', 'black', 'white', 'l\'eau', 'homme',
+    'femme', 'sport', 'extreme', 'prive', 'absolu', 'fraiche', 'élixir', 'néroli', 'cologne'
+]
+
+def loop_match(name, perfume_links):
+    """Эталон: текущий построчный цикл из search_fragrantica"""
+    name_normalized = normalize_text(name)
+    name_lower = name.lower().strip()
+    result_url = None
+    best_match_score = 0
+
+    for perfume in perfume_links:
+        purl = perfume['url']
+        ptext = perfume['text']
+
+        ptext_normalized = normalize_text(ptext)
+        ptext_lower = ptext.lower().strip()
+
+        if name_normalized == ptext_normalized:
+            return purl
+
+        fuzzy_score = fuzz.token_sort_ratio(name_lower, ptext_lower)
+        partial_score = fuzz.partial_ratio(name_lower, ptext_lower)
+        token_set_score = fuzz.token_set_ratio(name_lower, ptext_lower)
+
+        max_fuzzy_score = max(fuzzy_score, partial_score, token_set_score)
+
+        if max_fuzzy_score > best_match_score and max_fuzzy_score >= 70:
+            result_url = purl
+            best_match_score = max_fuzzy_score
+
+        if len(name_normalized) > 5:
+            name_words = set(name_lower.split())
+            ptext_words = set(ptext_lower.split())
+            common_words = name_words & ptext_words
+
+            if len(name_words) > 0:
+                word_match_ratio = len(common_words) / len(name_words) * 100
+                if word_match_ratio > best_match_score and word_match_ratio >= 70:
+                    result_url = purl
+                    best_match_score = word_match_ratio
+
+    return result_url
+
+def make_synthetic_brand(rng):
+    """Синтетический бренд: ароматы и товары Randewoo с вариациями названий"""
+    perfume_links = []
+    for i in range(PERFUMES_COUNT):
+        words = rng.sample(WORDS, rng.randint(1, 4))
+        text = ' '.join(words).title()
+        if rng.random() < 0.3:
+            text += f" {rng.randint(1, 99)}"
+        # Как в индексе брендов: нормализованные формы хранятся рядом с названием
+        perfume_links.append({
+            'url': f"https://www.fragrantica.ru/perfume/Brand/{i}.html",
+            'text': text,
+            'text_normalized': normalize_text(text),
+            'text_lower': normalize_lower(text)
+        })
+
+    names = []
+    for _ in range(PRODUCTS_COUNT):
+        base = rng.choice(perfume_links)['text']
+        variant = rng.random()
+        if variant < 0.25:
+            name = base
+        elif variant < 0.5:
+            name = f"{base} {rng.choice(['50 мл', 'EDP', 'тестер', '100ml'])}"
+        elif variant < 0.75:
+            name = base.lower().replace('e', 'é', 1)
+        else:
+            name = ' '.join(rng.sample(WORDS, rng.randint(1, 3)))
+        names.append(name)
+
+    return names, perfume_links
+
+def main():
+    print("=== Бенчмарк сопоставления: цикл vs cdist ===\n")
+
+    rng = random.Random(42)
+    names, perfume_links = make_synthetic_brand(rng)
+    print(f"Бренд: {len(perfume_links)} ароматов, {len(names)} товаров")
+    print(f"Ядер CPU для cdist (workers=-1): {os.cpu_count()}\n")
+
+    start = time.perf_counter()
+    loop_results = [loop_match(name, perfume_links) for name in names]
+    loop_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch_results = match_brand(names, perfume_links, normalize_text)
+    batch_time = time.perf_counter() - start
+
+    mismatches = [(name, a, b) for name, a, b in zip(names, loop_results, batch_results) if a != b]
+    found = sum(1 for url in batch_results if url)
+
+    print(f"Цикл:  {loop_time:.2f}с ({loop_time/len(names)*1000:.1f} мс на товар)")
+    print(f"cdist: {batch_time:.2f}с ({batch_time/len(names)*1000:.1f} мс на товар)")
+    print(f"Ускорение: x{loop_time/batch_time:.1f}")
+    print(f"\nНайдено: {found}/{len(names)}")
+
+    if mismatches:
+        print(f"\n✗ Расхождений: {len(mismatches)}")
+        for name, a, b in mismatches[:10]:
+            print(f"  {name}: цикл={a} cdist={b}")
+        sys.exit(1)
+    else:
+        print("✓ Решения полностью совпадают")
+
+if __name__ == '__main__':
+    main()
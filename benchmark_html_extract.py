@@ -0,0 +1,52 @@
+import sys
+import io
+import time
+
+import html_extract
+from check_html_extract import PAGE_TYPES, load_pages
+
+# Фикс кодировки для Windows консоли
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+
+ROUNDS = 3  # Проходов по всем страницам, берется лучший
+
+def time_backend(page_type, type_pages, backend):
+    """Лучшее из ROUNDS время разбора одной страницы, мс"""
+    _, function = PAGE_TYPES[page_type]
+    extract = getattr(html_extract, function)
+    best = None
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        for _, html, _ in type_pages:
+            extract(html, backend)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best / len(type_pages) * 1000
+
+def main():
+    print("=== Бенчмарк парсеров HTML: время разбора страницы ===\n")
+
+    pages = load_pages()
+    if not any(pages.values()):
+        print("✗ Нет сохраненных страниц (см. check_html_extract.py)")
+        sys.exit(1)
+
+    backends = html_extract.available_backends()
+    print(f"{'Тип':10s} {'Страниц':>8s}  " + '  '.join(f"{backend:>12s}" for backend in backends))
+
+    for page_type, type_pages in pages.items():
+        if not type_pages:
+            continue
+        timings = {backend: time_backend(page_type, type_pages, backend) for backend in backends}
+        size_kb = sum(len(html) for _, html, _ in type_pages) / len(type_pages) / 1024
+        print(f"{page_type:10s} {len(type_pages):8d}  "
+              + '  '.join(f"{timings[backend]:9.2f} мс" for backend in backends)
+              + f"   (~{size_kb:.0f} КБ)")
+        baseline = timings['bs4']
+        fastest = min(timings, key=timings.get)
+        print(f"{'':10s} {'':8s}  быстрее всех: {fastest}, x{baseline / timings[fastest]:.1f} к bs4")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,354 @@
+import sqlite3
+import threading
+import time
+from urllib.parse import unquote, urljoin
+
+from fuzzy_matcher import match_brand
+import html_extract
+from http_cache import cached_get
+from text_normalize import normalize_lower, normalize_spaced
+
+# ============================================================================
+# НАСТРОЙКИ
+# ============================================================================
+
+DB_PATH = 'fragrantica_news.db'
+BRAND_REFRESH_DAYS = 7  # Как часто перечитывать страницу бренда
+MISSING_REFRESH_DAYS = 30  # Как долго помнить, что страницы бренда нет (404)
+
+INDEX_MATCH_THRESHOLD = 85   # Порог для поиска по токенам (строже: бренд не подтвержден URL)
+INDEX_MAX_CANDIDATES = 200   # Кандидатов на fuzzy-оценку после отбора по токенам
+COMMON_TOKEN_LIMIT = 5000    # Токены чаще этого ("eau", "de") для отбора не используются
+
+# ============================================================================
+# ТАБЛИЦЫ
+# ============================================================================
+
+_memory = {}   # brand_page_url -> список ароматов или None для 404 (в пределах процесса)
+_lock = threading.Lock()   # _memory, _url_locks и stats - из нескольких потоков
+_url_locks = {}  # brand_page_url -> Lock: один бренд грузит только один поток
+
+stats = {
+    'fetches': 0,   # Загрузок страниц брендов
+    'db_hits': 0,   # Бренд прочитан из таблицы без загрузки
+    'missing': 0,   # Запрос пропущен: у варианта URL уже известен 404
+    'index_matches': 0  # Найдено по токенному индексу без запросов
+}
+_tokens_checked = False  # Индекс токенов проверен на пропуски в этом процессе
+
+
+def _count(key):
+    with _lock:
+        stats[key] += 1
+
+
+def create_tables(conn):
+    """Создает таблицы индекса брендов Fragrantica"""
+    cursor = conn.cursor()
+
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS fragrantica_brands (
+            brand_page_url TEXT PRIMARY KEY,
+            status INTEGER NOT NULL,
+            perfumes_count INTEGER NOT NULL DEFAULT 0,
+            refreshed_at REAL NOT NULL
+        )
+    ''')
+
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS fragrantica_perfumes (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            brand_page_url TEXT NOT NULL,
+            position INTEGER NOT NULL,
+            url TEXT NOT NULL,
+            name TEXT NOT NULL,
+            name_normalized TEXT,
+            FOREIGN KEY (brand_page_url) REFERENCES fragrantica_brands(brand_page_url)
+        )
+    ''')
+
+    # Нормализованное название рядом с исходным (для таблиц старых версий)
+    try:
+        cursor.execute('ALTER TABLE fragrantica_perfumes ADD COLUMN name_normalized TEXT')
+    except sqlite3.OperationalError:
+        pass
+
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_fragrantica_perfumes_brand
+        ON fragrantica_perfumes(brand_page_url, position)
+    ''')
+
+    # Обратный индекс: токен нормализованного названия -> аромат
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS fragrantica_tokens (
+            token TEXT NOT NULL,
+            perfume_id INTEGER NOT NULL,
+            PRIMARY KEY (token, perfume_id)
+        ) WITHOUT ROWID
+    ''')
+
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_fragrantica_tokens_perfume
+        ON fragrantica_tokens(perfume_id)
+    ''')
+
+    conn.commit()
+
+
+def _connect():
+    conn = sqlite3.connect(DB_PATH, timeout=30)
+    create_tables(conn)
+    return conn
+
+# ============================================================================
+# СТРАНИЦА БРЕНДА
+# ============================================================================
+
+def _perfume(url, text, text_normalized=None):
+    """Аромат с заранее нормализованными формами названия для сопоставления"""
+    return {
+        'url': url,
+        'text': text,
+        'text_normalized': text_normalized if text_normalized is not None else normalize_spaced(text),
+        'text_lower': normalize_lower(text)
+    }
+
+
+def parse_designer_page(html):
+    """
+    Извлекает ссылки на ароматы со страницы бренда (в порядке на странице).
+    Дерево документа не строится: страницы брендов огромные, а нужны только ссылки.
+    html - уже загруженное тело: ответ целиком нужен HTTP-кешу, поэтому
+    страница в памяти есть, поток экономит только дерево и время разбора
+    """
+    if isinstance(html, str):
+        html = html.encode('utf-8')
+    return [_perfume(urljoin('https://www.fragrantica.ru', href), text)
+            for href, text in html_extract.designer_links_stream(html_extract.iter_chunks(html))]
+
+
+def _load(conn, brand_page_url, max_age):
+    """Читает бренд из таблицы; None - если записи нет или она устарела"""
+    row = conn.execute('''
+        SELECT status, refreshed_at FROM fragrantica_brands WHERE brand_page_url = ?
+    ''', (brand_page_url,)).fetchone()
+
+    if not row:
+        return None
+
+    status, refreshed_at = row
+    if status != 200:
+        max_age = MISSING_REFRESH_DAYS * 86400
+    if time.time() - refreshed_at >= max_age:
+        return None
+
+    if status != 200:
+        return {'status': status, 'perfumes': []}
+
+    rows = conn.execute('''
+        SELECT url, name, name_normalized FROM fragrantica_perfumes
+        WHERE brand_page_url = ?
+        ORDER BY position
+    ''', (brand_page_url,)).fetchall()
+
+    return {'status': status, 'perfumes': [_perfume(url, name, name_normalized)
+                                            for url, name, name_normalized in rows]}
+
+
+def _save(conn, brand_page_url, status, perfume_links):
+    conn.execute('''
+        DELETE FROM fragrantica_tokens WHERE perfume_id IN
+        (SELECT id FROM fragrantica_perfumes WHERE brand_page_url = ?)
+    ''', (brand_page_url,))
+    conn.execute('DELETE FROM fragrantica_perfumes WHERE brand_page_url = ?', (brand_page_url,))
+    conn.executemany('''
+        INSERT INTO fragrantica_perfumes (brand_page_url, position, url, name, name_normalized)
+        VALUES (?, ?, ?, ?, ?)
+    ''', [(brand_page_url, i, p['url'], p['text'], p['text_normalized'])
+          for i, p in enumerate(perfume_links)])
+    conn.execute('''
+        INSERT OR REPLACE INTO fragrantica_brands (brand_page_url, status, perfumes_count, refreshed_at)
+        VALUES (?, ?, ?, ?)
+    ''', (brand_page_url, status, len(perfume_links), time.time()))
+    _index_tokens(conn, brand_page_url)
+    conn.commit()
+
+
+def is_brand_fresh(brand_page_url, refresh_days=BRAND_REFRESH_DAYS):
+    """True, если бренд есть в индексе и не устарел"""
+    if brand_page_url in _memory:
+        return True
+    conn = _connect()
+    try:
+        return _load(conn, brand_page_url, refresh_days * 86400) is not None
+    finally:
+        conn.close()
+
+
+def get_brand_perfumes(brand_page_url, scraper=None, refresh_days=BRAND_REFRESH_DAYS):
+    """
+    Ароматы бренда из индекса. Страница бренда загружается
+    не чаще одного раза за окно обновления.
+    Возвращает список {'url', 'text', 'text_normalized', 'text_lower'} или None, если страницы бренда нет
+    """
+    with _lock:
+        if brand_page_url in _memory:
+            return _memory[brand_page_url]
+        url_lock = _url_locks.setdefault(brand_page_url, threading.Lock())
+
+    with url_lock:
+        # Пока ждали, бренд мог загрузить другой поток
+        with _lock:
+            if brand_page_url in _memory:
+                return _memory[brand_page_url]
+        return _get_brand_perfumes(brand_page_url, scraper, refresh_days)
+
+
+def _get_brand_perfumes(brand_page_url, scraper, refresh_days):
+    conn = _connect()
+    try:
+        entry = _load(conn, brand_page_url, refresh_days * 86400)
+
+        if entry is not None:
+            _count('db_hits' if entry['status'] == 200 else 'missing')
+        else:
+            _count('fetches')
+            response = cached_get(brand_page_url, scraper, timeout=30)
+            if response.status_code == 200:
+                perfume_links = parse_designer_page(response.content)
+            else:
+                perfume_links = []
+            # В таблицу попадают только окончательные ответы, 403/5xx - нет
+            if response.status_code in (200, 404):
+                _save(conn, brand_page_url, response.status_code, perfume_links)
+            entry = {'status': response.status_code, 'perfumes': perfume_links}
+    finally:
+        conn.close()
+
+    result = entry['perfumes'] if entry['status'] == 200 else None
+    # Запоминаются только окончательные 200 и 404: после 403/5xx (временная
+    # блокировка Cloudflare) бренд снова загружается при следующем обращении
+    if entry['status'] in (200, 404):
+        with _lock:
+            _memory[brand_page_url] = result
+    return result
+
+
+def resolve_brand(brand_page_urls, scraper=None, refresh_days=BRAND_REFRESH_DAYS):
+    """
+    Первая существующая страница бренда из вариантов URL.
+    Каждый вариант - не больше одного запроса: проверка существования
+    и разбор идут по одному ответу, варианты с известным 404 пропускаются.
+    Возвращает (brand_page_url, ароматы) или (None, None)
+    """
+    seen = set()
+    for brand_page_url in brand_page_urls:
+        if brand_page_url in seen:
+            continue
+        seen.add(brand_page_url)
+
+        try:
+            perfume_links = get_brand_perfumes(brand_page_url, scraper, refresh_days)
+        except Exception:
+            continue
+
+        if perfume_links is not None:
+            return brand_page_url, perfume_links
+
+    return None, None
+
+# ============================================================================
+# ТОКЕННЫЙ ИНДЕКС
+# ============================================================================
+
+def _brand_title(brand_page_url):
+    """Название бренда из URL страницы: .../designers/Dolce-Gabbana.html -> Dolce Gabbana"""
+    slug = brand_page_url.rstrip('/').rsplit('/', 1)[-1]
+    if slug.endswith('.html'):
+        slug = slug[:-5]
+    return unquote(slug).replace('-', ' ')
+
+
+def _index_tokens(conn, brand_page_url):
+    """Индексирует ароматы бренда: токены названия + токены бренда из URL"""
+    brand_tokens = set(normalize_spaced(_brand_title(brand_page_url)).split())
+    rows = conn.execute('''
+        SELECT id, name, name_normalized FROM fragrantica_perfumes WHERE brand_page_url = ?
+    ''', (brand_page_url,)).fetchall()
+
+    conn.executemany('INSERT OR IGNORE INTO fragrantica_tokens (token, perfume_id) VALUES (?, ?)', [
+        (token, perfume_id)
+        for perfume_id, name, name_normalized in rows
+        for token in brand_tokens | set((name_normalized or normalize_spaced(name)).split())
+    ])
+
+
+def _backfill_tokens(conn):
+    """Индексирует бренды, сохраненные до появления токенного индекса"""
+    global _tokens_checked
+    if _tokens_checked:
+        return
+    _tokens_checked = True
+
+    brands = conn.execute('''
+        SELECT DISTINCT p.brand_page_url FROM fragrantica_perfumes p
+        WHERE NOT EXISTS (SELECT 1 FROM fragrantica_tokens t WHERE t.perfume_id = p.id)
+    ''').fetchall()
+    for (brand_page_url,) in brands:
+        _index_tokens(conn, brand_page_url)
+    conn.commit()
+
+
+def find_in_index(brand, name, threshold=INDEX_MATCH_THRESHOLD, max_candidates=INDEX_MAX_CANDIDATES):
+    """
+    Ищет аромат среди всех когда-либо загруженных брендов без запросов в сеть:
+    отбор кандидатов по общим токенам "бренд + название", затем fuzzy-оценка.
+    Для товаров, у которых страница бренда не нашлась по slug.
+    Возвращает URL или None
+    """
+    query = f"{brand} {name}"
+    tokens = sorted(set(normalize_spaced(query).split()))
+    if not tokens:
+        return None
+
+    conn = _connect()
+    try:
+        _backfill_tokens(conn)
+
+        placeholders = ','.join('?' * len(tokens))
+        counts = dict(conn.execute(f'''
+            SELECT token, COUNT(*) FROM fragrantica_tokens
+            WHERE token IN ({placeholders}) GROUP BY token
+        ''', tokens).fetchall())
+
+        # Частые токены дают тысячи кандидатов и почти ничего не различают
+        selective = [t for t in tokens if 0 < counts.get(t, 0) <= COMMON_TOKEN_LIMIT]
+        if not selective:
+            selective = [t for t in tokens if counts.get(t)]
+        if not selective:
+            return None
+
+        placeholders = ','.join('?' * len(selective))
+        rows = conn.execute(f'''
+            SELECT p.url, p.name, p.brand_page_url, COUNT(*) AS overlap
+            FROM fragrantica_tokens t
+            JOIN fragrantica_perfumes p ON p.id = t.perfume_id
+            WHERE t.token IN ({placeholders})
+            GROUP BY p.id
+            ORDER BY overlap DESC, p.id
+            LIMIT ?
+        ''', selective + [max_candidates]).fetchall()
+    finally:
+        conn.close()
+
+    if not rows:
+        return None
+
+    # Сравниваем "бренд + название" с обеих сторон: одно лишь совпадение
+    # названия у чужого бренда не должно проходить порог
+    candidates = [_perfume(url, f"{_brand_title(brand_page_url)} {pname}")
+                  for url, pname, brand_page_url, _ in rows]
+    result = match_brand([query], candidates, threshold=threshold)[0]
+    if result:
+        _count('index_matches')
+    return result
@@ -0,0 +1,301 @@
+import queue
+import threading
+import time
+
+# ============================================================================
+# НАСТРОЙКИ
+# ============================================================================
+
+BROWSER_WORKERS = 2       # Одновременно открытых headless Chrome
+PAGES_PER_DRIVER = 30     # После стольких страниц драйвер перезапускается (утечки памяти Chrome)
+PAGE_TIMEOUT = 20         # Секунд ждать появления товаров на странице
+READY_SELECTOR = 'li.products__item'
+CHALLENGE_TITLE = 'Just a moment'   # Заголовок страницы проверки Cloudflare
+
+# Фиксированные паузы старого парсера - от них считаем сэкономленное время
+LEGACY_FIRST_PAGE_WAIT = 10
+LEGACY_PAGE_WAIT = 8
+
+# Экономный профиль: парсеру нужен только HTML списка товаров
+LEAN_PROFILE = True
+ALLOWED_DOMAINS = (       # Остальные домены (аналитика, CDN картинок, виджеты) не резолвятся
+    'randewoo.ru',
+    'challenges.cloudflare.com',  # Проверка Cloudflare
+)
+BLOCKED_RESOURCES = (     # Шаблоны Network.setBlockedURLs для разрешенных доменов
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.avif', '*.svg', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot',
+    '*.mp4', '*.webm', '*.mp3',
+    '*.css',
+)
+
+# ============================================================================
+# ДРАЙВЕР
+# ============================================================================
+
+def host_resolver_rules(allowed_domains):
+    """Правило Chrome: все хосты, кроме разрешенных (и их поддоменов), не резолвятся"""
+    rules = ['MAP * ~NOTFOUND']
+    for domain in allowed_domains:
+        rules.append(f'EXCLUDE {domain}')
+        rules.append(f'EXCLUDE *.{domain}')
+    return ' , '.join(rules)
+
+
+def create_driver(lean=LEAN_PROFILE, allowed_domains=ALLOWED_DOMAINS, blocked_resources=BLOCKED_RESOURCES,
+                  log_network=False):
+    """
+    Headless Chrome с настройками из full_parsing_cycle_selenium.py.
+    lean=True: без картинок, шрифтов, медиа, стилей и сторонних доменов.
+    log_network=True: события Network в performance-логе (для бенчмарка)
+    """
+    import undetected_chromedriver as uc
+
+    options = uc.ChromeOptions()
+    options.headless = True  # Без GUI
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument('--disable-gpu')
+    options.add_argument('--window-size=1920,1080')
+
+    if lean:
+        options.add_argument(f'--host-resolver-rules={host_resolver_rules(allowed_domains)}')
+        options.add_argument('--blink-settings=imagesEnabled=false')
+        options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2,
+            'profile.managed_default_content_settings.media_stream': 2,
+            'profile.default_content_setting_values.notifications': 2,
+        })
+    if log_network:
+        options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+
+    driver = uc.Chrome(options=options, version_main=None)
+
+    if lean and blocked_resources:
+        # То, что пришло бы с разрешенных доменов, режем через CDP
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': list(blocked_resources)})
+
+    return driver
+
+
+def wait_for_selector(driver, selector, timeout):
+    """
+    Ждет появления элемента вместо фиксированной паузы.
+    selector=None - ждет только окончания проверки Cloudflare и загрузки документа.
+    Возвращает True, если дождались за timeout
+    """
+    from selenium.common.exceptions import TimeoutException
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    if selector:
+        condition = EC.presence_of_element_located((By.CSS_SELECTOR, selector))
+    else:
+        def condition(d):
+            return (CHALLENGE_TITLE not in d.title
+                    and d.execute_script('return document.readyState') == 'complete')
+
+    try:
+        WebDriverWait(driver, timeout).until(condition)
+        return True
+    except TimeoutException:
+        return False
+
+# ============================================================================
+# ВОРКЕР
+# ============================================================================
+
+class BrowserWorker:
+    """
+    Один браузер: драйвер создается при первой странице, переиспользуется
+    для следующих и перезапускается каждые pages_per_driver страниц
+    """
+
+    def __init__(self, worker_id, pages_per_driver=PAGES_PER_DRIVER, driver_factory=create_driver,
+                 selector=READY_SELECTOR, timeout=PAGE_TIMEOUT):
+        self.worker_id = worker_id
+        self.pages_per_driver = pages_per_driver
+        self.driver_factory = driver_factory
+        self.selector = selector
+        self.timeout = timeout
+
+        self._driver = None
+        self._driver_pages = 0
+
+        self.pages = 0
+        self.cold_starts = 0
+        self.startup_time = 0.0
+        self.load_time = 0.0     # Сумма времени загрузки страниц (с ожиданием)
+        self.wait_saved = 0.0    # Насколько меньше фиксированных пауз
+        self.timeouts = 0
+
+        self.cookies = []        # Куки и User-Agent последней страницы (capture_session=True)
+        self.user_agent = None
+
+    def _get_driver(self):
+        if self._driver is None:
+            start = time.time()
+            self._driver = self.driver_factory()
+            self._driver_pages = 0
+            self.cold_starts += 1
+            self.startup_time += time.time() - start
+        return self._driver
+
+    def quit(self):
+        if self._driver is not None:
+            try:
+                self._driver.quit()
+            except Exception:
+                pass
+            self._driver = None
+
+    def load(self, url, legacy_wait=LEGACY_PAGE_WAIT, capture_session=False, selector=None):
+        """
+        Загружает страницу и ждет товары (или selector). Возвращает HTML.
+        capture_session=True: сохраняет куки и User-Agent в self.cookies / self.user_agent
+        """
+        driver = self._get_driver()
+        selector = selector or self.selector
+
+        start = time.time()
+        try:
+            driver.get(url)
+            loaded = time.time()
+            ready = wait_for_selector(driver, selector, self.timeout)
+            html = driver.page_source
+            if capture_session:
+                self.cookies = driver.get_cookies()
+                self.user_agent = driver.execute_script('return navigator.userAgent')
+        except Exception:
+            # Упавший драйвер не переиспользуем
+            self.quit()
+            raise
+
+        finished = time.time()
+        waited = finished - loaded
+        latency = finished - start
+
+        self.pages += 1
+        self.load_time += latency
+        self.wait_saved += max(0.0, legacy_wait - waited)
+        if not ready:
+            self.timeouts += 1
+
+        status = '' if ready else f", страница не готова за {self.timeout}с"
+        print(f"  [W{self.worker_id}] {latency:.1f}с (ожидание {waited:.1f}с, "
+              f"сэкономлено {max(0.0, legacy_wait - waited):.1f}с{status}) {url}", flush=True)
+
+        self._driver_pages += 1
+        if self._driver_pages >= self.pages_per_driver:
+            print(f"  [W{self.worker_id}] ♻ Перезапуск драйвера после {self._driver_pages} страниц", flush=True)
+            self.quit()
+
+        return html
+
+# ============================================================================
+# ПУЛ
+# ============================================================================
+
+_DONE = object()  # Маркер конца очереди страниц
+
+
+class DriverPool:
+    """
+    N браузеров, общая очередь страниц. Драйверы живут между вызовами
+    load_pages, так что холодный старт Chrome платится один раз на воркер
+    """
+
+    def __init__(self, size=BROWSER_WORKERS, pages_per_driver=PAGES_PER_DRIVER, driver_factory=create_driver,
+                 selector=READY_SELECTOR):
+        self.workers = [BrowserWorker(i + 1, pages_per_driver, driver_factory, selector) for i in range(size)]
+
+        # Свободные воркеры: страницы из load_pages и fetch не делят один браузер
+        self._idle = queue.Queue()
+        for worker in self.workers:
+            self._idle.put(worker)
+
+    def fetch(self, url, legacy_wait=LEGACY_PAGE_WAIT, selector=None):
+        """
+        Одна страница первым свободным браузером (потокобезопасно).
+        selector - чего ждать на этой странице (по умолчанию - селектор пула).
+        Возвращает (html, cookies, user_agent) - куки браузера для HTTP-сессии
+        """
+        worker = self._idle.get()
+        try:
+            html = worker.load(url, legacy_wait, capture_session=True, selector=selector)
+            return html, worker.cookies, worker.user_agent
+        finally:
+            self._idle.put(worker)
+
+    def load_pages(self, urls, legacy_wait=LEGACY_PAGE_WAIT):
+        """
+        Загружает страницы всеми воркерами.
+        Генератор (url, html или None при ошибке) в порядке готовности;
+        результаты отдаются в вызывающий поток, так что его соединение с БД
+        можно использовать как обычно
+        """
+        urls = list(urls)
+        if not urls:
+            return
+
+        pages = queue.Queue()
+        results = queue.Queue()
+        for url in urls:
+            pages.put(url)
+
+        active = min(len(urls), len(self.workers))
+        for _ in range(active):
+            pages.put(_DONE)
+
+        def run():
+            worker = self._idle.get()
+            try:
+                while True:
+                    url = pages.get()
+                    if url is _DONE:
+                        break
+                    try:
+                        results.put((url, worker.load(url, legacy_wait)))
+                    except Exception as e:
+                        print(f"  [W{worker.worker_id}] ✗ Ошибка загрузки {url}: {e}", flush=True)
+                        results.put((url, None))
+            finally:
+                self._idle.put(worker)
+
+        threads = [threading.Thread(target=run, daemon=True) for _ in range(active)]
+        for thread in threads:
+            thread.start()
+
+        for _ in urls:
+            yield results.get()
+
+        for thread in threads:
+            thread.join()
+
+    def close(self):
+        for worker in self.workers:
+            worker.quit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def print_stats(self):
+        """Задержка страниц и сэкономленное ожидание по воркерам"""
+        print(f"\n{'='*80}")
+        print("СТАТИСТИКА БРАУЗЕРОВ:")
+        for worker in self.workers:
+            if not worker.pages:
+                continue
+            print(f"  W{worker.worker_id}: {worker.pages} стр, "
+                  f"{worker.load_time / worker.pages:.1f}с на страницу, "
+                  f"запусков Chrome: {worker.cold_starts} ({worker.startup_time:.1f}с), "
+                  f"сэкономлено ожидания: {worker.wait_saved:.1f}с, "
+                  f"таймаутов: {worker.timeouts}")
+        total_saved = sum(worker.wait_saved for worker in self.workers)
+        print(f"  Всего сэкономлено на фиксированных паузах: {total_saved:.1f}с")
+        print(f"{'='*80}")
@@ -0,0 +1,201 @@
+import asyncio
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from urllib.parse import urlparse
+
+import html_extract
+from fetcher import get_scraper
+from http_cache import cached_get
+
+# ============================================================================
+# НАСТРОЙКИ
+# ============================================================================
+
+CATALOG_URL = 'https://randewoo.ru/category/parfyumeriya'
+
+DEFAULT_CONCURRENCY = 4   # Одновременных запросов к одному хосту
+DEFAULT_RATE = 1.0        # Запросов в секунду к одному хосту (token bucket)
+DEFAULT_BURST = 2         # Размер "всплеска" token bucket
+
+# ============================================================================
+# ОГРАНИЧЕНИЕ СКОРОСТИ
+# ============================================================================
+
+class TokenBucket:
+    """Асинхронный token bucket: не больше rate запросов в секунду, всплеск до burst"""
+
+    def __init__(self, rate, burst=1):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Ждет, пока в корзине появится токен, и забирает его"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class HostLimiter:
+    """Лимиты на хост: семафор конкурентности + token bucket"""
+
+    def __init__(self, concurrency=DEFAULT_CONCURRENCY, rate=DEFAULT_RATE, burst=DEFAULT_BURST):
+        self.concurrency = concurrency
+        self.rate = rate
+        self.burst = burst
+        self._hosts = {}
+
+    def for_host(self, host):
+        if host not in self._hosts:
+            self._hosts[host] = (asyncio.Semaphore(self.concurrency),
+                                 TokenBucket(self.rate, self.burst))
+        return self._hosts[host]
+
+# ============================================================================
+# ПАРСИНГ СТРАНИЦЫ КАТАЛОГА
+# ============================================================================
+
+def catalog_page_url(base_url, page):
+    """URL страницы каталога (первая страница - без параметра)"""
+    if page == 1:
+        return base_url
+    return f"{base_url}?page={page}"
+
+def parse_catalog_html(html):
+    """
+    Извлекает товары и число страниц из HTML страницы каталога
+    Возвращает (products, total_pages)
+    """
+    return html_extract.catalog_page(html)
+
+# ============================================================================
+# АСИНХРОННЫЙ ОБХОД
+# ============================================================================
+
+async def _fetch_page(scraper, limiter, executor, url):
+    """Загружает страницу в пуле потоков с учетом лимитов хоста"""
+    loop = asyncio.get_running_loop()
+    semaphore, bucket = limiter.for_host(urlparse(url).netloc)
+
+    async with semaphore:
+        await bucket.acquire()
+        response = await loop.run_in_executor(executor, partial(cached_get, url, scraper, 30))
+
+    response.raise_for_status()
+    response.encoding = 'utf-8'
+    return response.text
+
+async def _emit_page(executor, on_page, products):
+    """
+    Отдает товары страницы потребителю. on_page может блокироваться
+    (полная очередь) - тогда занят поток пула и обход притормаживает
+    """
+    if on_page and products:
+        await asyncio.get_running_loop().run_in_executor(executor, on_page, products)
+
+async def _crawl_page(scraper, limiter, executor, base_url, page, on_page=None):
+    url = catalog_page_url(base_url, page)
+    try:
+        html = await _fetch_page(scraper, limiter, executor, url)
+        products, _ = parse_catalog_html(html)
+        print(f"  Страница {page}: найдено товаров {len(products)}")
+    except Exception as e:
+        print(f"  ✗ Страница {page}: ошибка загрузки: {e}")
+        return page, []
+    await _emit_page(executor, on_page, products)
+    return page, products
+
+async def crawl_catalog_async(base_url=CATALOG_URL, max_products=None, scraper=None,
+                              concurrency=DEFAULT_CONCURRENCY, rate=DEFAULT_RATE, burst=DEFAULT_BURST,
+                              on_page=None):
+    """
+    Обходит каталог: первая страница дает число страниц,
+    остальные загружаются параллельно под лимитами хоста.
+    on_page(products) вызывается для каждой страницы сразу после разбора
+    (в порядке готовности, без обрезки по max_products).
+    Возвращает (products, stats), товары - в порядке страниц
+    """
+    if scraper is None:
+        scraper = get_scraper(base_url)
+
+    limiter = HostLimiter(concurrency, rate, burst)
+    start_time = time.time()
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        html = await _fetch_page(scraper, limiter, executor, catalog_page_url(base_url, 1))
+        first_products, total_pages = parse_catalog_html(html)
+        print(f"  Страница 1: найдено товаров {len(first_products)}, всего страниц: {total_pages}")
+        await _emit_page(executor, on_page, first_products)
+
+        last_page = total_pages
+        if max_products and first_products:
+            # Не качаем страницы, которые заведомо выйдут за лимит
+            needed = math.ceil(max(0, max_products - len(first_products)) / len(first_products))
+            last_page = min(total_pages, 1 + needed)
+
+        pages = {1: first_products}
+        if first_products and last_page > 1:
+            tasks = [_crawl_page(scraper, limiter, executor, base_url, page, on_page)
+                     for page in range(2, last_page + 1)]
+            for page, products in await asyncio.gather(*tasks):
+                pages[page] = products
+
+    all_products = []
+    for page in sorted(pages):
+        all_products.extend(pages[page])
+    if max_products:
+        all_products = all_products[:max_products]
+
+    elapsed = time.time() - start_time
+    stats = {
+        'pages': len(pages),
+        'products': len(all_products),
+        'elapsed': elapsed,
+        'pages_per_sec': len(pages) / elapsed if elapsed else 0,
+        'products_per_sec': len(all_products) / elapsed if elapsed else 0,
+        'concurrency': concurrency,
+        'rate': rate
+    }
+    return all_products, stats
+
+def crawl_catalog(base_url=CATALOG_URL, max_products=None, scraper=None,
+                  concurrency=DEFAULT_CONCURRENCY, rate=DEFAULT_RATE, burst=DEFAULT_BURST,
+                  on_page=None):
+    """Синхронная обертка над crawl_catalog_async"""
+    return asyncio.run(crawl_catalog_async(base_url, max_products, scraper, concurrency, rate, burst,
+                                           on_page))
+
+# ============================================================================
+# СОХРАНЕНИЕ И ОТЧЕТ
+# ============================================================================
+
+def save_products(conn, products):
+    """Сохраняет товары через INSERT OR IGNORE, возвращает число новых строк"""
+    before = conn.total_changes
+    conn.executemany('''
+        INSERT OR IGNORE INTO randewoo_products (brand, name, product_url)
+        VALUES (?, ?, ?)
+    ''', [(p['brand'], p['name'], p['product_url']) for p in products])
+    conn.commit()
+    return conn.total_changes - before
+
+def print_throughput_report(stats):
+    """Печатает пропускную способность обхода для подбора лимитов"""
+    print(f"\n{'='*80}")
+    print("ПРОПУСКНАЯ СПОСОБНОСТЬ:")
+    print(f"  Лимиты: {stats['concurrency']} потоков, {stats['rate']:.2f} запр/сек на хост")
+    print(f"  Страниц: {stats['pages']} за {stats['elapsed']:.1f}с ({stats['pages_per_sec']:.2f} стр/сек)")
+    print(f"  Товаров: {stats['products']} ({stats['products_per_sec']:.1f} товаров/сек)")
+    print(f"{'='*80}")
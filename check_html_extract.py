@@ -0,0 +1,144 @@
+import os
+import sys
+import io
+import json
+
+import html_extract
+from http_cache import saved_pages
+
+# Фикс кодировки для Windows консоли
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+
+# ============================================================================
+# НАСТРОЙКИ
+# ============================================================================
+
+FIXTURE_DIR = os.path.join('fixtures', 'html')   # fixtures/html/<тип>/*.html + эталон *.json (в репозитории)
+CACHE_PAGES_LIMIT = 200                          # Страниц каждого типа из HTTP-кеша
+STREAM_CHUNK_SIZES = (html_extract.STREAM_CHUNK_SIZE, 257)  # Мелкие куски режут теги и UTF-8 посередине
+
+# Тип страницы -> (класс URL в HTTP-кеше, функция разбора)
+PAGE_TYPES = {
+    'catalog': ('catalog', 'catalog_page'),
+    'designer': ('designer', 'designer_links'),
+    'perfume': ('perfume', 'news_blocks'),
+    'news': ('news', 'news_card'),
+}
+
+# Потоковые варианты разбора, которые сверяются с тем же эталоном
+STREAM_FUNCTIONS = {
+    'designer': 'designer_links_stream',
+}
+
+# ============================================================================
+# СТРАНИЦЫ
+# ============================================================================
+
+def load_pages(cache_limit=CACHE_PAGES_LIMIT):
+    """
+    Сохраненные страницы по типам: файлы из FIXTURE_DIR и ответы из HTTP-кеша.
+    Возвращает {тип: [(название, html, путь к эталону или None)]}
+    """
+    pages = {page_type: [] for page_type in PAGE_TYPES}
+
+    for page_type in PAGE_TYPES:
+        directory = os.path.join(FIXTURE_DIR, page_type)
+        if os.path.isdir(directory):
+            for name in sorted(os.listdir(directory)):
+                if not name.endswith('.html'):
+                    continue
+                path = os.path.join(directory, name)
+                with open(path, 'r', encoding='utf-8') as f:
+                    pages[page_type].append((path, f.read(), path[:-len('.html')] + '.json'))
+
+        url_class, _ = PAGE_TYPES[page_type]
+        for url, html in saved_pages(url_class, cache_limit):
+            pages[page_type].append((url, html, None))
+
+    return pages
+
+def extract(page_type, html, backend):
+    """Результат разбора в виде JSON-значения (кортежи → списки), как в эталоне"""
+    _, function = PAGE_TYPES[page_type]
+    return json.loads(json.dumps(getattr(html_extract, function)(html, backend), ensure_ascii=False))
+
+def extract_stream(page_type, html, chunk_size=html_extract.STREAM_CHUNK_SIZE):
+    """Потоковый разбор: страница подается кусками байтов по chunk_size"""
+    function = getattr(html_extract, STREAM_FUNCTIONS[page_type])
+    result = function(html_extract.iter_chunks(html.encode('utf-8'), chunk_size))
+    return json.loads(json.dumps(result, ensure_ascii=False))
+
+# ============================================================================
+# ПРОВЕРКА
+# ============================================================================
+
+def main():
+    # --update - переписать эталоны выводом bs4 (только после ручной проверки разницы)
+    update = '--update' in sys.argv
+
+    print("=== Проверка парсеров HTML по сохраненным страницам ===\n")
+    backends = html_extract.available_backends()
+    print(f"Парсеры: {', '.join(backends)} (эталон: bs4)\n")
+
+    pages = load_pages()
+    if not any(pages.values()):
+        print(f"✗ Нет сохраненных страниц: ни в {FIXTURE_DIR}, ни в HTTP-кеше")
+        print("  Запустите парсинг (страницы попадут в кеш) или положите HTML в fixtures/html/<тип>/")
+        sys.exit(1)
+
+    failures = 0
+    for page_type, type_pages in pages.items():
+        if not type_pages:
+            continue
+
+        mismatches = {backend: 0 for backend in backends}
+        if page_type in STREAM_FUNCTIONS:
+            mismatches['stream'] = 0
+        for name, html, golden_path in type_pages:
+            expected = extract(page_type, html, 'bs4')
+
+            if golden_path:
+                if update:
+                    with open(golden_path, 'w', encoding='utf-8') as f:
+                        json.dump(expected, f, ensure_ascii=False, indent=2)
+                        f.write('\n')
+                elif not os.path.exists(golden_path):
+                    # Без эталона страница ничего не доказывает - это ошибка, а не молчаливая запись
+                    mismatches['bs4'] += 1
+                    print(f"  ✗ Нет эталона {golden_path} (создать: --update)")
+                else:
+                    with open(golden_path, 'r', encoding='utf-8') as f:
+                        golden = json.load(f)
+                    if golden != expected:
+                        mismatches['bs4'] += 1
+                        print(f"  ✗ bs4 расходится с эталоном: {name}")
+                    expected = golden
+
+            for backend in backends:
+                if backend == 'bs4':
+                    continue
+                result = extract(page_type, html, backend)
+                if result != expected:
+                    mismatches[backend] += 1
+                    print(f"  ✗ {backend}: {name}")
+
+            if page_type in STREAM_FUNCTIONS:
+                for chunk_size in STREAM_CHUNK_SIZES:
+                    if extract_stream(page_type, html, chunk_size) != expected:
+                        mismatches['stream'] += 1
+                        print(f"  ✗ stream ({chunk_size} байт): {name}")
+
+        summary = ', '.join(f"{backend} {'✓' if not count else f'✗ {count}'}"
+                            for backend, count in mismatches.items())
+        print(f"{page_type:10s} {len(type_pages):4d} стр: {summary}")
+        failures += sum(mismatches.values())
+
+    if failures:
+        print(f"\n✗ Расхождений: {failures}")
+        sys.exit(1)
+    print("\n✓ Все парсеры дают одинаковый результат")
+
+if __name__ == '__main__':
+    main()
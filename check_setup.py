@@ -56,13 +56,13 @@ def check_database():
         print("  ⚠ Новостей нет. Запустите: python parse_fragrantica_news.py")
     
     # Проверяем наличие полного текста
-    cursor.execute("SELECT COUNT(*) FROM news WHERE news_full IS NOT NULL")
+    cursor.execute("SELECT COUNT(*) FROM news WHERE news_full IS NOT NULL AND news_full != ''")
     full_count = cursor.fetchone()[0]
     print(f"✓ С полным текстом: {full_count}/{count}")
     
     if full_count < count:
         print("  ⚠ Не у всех новостей есть полный текст")
-        print("    Запустите: python parse_full_news.py")
+        print("    Запустите: python harvest_articles.py")
     
     # Проверяем наличие переписанных
     cursor.execute("SELECT COUNT(*) FROM news WHERE news_rewritten IS NOT NULL")
@@ -76,7 +76,7 @@ def check_database():
     
     if images_count < count:
         print("  ⚠ Не у всех новостей есть изображения")
-        print("    Запустите: python parse_images.py")
+        print("    Запустите: python harvest_articles.py")
     
     # Проверяем папку images
     if os.path.exists('images'):
@@ -143,7 +143,8 @@ def check_dependencies():
         ('requests', 'requests'),
         ('beautifulsoup4', 'bs4'),
         ('cloudscraper', 'cloudscraper'),
-        ('openai', 'openai')
+        ('openai', 'openai'),
+        ('Pillow', 'PIL')
     ]
     
     all_installed = True
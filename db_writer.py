@@ -0,0 +1,138 @@
+import atexit
+import sqlite3
+import threading
+
+# ============================================================================
+# НАСТРОЙКИ
+# ============================================================================
+
+DB_PATH = 'fragrantica_news.db'
+FLUSH_SIZE = 200       # Строк в буфере, после которых запись идет сразу
+FLUSH_INTERVAL = 2.0   # Секунд между фоновыми сбросами (столько максимум теряется при падении)
+
+# Ошибки блокировки: пачка откладывается до следующего сброса, остальные OperationalError
+# (нет колонки, нет таблицы) повтором не лечатся
+BUSY_MESSAGES = ('database is locked', 'database table is locked', 'database is busy')
+
+# ============================================================================
+# WAL
+# ============================================================================
+
+def enable_wal(conn):
+    """
+    Переводит БД в режим WAL: веб-приложение читает, пока парсер пишет.
+    Режим сохраняется в файле БД; synchronous=NORMAL в WAL не теряет
+    закоммиченные транзакции при падении процесса
+    """
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+
+def is_busy(error):
+    """True, если OperationalError - временная блокировка БД другим процессом"""
+    message = str(error).lower()
+    return any(busy in message for busy in BUSY_MESSAGES)
+
+# ============================================================================
+# БУФЕР ОТЛОЖЕННОЙ ЗАПИСИ
+# ============================================================================
+
+class WriteBuffer:
+    """
+    Копит UPDATE/INSERT этапа и пишет их пачками через executemany
+    в одной транзакции: по размеру буфера, по таймеру и при закрытии.
+    Порядок операций сохраняется
+    """
+
+    def __init__(self, db_path=DB_PATH, flush_size=FLUSH_SIZE, flush_interval=FLUSH_INTERVAL):
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+
+        self._conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        enable_wal(self._conn)
+
+        self._pending = []                     # [(sql, params)] в порядке добавления
+        self._lock = threading.Lock()          # Защищает _pending
+        self._flush_lock = threading.Lock()    # Один сброс за раз - порядок пачек сохраняется
+        self._stop = threading.Event()
+        self._closed = False
+
+        self.rows = 0           # Записано строк
+        self.transactions = 0   # Транзакций (сбросов)
+
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def add(self, sql, params):
+        """Добавляет операцию в буфер; при заполнении буфера сразу пишет"""
+        with self._lock:
+            self._pending.append((sql, params))
+            full = len(self._pending) >= self.flush_size
+
+        if full:
+            self.flush()
+
+    def flush(self):
+        """Пишет все накопленное одной транзакцией"""
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, []
+            if not pending:
+                return
+
+            try:
+                with self._conn:
+                    # Подряд идущие одинаковые запросы - одним executemany
+                    start = 0
+                    for end in range(1, len(pending) + 1):
+                        if end == len(pending) or pending[end][0] != pending[start][0]:
+                            self._conn.executemany(pending[start][0],
+                                                   [params for _, params in pending[start:end]])
+                            start = end
+            except sqlite3.Error as e:
+                if isinstance(e, sqlite3.OperationalError) and is_busy(e):
+                    # БД занята - возвращаем пачку в начало буфера, повторим при следующем сбросе
+                    with self._lock:
+                        self._pending[:0] = pending
+                    print(f"  ⚠ БД занята ({len(pending)} строк отложено): {e}")
+                    return
+                # Ошибка в данных или схеме - пишем по одной, пропуская только проблемные строки
+                print(f"  ⚠ Пачка из {len(pending)} строк не записана ({e}), пишу по одной")
+                self._write_one_by_one(pending)
+                return
+
+            self.rows += len(pending)
+            self.transactions += 1
+
+    def _write_one_by_one(self, pending):
+        with self._conn:
+            for sql, params in pending:
+                try:
+                    self._conn.execute(sql, params)
+                    self.rows += 1
+                except sqlite3.Error as e:
+                    print(f"  ⚠ Строка пропущена: {e}: {' '.join(sql.split())[:80]} {params}")
+        self.transactions += 1
+
+    def _run(self):
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+
+    def close(self):
+        """Останавливает фоновый сброс и пишет остаток"""
+        if self._closed:
+            return
+        self._closed = True
+        self._stop.set()
+        self._thread.join()
+        self.flush()
+        if self._pending:
+            print(f"  ✗ БД занята, не записано строк: {len(self._pending)}")
+        self._conn.close()
+        atexit.unregister(self.close)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
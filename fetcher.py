@@ -0,0 +1,279 @@
+import atexit
+import json
+import os
+import threading
+import time
+from urllib.parse import urlparse
+
+import cloudscraper
+from cloudscraper import CipherSuiteAdapter
+
+# ============================================================================
+# НАСТРОЙКИ
+# ============================================================================
+
+BROWSER = {
+    'browser': 'chrome',
+    'platform': 'windows',
+    'mobile': False
+}
+
+POOL_SIZE = 8                      # Keep-alive соединений на хост
+COOKIES_FILE = 'http_cookies.json' # Куки и User-Agent между запусками
+
+# ============================================================================
+# ВЕЖЛИВОСТЬ: ПАУЗЫ ТОЛЬКО МЕЖДУ РЕАЛЬНЫМИ ЗАПРОСАМИ
+# ============================================================================
+
+class PolitenessScheduler:
+    """
+    Минимальный интервал между запросами к одному хосту.
+    Вызывается только перед реальным сетевым запросом, поэтому ответы
+    из кеша и индексов пауз не добавляют
+    """
+
+    def __init__(self):
+        self._intervals = {}   # host -> секунд между запросами
+        self._next_slot = {}   # host -> время (monotonic), раньше которого нельзя
+        self._lock = threading.Lock()
+        self.waits = 0
+        self.slept = 0.0
+
+    def set_interval(self, url, seconds):
+        with self._lock:
+            self._intervals[_host_of(url)] = seconds
+
+    def wait(self, url):
+        """Ждет своей очереди к хосту (потокобезопасно: слоты резервируются)"""
+        host = _host_of(url)
+        with self._lock:
+            interval = self._intervals.get(host)
+            if not interval:
+                return
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, 0.0))
+            self._next_slot[host] = slot + interval
+            delay = slot - now
+            if delay > 0:
+                self.waits += 1
+                self.slept += delay
+
+        if delay > 0:
+            time.sleep(delay)
+
+
+politeness = PolitenessScheduler()
+
+
+def set_min_interval(url, seconds):
+    """Пауза не меньше seconds между реальными запросами к хосту из url"""
+    politeness.set_interval(url, seconds)
+
+# ============================================================================
+# ОБЩИЕ СЕССИИ
+# ============================================================================
+
+_sessions = {}   # (host, proxy) -> scraper
+_stats = {}      # host -> статистика запросов
+_lock = threading.Lock()
+
+
+def _host_of(url):
+    return urlparse(url).netloc or url
+
+
+def _load_saved_cookies(host):
+    if not os.path.exists(COOKIES_FILE):
+        return None
+    try:
+        with open(COOKIES_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f).get(host)
+    except (OSError, ValueError):
+        return None
+
+
+def _new_host_stats():
+    return {
+        'sessions': 0,
+        'requests': 0,
+        'cold_time': 0.0,
+        'cold_requests': 0,
+        'warm_time': 0.0,
+        'warm_requests': 0
+    }
+
+
+class PooledScraper(cloudscraper.CloudScraper):
+    """CloudScraper, который учитывает холодные и теплые запросы по хостам"""
+
+    def perform_request(self, method, url, *args, **kwargs):
+        host = _host_of(url)
+        politeness.wait(url)
+        connections_before, _ = _connection_counts(self)
+        start = time.perf_counter()
+        try:
+            return super().perform_request(method, url, *args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            connections_after, _ = _connection_counts(self)
+
+            with _lock:
+                stats = _stats.setdefault(host, _new_host_stats())
+                stats['requests'] += 1
+                if connections_after > connections_before:
+                    stats['cold_time'] += elapsed
+                    stats['cold_requests'] += 1
+                else:
+                    stats['warm_time'] += elapsed
+                    stats['warm_requests'] += 1
+
+
+def _create_scraper(host, proxy):
+    """Создает долгоживущий scraper с пулом keep-alive соединений"""
+    scraper = PooledScraper.create_scraper(browser=BROWSER)
+
+    # Перемонтируем адаптер с тем же TLS-контекстом, но с большим пулом
+    adapter = scraper.adapters['https://']
+    scraper.mount('https://', CipherSuiteAdapter(
+        ssl_context=adapter.ssl_context,
+        source_address=adapter.source_address,
+        pool_connections=POOL_SIZE,
+        pool_maxsize=POOL_SIZE
+    ))
+
+    if proxy:
+        scraper.proxies = {'http': proxy, 'https': proxy}
+
+    # Восстанавливаем куки (cf_clearance привязан к User-Agent)
+    saved = _load_saved_cookies(host)
+    if saved:
+        scraper.headers['User-Agent'] = saved['user_agent']
+        for cookie in saved['cookies']:
+            scraper.cookies.set(cookie['name'], cookie['value'],
+                                domain=cookie['domain'], path=cookie['path'])
+
+    return scraper
+
+
+def get_scraper(url, proxy=None):
+    """
+    Возвращает общий scraper для хоста из url.
+    Повторные вызовы получают тот же объект: Cloudflare challenge
+    и TLS-рукопожатие проходятся один раз на хост.
+    """
+    host = _host_of(url)
+    key = (host, proxy)
+
+    with _lock:
+        scraper = _sessions.get(key)
+        if scraper is None:
+            scraper = _create_scraper(host, proxy)
+            _sessions[key] = scraper
+            _stats.setdefault(host, _new_host_stats())['sessions'] += 1
+
+    return scraper
+
+
+def _connection_counts(scraper):
+    """Суммарные (соединений открыто, запросов выполнено) по пулам urllib3"""
+    managers = []
+    for adapter in scraper.adapters.values():
+        managers.append(adapter.poolmanager)
+        managers.extend(adapter.proxy_manager.values())
+
+    connections = 0
+    requests_done = 0
+    for manager in managers:
+        if manager is None:
+            continue
+        for pool_key in list(manager.pools.keys()):
+            pool = manager.pools.get(pool_key)
+            if pool is None:
+                continue
+            connections += pool.num_connections
+            requests_done += pool.num_requests
+    return connections, requests_done
+
+
+def fetch(url, proxy=None, **kwargs):
+    """GET через общий scraper хоста"""
+    kwargs.setdefault('timeout', 30)
+    return get_scraper(url, proxy).get(url, **kwargs)
+
+# ============================================================================
+# КУКИ И СТАТИСТИКА
+# ============================================================================
+
+def save_cookies():
+    """Сохраняет куки и User-Agent всех сессий для следующего запуска"""
+    with _lock:
+        sessions = list(_sessions.items())
+    if not sessions:
+        return
+
+    data = {}
+    if os.path.exists(COOKIES_FILE):
+        try:
+            with open(COOKIES_FILE, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = {}
+
+    for (host, _), scraper in sessions:
+        data[host] = {
+            'user_agent': scraper.headers.get('User-Agent'),
+            'cookies': [
+                {'name': c.name, 'value': c.value, 'domain': c.domain, 'path': c.path}
+                for c in scraper.cookies
+            ]
+        }
+
+    with open(COOKIES_FILE, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def get_stats():
+    """Статистика по хостам: запросы, переиспользование соединений, экономия"""
+    with _lock:
+        sessions = list(_sessions.items())
+        stats = {host: dict(values) for host, values in _stats.items()}
+
+    for host in stats:
+        stats[host]['connections'] = 0
+        stats[host]['pool_requests'] = 0
+    for (host, _), scraper in sessions:
+        connections, requests_done = _connection_counts(scraper)
+        stats[host]['connections'] += connections
+        stats[host]['pool_requests'] += requests_done
+
+    for values in stats.values():
+        values['reused'] = max(0, values['pool_requests'] - values['connections'])
+        avg_cold = values['cold_time'] / values['cold_requests'] if values['cold_requests'] else 0
+        avg_warm = values['warm_time'] / values['warm_requests'] if values['warm_requests'] else 0
+        # Оценка стоимости рукопожатия: холодный запрос минус теплый
+        values['handshake_avg'] = max(0.0, avg_cold - avg_warm) if values['warm_requests'] else 0.0
+        values['time_saved'] = values['handshake_avg'] * values['reused']
+
+    return stats
+
+
+def print_stats():
+    """Печатает отчет о переиспользовании соединений"""
+    stats = get_stats()
+    if not stats:
+        return
+
+    print(f"\n{'='*80}")
+    print("HTTP СОЕДИНЕНИЯ:")
+    for host, values in stats.items():
+        print(f"  {host}:")
+        print(f"    Сессий: {values['sessions']}, запросов: {values['requests']}")
+        print(f"    Соединений открыто: {values['connections']}, переиспользовано: {values['reused']}")
+        print(f"    Среднее рукопожатие: {values['handshake_avg']*1000:.0f} мс, "
+              f"сэкономлено ~{values['time_saved']:.1f}с")
+    if politeness.waits:
+        print(f"  Пауз вежливости: {politeness.waits} ({politeness.slept:.1f}с)")
+    print(f"{'='*80}")
+
+
+atexit.register(save_cookies)
@@ -0,0 +1,1994 @@
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+function t(e){return e&&e.__esModule?e:{default:e}}
+function t(e){return e&&e.__esModule?e:{default:e}}
+var n=document.querySelectorAll(".products__item");
+function t(e){return e&&e.__esModule?e:{default:e}}
+window.dataLayer=window.dataLayer||[];dataLayer.push({event:"impression"});
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+for(var i=0;i<n.length;i++){n[i].classList.add("is-ready")}
+function t(e){return e&&e.__esModule?e:{default:e}}
@@ -1,14 +1,28 @@
 import sqlite3
-import cloudscraper
-from bs4 import BeautifulSoup
 from urllib.parse import urljoin
 import sys
 import io
+import os
+import queue
+import threading
 import time
-import unicodedata
-import re
-from rapidfuzz import fuzz
-from datetime import datetime
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from fuzzy_matcher import match_brand
+from text_normalize import normalize_spaced as normalize_text
+from fetcher import get_scraper, print_stats, set_min_interval
+import html_extract
+import news_dates
+import http_cache
+import hybrid_fetch
+from hybrid_fetch import get_hybrid_scraper
+from http_cache import cached_get
+import brand_index
+import pipeline_state
+import perfume_entities
+from brand_index import find_in_index, get_brand_perfumes
+from db_writer import WriteBuffer
+from catalog_crawler import crawl_catalog, save_products, print_throughput_report
+from news_dates import news_in_window, describe_window, parse_window_date
 
 # Фикс кодировки для Windows консоли
 if sys.platform == 'win32':
@@ -20,7 +34,29 @@ if sys.platform == 'win32':
 # ============================================================================
 
 MAX_PRODUCTS = 1000  # Максимальное количество товаров для парсинга
+STALE_DAYS = 7  # Инкрементальный режим: перепроверять товары и новости старше N дней
 CATALOG_URL = 'https://randewoo.ru/category/parfyumeriya'
+CATALOG_CONCURRENCY = 4  # Параллельных загрузок страниц каталога
+CATALOG_RATE = 1.0  # Запросов в секунду к randewoo.ru
+FRAGRANTICA_INTERVAL = 0.5  # Секунд между реальными запросами к fragrantica.ru
+MATCH_PROCESSES = os.cpu_count() or 1  # Процессов для сопоставления товаров с ароматами
+HYBRID_FETCH = True  # Браузер только для страниц с проверкой Cloudflare или без товаров
+NEWS_WINDOW = (news_dates.NEWS_SINCE, news_dates.NEWS_UNTIL)  # Новости за [since, until)
+
+# Потоковый режим: конкурентность этапов и размер очередей между ними
+MATCH_WORKERS = 2   # Потоков поиска на Fragrantica
+NEWS_WORKERS = 2    # Потоков парсинга новостей (и в последовательном режиме)
+QUEUE_SIZE = 100    # Товаров в очереди между этапами (backpressure)
+
+# ============================================================================
+# HTTP-СЕССИИ
+# ============================================================================
+
+def open_scraper(url):
+    """Общая HTTP-сессия хоста; в гибридном режиме - с запасным браузером"""
+    if HYBRID_FETCH:
+        return get_hybrid_scraper(url)
+    return get_scraper(url)
 
 # ============================================================================
 # ШАГ 1: ОЧИСТКА БД
@@ -47,6 +83,10 @@ def clear_database():
     cursor.execute('DELETE FROM randewoo_products')
     print(f"✓ Удалено {products_count} записей из randewoo_products")
     
+    # Ароматы строятся заново из товаров нового каталога
+    perfume_entities.create_tables(conn)
+    cursor.execute('DELETE FROM perfume_entities')
+    
     conn.commit()
     conn.close()
     
@@ -62,444 +102,747 @@ def parse_randewoo_catalog(max_products=1000):
     print(f"ШАГ 2: ПАРСИНГ RANDEWOO (лимит: {max_products} товаров)")
     print("="*80 + "\n")
     
-    conn = sqlite3.connect('fragrantica_news.db')
-    cursor = conn.cursor()
-    
-    scraper = cloudscraper.create_scraper(
-        browser={
-            'browser': 'chrome',
-            'platform': 'windows',
-            'mobile': False
-        }
-    )
+    print(f"URL: {CATALOG_URL}\n")
     
-    all_products = []
-    page = 1
+    try:
+        products, stats = crawl_catalog(
+            CATALOG_URL,
+            max_products=max_products,
+            scraper=open_scraper(CATALOG_URL),
+            concurrency=CATALOG_CONCURRENCY,
+            rate=CATALOG_RATE
+        )
+    except Exception as e:
+        print(f"  ✗ Ошибка загрузки каталога: {e}")
+        import traceback
+        traceback.print_exc()
+        return 0
     
-    print(f"URL: {CATALOG_URL}\n")
+    if not products:
+        print("  ⚠ Нет товаров в каталоге")
+        return 0
     
-    while len(all_products) < max_products:
-        # ВАЖНО: правильный формат URL для пагинации
-        if page == 1:
-            page_url = CATALOG_URL
-        else:
-            page_url = f"{CATALOG_URL}?page={page}"
-        
-        print(f"Страница {page}: {page_url}")
-        
-        try:
-            time.sleep(3)  # Увеличиваем задержку
-            response = scraper.get(page_url, timeout=30)
-            response.raise_for_status()
-            response.encoding = 'utf-8'
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            products = soup.find_all('li', class_='products__item')
-            
-            if not products:
-                print(f"  ⚠ Нет товаров на странице {page}")
-                # Проверим статус ответа
-                print(f"  Status: {response.status_code}")
-                print(f"  Response length: {len(response.text)}")
-                if page == 1:
-                    print(f"  Первые 500 символов: {response.text[:500]}")
-                break
-            
-            print(f"  Найдено товаров: {len(products)}")
-            
-            for product in products:
-                if len(all_products) >= max_products:
-                    break
-                
-                try:
-                    brand_div = product.find('div', class_='b-catalogItem__brand')
-                    name_div = product.find('div', class_='b-catalogItem__name')
-                    link = product.find('a', class_='b-catalogItem__descriptionLink')
-                    
-                    if brand_div and name_div and link:
-                        brand = brand_div.get_text(strip=True)
-                        name = name_div.get_text(strip=True)
-                        product_url = urljoin('https://randewoo.ru', link['href'])
-                        
-                        # Сохраняем в БД сразу
-                        cursor.execute('''
-                            INSERT OR IGNORE INTO randewoo_products (brand, name, product_url)
-                            VALUES (?, ?, ?)
-                        ''', (brand, name, product_url))
-                        
-                        all_products.append({'brand': brand, 'name': name, 'url': product_url})
-                        
-                except Exception as e:
-                    print(f"  ⚠ Ошибка парсинга товара: {e}")
-            
-            conn.commit()
-            print(f"  Всего собрано: {len(all_products)}/{max_products}")
-            
-            if len(all_products) >= max_products:
-                print(f"\n✓ Достигнут лимит в {max_products} товаров")
-                break
-            
-            # Проверяем наличие следующей страницы
-            pagination = soup.find('ol', class_='pager')
-            if pagination:
-                next_link = pagination.find('a', class_='pager__link--forward', attrs={'data-role': 'pagination-next-page'})
-                if not next_link:
-                    print(f"\n✓ Больше нет страниц")
-                    break
-            else:
-                print(f"\n⚠ Пагинация не найдена")
-                break
-            
-            page += 1
-            
-        except Exception as e:
-            print(f"  ✗ Ошибка загрузки страницы: {e}")
-            import traceback
-            traceback.print_exc()
-            break
+    conn = sqlite3.connect('fragrantica_news.db')
+    added = save_products(conn, products)
+    # Отметка "видели в каталоге": по ней видно, какие товары пропали с сайта
+    conn.executemany('UPDATE randewoo_products SET last_seen_at = CURRENT_TIMESTAMP WHERE product_url = ?',
+                     [(p['product_url'],) for p in products])
+    conn.commit()
     
+    # Объемы, тестеры и наборы одного аромата - одна группа: поиск и новости на группу
+    perfume_entities.create_tables(conn)
+    perfume_entities.assign_entities(conn)
+    grouping = perfume_entities.get_stats(conn)
     conn.close()
-    print(f"\n✓ Парсинг завершен: {len(all_products)} товаров")
-    return len(all_products)
+    
+    print(f"\n✓ Парсинг завершен: {len(products)} товаров (новых: {added}, уже известных: {len(products) - added})")
+    print(f"  Ароматов: {grouping['entities']} (в среднем {grouping['duplicate_factor']:.2f} товара на аромат)")
+    print_throughput_report(stats)
+    return len(products)
 
 # ============================================================================
 # ШАГ 3: ПОИСК НА FRAGRANTICA
 # ============================================================================
 
-def normalize_text(text):
-    """Нормализует текст для сравнения"""
-    text = text.lower()
-    text = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('utf-8')
-    text = re.sub(r'[^a-z0-9]+', ' ', text)
-    text = text.strip()
-    return text
+def fragrantica_brand_url(brand):
+    """URL страницы бренда на Fragrantica по нормализованному названию"""
+    return f"https://www.fragrantica.ru/designers/{normalize_text(brand).replace(' ', '-')}.html"
 
-def search_fragrantica(scraper, brand, name, brand_cache):
+def search_fragrantica(scraper, brand, name):
     """Ищет аромат на Fragrantica"""
-    # Нормализуем бренд для URL
-    brand_normalized = normalize_text(brand).replace(' ', '-')
+    brand_page_url = fragrantica_brand_url(brand)
     
-    # Формируем URL страницы бренда
-    brand_page_url = f"https://www.fragrantica.ru/designers/{brand_normalized}.html"
+    # Ароматы бренда из постоянного индекса (страница грузится раз в окно обновления)
+    try:
+        perfume_links = get_brand_perfumes(brand_page_url, scraper)
+    except Exception:
+        return None
     
-    # Проверяем кэш
-    if brand_page_url in brand_cache:
-        perfume_links = brand_cache[brand_page_url]
-    else:
-        # Проверяем существование страницы бренда
-        try:
-            response = scraper.get(brand_page_url, timeout=30, stream=True)
-            status = response.status_code
-            response.close()
-            
-            if status != 200:
-                brand_cache[brand_page_url] = []
-                return None
-        except:
-            brand_cache[brand_page_url] = []
-            return None
-        
-        # Парсим страницу бренда
-        try:
-            time.sleep(1)
-            response = scraper.get(brand_page_url, timeout=30)
-            response.encoding = 'utf-8'
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            perfume_links_raw = soup.find_all('a', href=lambda x: x and '/perfume/' in x)
-            perfume_links = []
-            
-            for plink in perfume_links_raw:
-                purl = urljoin('https://www.fragrantica.ru', plink.get('href'))
-                ptext = plink.get_text(strip=True)
-                perfume_links.append({'url': purl, 'text': ptext})
-            
-            brand_cache[brand_page_url] = perfume_links
-        except:
-            brand_cache[brand_page_url] = []
-            return None
-    
-    # Поиск совпадения
-    name_normalized = normalize_text(name)
-    name_lower = name.lower().strip()
-    result_url = None
-    best_match_score = 0
-    
-    for perfume in perfume_links:
-        purl = perfume['url']
-        ptext = perfume['text']
-        
-        ptext_normalized = normalize_text(ptext)
-        ptext_lower = ptext.lower().strip()
-        
-        # Точное совпадение
-        if name_normalized == ptext_normalized:
-            return purl
-        
-        # Fuzzy matching
-        fuzzy_score = fuzz.token_sort_ratio(name_lower, ptext_lower)
-        partial_score = fuzz.partial_ratio(name_lower, ptext_lower)
-        token_set_score = fuzz.token_set_ratio(name_lower, ptext_lower)
-        
-        max_fuzzy_score = max(fuzzy_score, partial_score, token_set_score)
-        
-        if max_fuzzy_score > best_match_score and max_fuzzy_score >= 70:
-            result_url = purl
-            best_match_score = max_fuzzy_score
-        
-        # Word matching
-        if len(name_normalized) > 5:
-            name_words = set(name_lower.split())
-            ptext_words = set(ptext_lower.split())
-            common_words = name_words & ptext_words
-            
-            if len(name_words) > 0:
-                word_match_ratio = len(common_words) / len(name_words) * 100
-                if word_match_ratio > best_match_score and word_match_ratio >= 70:
-                    result_url = purl
-                    best_match_score = word_match_ratio
+    # Страницы бренда по slug нет - ищем по токенному индексу уже загруженных брендов
+    if perfume_links is None:
+        return find_in_index(brand, name)
+    
+    if not perfume_links:
+        return None
     
-    return result_url
+    # Нормализованные названия ароматов хранятся в индексе брендов
+    return match_brand([name], perfume_links, normalize_text)[0]
+
+def _match_brand_products(perfume_links, brand_products):
+    """Сопоставляет все товары бренда разом (выполняется в пуле процессов)"""
+    names = [name for _, _, name in brand_products]
+    # workers=1: параллелизм дает пул процессов, cdist внутри процесса не дробим
+    return match_brand(names, perfume_links, normalize_text, workers=1)
 
-def match_fragrantica_urls():
-    """Находит соответствия на Fragrantica для всех товаров"""
+def match_fragrantica_urls(stale_days=None):
+    """
+    Находит соответствия на Fragrantica для товаров без URL.
+    stale_days: инкрементальный режим - товар без совпадения повторно ищется
+    не чаще раза в stale_days дней (новые товары - всегда)
+    """
     print("\n" + "="*80)
     print("ШАГ 3: ПОИСК НА FRAGRANTICA")
     print("="*80 + "\n")
     
     conn = sqlite3.connect('fragrantica_news.db')
-    cursor = conn.cursor()
     
-    # Добавляем колонку если её нет
-    try:
-        cursor.execute('ALTER TABLE randewoo_products ADD COLUMN fragrantica_url TEXT')
-        conn.commit()
-    except:
-        pass
+    # Колонки fragrantica_url / matched_at, entity_id, если их нет
+    pipeline_state.create_tables(conn)
+    perfume_entities.create_tables(conn)
     
-    # Получаем товары без Fragrantica URL
-    cursor.execute('SELECT id, brand, name FROM randewoo_products WHERE fragrantica_url IS NULL')
-    products = cursor.fetchall()
+    # Товары, добавленные в обход каталога (веб-приложение), тоже группируем
+    perfume_entities.assign_entities(conn)
+    
+    # Ищем ароматы, а не товары: объемы и тестеры одного аромата - один поиск.
+    # Дальше "товар" этапа - (entity_id, бренд, базовое название)
+    products, products_count = perfume_entities.entities_to_match(conn, stale_days)
     
     if not products:
-        print("✓ Все товары уже имеют Fragrantica URL")
+        if stale_days is None:
+            print("✓ Все товары уже имеют Fragrantica URL")
+        else:
+            print(f"✓ Новых товаров для поиска нет (повторный поиск - раз в {stale_days} дн.)")
         conn.close()
         return
     
-    print(f"Товаров для обработки: {len(products)}\n")
+    print(f"Товаров для обработки: {products_count} (ароматов: {len(products)}, "
+          f"без дублей: -{products_count - len(products)} поисков)")
     
-    BATCH_SIZE = 10
-    BATCH_PAUSE = 2
+    # Группируем товары по странице бренда: страница грузится и разбирается один раз
+    brands = {}
+    for product in products:
+        brands.setdefault(fragrantica_brand_url(product[1]), []).append(product)
     
-    found = 0
-    not_found = 0
+    cached_brands = []   # Есть в индексе - сеть не нужна
+    network_brands = []  # Нужна загрузка страницы бренда
+    for brand_page_url in brands:
+        if brand_index.is_brand_fresh(brand_page_url):
+            cached_brands.append(brand_page_url)
+        else:
+            network_brands.append(brand_page_url)
+    print(f"Брендов: {len(brands)} (в индексе: {len(cached_brands)}, загрузить: {len(network_brands)})\n")
     
-    total_batches = (len(products) + BATCH_SIZE - 1) // BATCH_SIZE
+    # Пауза только между реальными запросами к fragrantica.ru
+    set_min_interval('https://www.fragrantica.ru', FRAGRANTICA_INTERVAL)
+    scraper = open_scraper('https://www.fragrantica.ru')
     
-    for batch_num in range(0, len(products), BATCH_SIZE):
-        batch_products = products[batch_num:batch_num + BATCH_SIZE]
-        current_batch = batch_num // BATCH_SIZE + 1
-        
-        print(f"{'='*80}")
-        print(f"ПАКЕТ {current_batch}/{total_batches}")
-        print(f"{'='*80}\n")
+    start_time = time.time()
+    unresolved = []      # Товары брендов без страницы - ищем по токенному индексу
+    pending = []         # (brand_page_url, future) в порядке отправки
+    counts = {'done': 0, 'found': 0, 'not_found': 0}
+    
+    def report(product, fragrantica_url, error=None):
+        entity_id, brand, name = product
+        counts['done'] += 1
+        print(f"[{counts['done']}/{len(products)}] {brand} - {name}")
         
-        scraper = cloudscraper.create_scraper(
-            browser={
-                'browser': 'chrome',
-                'platform': 'windows',
-                'mobile': False
-            }
-        )
-        brand_cache = {}
+        # matched_at - чекпоинт товаров аромата: после падения они не обрабатываются повторно.
+        # При ошибке загрузки не ставим - аромат попадет в следующий прогон
+        if fragrantica_url:
+            perfume_entities.set_match(writer, entity_id, fragrantica_url)
+            counts['found'] += 1
+            print(f"  ✓ Найдено: {fragrantica_url}")
+        elif error:
+            counts['not_found'] += 1
+            print(f"  ✗ Ошибка: {error}")
+        else:
+            perfume_entities.set_match(writer, entity_id, None)
+            counts['not_found'] += 1
+            print(f"  ✗ Не найдено")
+    
+    def drain(wait=False):
+        # Результаты пишем по мере готовности, в порядке отправки брендов
+        while pending and (wait or pending[0][1].done()):
+            brand_page_url, future = pending.pop(0)
+            try:
+                urls = future.result()
+            except Exception as e:
+                for product in brands[brand_page_url]:
+                    report(product, None, e)
+                continue
+            for product, fragrantica_url in zip(brands[brand_page_url], urls):
+                report(product, fragrantica_url)
+    
+    with WriteBuffer() as writer, ProcessPoolExecutor(max_workers=MATCH_PROCESSES) as executor:
+        # Бренды из индекса - сразу в пул, только CPU
+        for brand_page_url in cached_brands:
+            perfume_links = get_brand_perfumes(brand_page_url, scraper)
+            if perfume_links is None:
+                unresolved.extend(brands[brand_page_url])
+            else:
+                pending.append((brand_page_url, executor.submit(
+                    _match_brand_products, perfume_links, brands[brand_page_url])))
         
-        for idx_in_batch, (product_id, brand, name) in enumerate(batch_products, 1):
-            global_idx = batch_num + idx_in_batch
-            
-            print(f"[{global_idx}/{len(products)}] {brand} - {name}")
-            
+        # Остальные грузим по одному; пока идет сеть, пул сопоставляет готовые бренды
+        for idx, brand_page_url in enumerate(network_brands, 1):
+            drain()
+            print(f"  [{idx}/{len(network_brands)}] Загрузка: {brand_page_url}")
             try:
-                fragrantica_url = search_fragrantica(scraper, brand, name, brand_cache)
-                
-                if fragrantica_url:
-                    cursor.execute('UPDATE randewoo_products SET fragrantica_url = ? WHERE id = ?', 
-                                 (fragrantica_url, product_id))
-                    conn.commit()
-                    found += 1
-                    print(f"  ✓ Найдено: {fragrantica_url}")
-                else:
-                    not_found += 1
-                    print(f"  ✗ Не найдено")
-                
-                time.sleep(0.5)
-                
+                perfume_links = get_brand_perfumes(brand_page_url, scraper)
             except Exception as e:
-                not_found += 1
-                print(f"  ✗ Ошибка: {e}")
+                for product in brands[brand_page_url]:
+                    report(product, None, e)
+                continue
+            
+            if perfume_links is None:
+                unresolved.extend(brands[brand_page_url])
+            else:
+                pending.append((brand_page_url, executor.submit(
+                    _match_brand_products, perfume_links, brands[brand_page_url])))
+        
+        drain(wait=True)
         
-        if current_batch < total_batches:
-            print(f"\n⏸  Пауза {BATCH_PAUSE} сек...\n")
-            time.sleep(BATCH_PAUSE)
+        for product in unresolved:
+            report(product, find_in_index(product[1], product[2]))
     
     conn.close()
     
+    found = counts['found']
+    not_found = counts['not_found']
+    
+    elapsed = time.time() - start_time
+    
     print(f"\n{'='*80}")
     print(f"РЕЗУЛЬТАТЫ ПОИСКА:")
-    print(f"  Найдено: {found} ({found/len(products)*100:.1f}%)")
+    print(f"  Найдено: {found} ароматов ({found/len(products)*100:.1f}%)")
     print(f"  Не найдено: {not_found}")
+    print(f"  Поисков сэкономлено группировкой: {products_count - len(products)}")
+    print(f"  Загрузок страниц брендов: {brand_index.stats['fetches']} "
+          f"(из индекса: {brand_index.stats['db_hits']}, известный 404: {brand_index.stats['missing']})")
+    print(f"  Найдено по токенному индексу: {brand_index.stats['index_matches']}")
+    if elapsed:
+        print(f"  Время: {elapsed:.1f}с ({len(products)/elapsed:.1f} ароматов/сек, процессов: {MATCH_PROCESSES})")
+    print(f"  Записей в БД: {writer.rows} за {writer.transactions} транзакций")
     print(f"{'='*80}")
 
 # ============================================================================
 # ШАГ 4: ПАРСИНГ НОВОСТЕЙ
 # ============================================================================
 
-def parse_perfume_news_article(scraper, product_id, fragrantica_url):
-    """Парсит новости для одного аромата"""
+def parse_perfume_news_article(scraper, fragrantica_url, window=NEWS_WINDOW):
+    """
+    Парсит новости для одного аромата за окно дат window = (since, until)
+    (None - страницу получить не удалось).
+    Паузы между запросами к fragrantica.ru выдерживает общий планировщик fetcher
+    """
     try:
-        time.sleep(1)
-        response = scraper.get(fragrantica_url, timeout=30)
+        response = cached_get(fragrantica_url, scraper, timeout=30)
         response.encoding = 'utf-8'
-        soup = BeautifulSoup(response.text, 'html.parser')
         
-        news_list = []
-        news_blocks = soup.find_all('div', class_='newslist')
+        # Заголовок, ссылку и автора разбираем только у новостей из окна
+        since, until = window
+        blocks = html_extract.iter_news_blocks(response.text)
         
-        for block in news_blocks:
-            date_div = block.find('div', class_='right-bottom-corner-abs')
-            if date_div:
-                date_str = date_div.get_text(strip=True)
-                try:
-                    if len(date_str.split('/')[2].split(' ')[0]) == 2:
-                        news_date = datetime.strptime(date_str, '%m/%d/%y %H:%M')
-                    else:
-                        news_date = datetime.strptime(date_str, '%m/%d/%Y %H:%M')
-                    
-                    if news_date.year == 2025:
-                        title_tag = block.find('h4')
-                        link_tag = block.find('a', href=True)
-                        author_tag = block.find('p')
-                        
-                        if title_tag and link_tag:
-                            news_title = title_tag.get_text(strip=True)
-                            news_url = urljoin('https://www.fragrantica.ru', link_tag['href'])
-                            author = author_tag.get_text(strip=True).replace('от', '').strip() if author_tag else None
-                            
-                            news_list.append({
-                                'product_id': product_id,
-                                'news_title': news_title,
-                                'news_url': news_url,
-                                'news_date': news_date,
-                                'author': author
-                            })
-                except ValueError:
-                    continue
+        news_list = []
+        for news_date, block in news_in_window(blocks, since, until):
+            if block['title'] is not None and block['href'] is not None:
+                news_title = block['title']
+                news_url = urljoin('https://www.fragrantica.ru', block['href'])
+                author = block['author'].replace('от', '').strip() if block['author'] is not None else None
+                
+                news_list.append({
+                    'news_title': news_title,
+                    'news_url': news_url,
+                    'news_date': news_date,
+                    'author': author
+                })
         
         return news_list
     except Exception as e:
         print(f"    ✗ Ошибка парсинга новостей: {e}")
-        return []
+        return None
+
+def write_news(writer, product_ids, news_list):
+    """
+    Новости страницы аромата - каждому товару с этим URL (объемы, тестеры),
+    и чекпоинт news_checked_at для всех этих товаров
+    """
+    for product_id in product_ids:
+        for news in news_list:
+            writer.add('''
+                INSERT OR IGNORE INTO perfume_news 
+                (product_id, news_title, news_url, news_date, author)
+                VALUES (?, ?, ?, ?, ?)
+            ''', (product_id, news['news_title'], news['news_url'], 
+                  news['news_date'], news['author']))
+        writer.add('UPDATE randewoo_products SET news_checked_at = CURRENT_TIMESTAMP WHERE id = ?',
+                   (product_id,))
 
-def parse_all_news():
-    """Парсит новости для всех ароматов"""
+def parse_all_news(stale_days=None, window=NEWS_WINDOW):
+    """
+    Парсит новости для всех ароматов.
+    stale_days: инкрементальный режим - только ароматы, чья страница
+    не проверялась дольше stale_days дней. window: окно дат (since, until)
+    """
     print("\n" + "="*80)
-    print("ШАГ 4: ПАРСИНГ НОВОСТЕЙ")
+    print(f"ШАГ 4: ПАРСИНГ НОВОСТЕЙ ({describe_window(*window)})")
     print("="*80 + "\n")
     
     conn = sqlite3.connect('fragrantica_news.db')
     cursor = conn.cursor()
     
     # Получаем товары с Fragrantica URL
-    cursor.execute('''
-        SELECT id, brand, name, fragrantica_url 
-        FROM randewoo_products 
-        WHERE fragrantica_url IS NOT NULL
-    ''')
+    pipeline_state.create_tables(conn)
+    perfume_entities.create_tables(conn)
+    if stale_days is None:
+        cursor.execute('''
+            SELECT id, brand, name, fragrantica_url 
+            FROM randewoo_products 
+            WHERE fragrantica_url IS NOT NULL
+        ''')
+    else:
+        cursor.execute('''
+            SELECT id, brand, name, fragrantica_url 
+            FROM randewoo_products 
+            WHERE fragrantica_url IS NOT NULL
+              AND (news_checked_at IS NULL OR news_checked_at < datetime('now', ?))
+        ''', (f'-{stale_days} days',))
     products = cursor.fetchall()
     
     if not products:
-        print("✗ Нет товаров с Fragrantica URL")
+        if stale_days is None:
+            print("✗ Нет товаров с Fragrantica URL")
+        else:
+            print(f"✓ Новости всех ароматов проверены не позже {stale_days} дн. назад")
         conn.close()
         return
     
-    print(f"Товаров для парсинга новостей: {len(products)}\n")
+    # Товары одного аромата (объемы, тестеры) ведут на одну страницу - грузим ее один раз
+    pages = {}
+    for product in products:
+        pages.setdefault(product[3], []).append(product)
+    saved_requests = len(products) - len(pages)
+    
+    print(f"Товаров для парсинга новостей: {len(products)}")
+    print(f"Уникальных страниц ароматов: {len(pages)} (без дублей: -{saved_requests} запросов)\n")
     
-    scraper = cloudscraper.create_scraper(
-        browser={
-            'browser': 'chrome',
-            'platform': 'windows',
-            'mobile': False
-        }
-    )
+    # Потоки ждут общего планировщика: интервал к fragrantica.ru соблюдается на всех
+    set_min_interval('https://www.fragrantica.ru', FRAGRANTICA_INTERVAL)
+    scraper = open_scraper('https://www.fragrantica.ru')
     
+    start_time = time.time()
     total_news = 0
     products_with_news = 0
+    failed_pages = 0
+    
+    # Новости пишем пачками: не коммит на каждый аромат, а по размеру/таймеру
+    writer = WriteBuffer()
+    
+    try:
+        with ThreadPoolExecutor(max_workers=NEWS_WORKERS) as executor:
+            futures = {executor.submit(parse_perfume_news_article, scraper, fragrantica_url, window): fragrantica_url
+                       for fragrantica_url in pages}
+            
+            for idx, future in enumerate(as_completed(futures), 1):
+                fragrantica_url = futures[future]
+                page_products = pages[fragrantica_url]
+                _, brand, name, _ = page_products[0]
+                extra = f" (+{len(page_products) - 1} SKU)" if len(page_products) > 1 else ""
+                print(f"[{idx}/{len(pages)}] {brand} - {name}{extra}")
+                print(f"  URL: {fragrantica_url}")
+                
+                news_list = future.result()
+                
+                # Чекпоинт ароматов: страница проверена (при ошибке - повторим в следующий раз)
+                if news_list is None:
+                    failed_pages += 1
+                    continue
+                write_news(writer, [product[0] for product in page_products], news_list)
+                
+                if news_list:
+                    total_news += len(news_list)
+                    products_with_news += len(page_products)
+                    print(f"  ✓ Найдено новостей: {len(news_list)}")
+                else:
+                    print(f"  ⊘ Новостей не найдено")
+    finally:
+        writer.close()
+        # Новость записана к одному товару (news_url уникален) - аромат видит ее через entity_id
+        perfume_entities.fan_out(conn)
+        conn.close()
+    
+    elapsed = time.time() - start_time
+    
+    print(f"\n{'='*80}")
+    print(f"РЕЗУЛЬТАТЫ ПАРСИНГА НОВОСТЕЙ:")
+    print(f"  Всего новостей: {total_news}")
+    print(f"  Ароматов с новостями: {products_with_news}/{len(products)}")
+    print(f"  Страниц: {len(pages)}, ошибок: {failed_pages}; дедупликация сэкономила {saved_requests} запросов")
+    print(f"  Время: {elapsed:.1f}с (потоков: {NEWS_WORKERS}, интервал: {FRAGRANTICA_INTERVAL}с)")
+    print(f"  Записей в БД: {writer.rows} за {writer.transactions} транзакций")
+    print(f"{'='*80}")
+
+# ============================================================================
+# ПОТОКОВЫЙ РЕЖИМ: КАТАЛОГ → ПОИСК → НОВОСТИ
+# ============================================================================
+
+_STOP = object()  # Маркер конца очереди
+
+def _pending_products(conn, stale_days, product_urls=None):
+    """
+    Товары, которым нужен поиск на Fragrantica или проверка новостей.
+    stale_days=0 - все (полный цикл после очистки).
+    Ищутся ароматы, а не товары: объемы и тестеры одного аромата - один поиск.
+    Возвращает (на поиск [(entity_id, brand, base_name)], на новости [([id], brand, name, url)])
+    """
+    stale = f'-{stale_days} days'
+    query = '''
+        SELECT p.id, p.brand, p.name, p.fragrantica_url, p.entity_id, e.brand, e.base_name,
+               p.fragrantica_url IS NULL AND (p.matched_at IS NULL OR p.matched_at < datetime('now', ?)),
+               p.fragrantica_url IS NOT NULL AND (p.news_checked_at IS NULL OR p.news_checked_at < datetime('now', ?))
+        FROM randewoo_products p JOIN perfume_entities e ON e.id = p.entity_id
+    '''
+    params = [stale, stale]
+    if product_urls is not None:
+        query += f" WHERE p.product_url IN ({','.join('?' * len(product_urls))})"
+        params += list(product_urls)
+    
+    to_match = {}
+    to_news = []
+    for (product_id, brand, name, fragrantica_url, entity_id, entity_brand, base_name,
+         need_match, need_news) in conn.execute(query, params):
+        if need_match:
+            to_match.setdefault(entity_id, (entity_id, entity_brand, base_name))
+        elif need_news:
+            to_news.append(([product_id], brand, name, fragrantica_url))
+    return list(to_match.values()), to_news
+
+def run_streaming_pipeline(max_products, stale_days, run, window=NEWS_WINDOW):
+    """
+    Этапы работают одновременно и передают товары через ограниченные очереди:
+    страница каталога сразу уходит на поиск, найденный URL - сразу на новости.
+    Полная очередь блокирует предыдущий этап (backpressure), память не растет.
+    Общее время - примерно время самого медленного этапа.
+    Возвращает False, если каталог не дал ни одного товара; ошибка обхода пробрасывается
+    """
+    print("\n" + "="*80)
+    print(f"ПОТОКОВЫЙ РЕЖИМ: каталог ({CATALOG_CONCURRENCY}) → поиск ({MATCH_WORKERS}) → новости ({NEWS_WORKERS})")
+    print(f"Новости за {describe_window(*window)}")
+    print("="*80 + "\n")
     
-    for idx, (product_id, brand, name, fragrantica_url) in enumerate(products, 1):
-        print(f"[{idx}/{len(products)}] {brand} - {name}")
-        print(f"  URL: {fragrantica_url}")
+    conn = sqlite3.connect('fragrantica_news.db')
+    pipeline_state.create_tables(conn)
+    perfume_entities.create_tables(conn)
+    conn.close()
+    
+    set_min_interval('https://www.fragrantica.ru', FRAGRANTICA_INTERVAL)
+    scraper = open_scraper('https://www.fragrantica.ru')
+    
+    match_queue = queue.Queue(maxsize=QUEUE_SIZE)
+    news_queue = queue.Queue(maxsize=QUEUE_SIZE)
+    stop = threading.Event()
+    lock = threading.Lock()
+    
+    enqueued = set()            # id товаров, уже отправленных на новости в этом прогоне
+    enqueued_entities = set()   # id ароматов, уже отправленных на поиск
+    stats = {
+        'catalog': 0, 'added': 0, 'to_match': 0, 'to_news': 0,
+        'found': 0, 'not_found': 0, 'match_errors': 0,
+        'news_checked': 0, 'news': 0, 'news_errors': 0, 'news_pages': 0, 'news_dedup': 0
+    }
+    news_pages = {}    # fragrantica_url -> Future со списком новостей (одна загрузка на URL)
+    busy = {'catalog': 0.0, 'match': 0.0, 'news': 0.0}
+    catalog_errors = []
+    
+    def put(target, item):
+        # Блокирующая запись, но с проверкой остановки (Ctrl+C)
+        while not stop.is_set():
+            try:
+                target.put(item, timeout=0.5)
+                return
+            except queue.Full:
+                continue
+    
+    def dispatch(to_match, to_news):
+        with lock:
+            to_match = [e for e in to_match if e[0] not in enqueued_entities]
+            to_news = [p for p in to_news if p[0][0] not in enqueued]
+            enqueued_entities.update(e[0] for e in to_match)
+            enqueued.update(p[0][0] for p in to_news)
+            stats['to_match'] += len(to_match)
+            stats['to_news'] += len(to_news)
+        for product in to_match:
+            put(match_queue, product)
+        for product in to_news:
+            put(news_queue, product)
+    
+    def on_catalog_page(products):
+        # Страницы приходят в порядке готовности и без обрезки - не больше max_products всего
+        with lock:
+            if max_products:
+                products = products[:max(0, max_products - stats['catalog'])]
+            stats['catalog'] += len(products)
+        if not products:
+            return
         
+        # Сохраняем страницу и сразу отдаем ее товары дальше
+        conn = sqlite3.connect('fragrantica_news.db', timeout=30)
+        try:
+            added = save_products(conn, products)
+            conn.executemany('UPDATE randewoo_products SET last_seen_at = CURRENT_TIMESTAMP WHERE product_url = ?',
+                             [(p['product_url'],) for p in products])
+            conn.commit()
+            perfume_entities.assign_entities(conn, [p['product_url'] for p in products])
+            to_match, to_news = _pending_products(conn, stale_days, [p['product_url'] for p in products])
+        finally:
+            conn.close()
+        with lock:
+            stats['added'] += added
+        dispatch(to_match, to_news)
+    
+    def catalog_stage():
+        start = time.time()
         try:
-            news_list = parse_perfume_news_article(scraper, product_id, fragrantica_url)
+            if not pipeline_state.is_stage_done(run, 'catalog'):
+                crawl_catalog(CATALOG_URL, max_products=max_products, scraper=open_scraper(CATALOG_URL),
+                              concurrency=CATALOG_CONCURRENCY, rate=CATALOG_RATE,
+                              on_page=on_catalog_page)
             
-            if news_list:
-                for news in news_list:
-                    try:
-                        cursor.execute('''
-                            INSERT OR IGNORE INTO perfume_news 
-                            (product_id, news_title, news_url, news_date, author)
-                            VALUES (?, ?, ?, ?, ?)
-                        ''', (news['product_id'], news['news_title'], news['news_url'], 
-                              news['news_date'], news['author']))
-                    except:
-                        pass
-                
-                conn.commit()
-                total_news += len(news_list)
-                products_with_news += 1
-                print(f"  ✓ Найдено новостей: {len(news_list)}")
+            # Хвост из БД: товары вне этого обхода, ждущие поиска или новостей
+            conn = sqlite3.connect('fragrantica_news.db', timeout=30)
+            try:
+                perfume_entities.assign_entities(conn)
+                to_match, to_news = _pending_products(conn, stale_days)
+            finally:
+                conn.close()
+            dispatch(to_match, to_news)
+        except Exception as e:
+            # Главный поток пробросит ошибку: этап каталога не отмечается завершенным
+            print(f"  ✗ Каталог: {e}")
+            catalog_errors.append(e)
+        finally:
+            busy['catalog'] = time.time() - start
+            for _ in range(MATCH_WORKERS):
+                put(match_queue, _STOP)
+    
+    def match_worker():
+        conn = sqlite3.connect('fragrantica_news.db', timeout=30)
+        try:
+            match_loop(conn)
+        finally:
+            conn.close()
+    
+    def match_loop(conn):
+        while not stop.is_set():
+            entity = match_queue.get()
+            if entity is _STOP:
+                break
+            entity_id, brand, name = entity
+            start = time.time()
+            try:
+                fragrantica_url = search_fragrantica(scraper, brand, name)
+            except Exception as e:
+                with lock:
+                    stats['match_errors'] += 1
+                print(f"  ✗ Поиск: {brand} - {name}: {e}")
+                continue
+            finally:
+                with lock:
+                    busy['match'] += time.time() - start
+            
+            perfume_entities.set_match(writer, entity_id, fragrantica_url)
+            if fragrantica_url:
+                # Новости - один раз на аромат, для всех его товаров
+                members = perfume_entities.member_ids(conn, entity_id)
+                with lock:
+                    stats['found'] += 1
+                    members = [product_id for product_id in members if product_id not in enqueued]
+                    enqueued.update(members)
+                print(f"  ✓ Найдено: {brand} - {name}")
+                if members:
+                    put(news_queue, (members, brand, name, fragrantica_url))
+            else:
+                with lock:
+                    stats['not_found'] += 1
+                print(f"  ✗ Не найдено: {brand} - {name}")
+    
+    def page_news(fragrantica_url):
+        # Первый товар с этим URL грузит страницу, остальные (объемы, тестеры)
+        # берут ее результат - в том числе если загрузка еще идет в другом потоке
+        with lock:
+            future = news_pages.get(fragrantica_url)
+            owner = future is None
+            if owner:
+                future = news_pages[fragrantica_url] = Future()
+                stats['news_pages'] += 1
             else:
-                print(f"  ⊘ Новостей не найдено")
+                stats['news_dedup'] += 1
+        if owner:
+            future.set_result(parse_perfume_news_article(scraper, fragrantica_url, window))
+        return future.result(), owner
+    
+    def news_worker():
+        while not stop.is_set():
+            product = news_queue.get()
+            if product is _STOP:
+                break
+            product_ids, brand, name, fragrantica_url = product
+            start = time.time()
+            news_list, owner = page_news(fragrantica_url)
+            with lock:
+                busy['news'] += time.time() - start
             
-            time.sleep(1)
+            if news_list is None:
+                with lock:
+                    stats['news_errors'] += 1
+                continue
             
-        except Exception as e:
-            print(f"  ✗ Ошибка: {e}")
+            write_news(writer, product_ids, news_list)
+            with lock:
+                stats['news_checked'] += len(product_ids)
+                if owner:
+                    stats['news'] += len(news_list)
+            if news_list and owner:
+                print(f"  📰 Новостей: {len(news_list)} - {brand} - {name}")
     
-    conn.close()
+    start_time = time.time()
+    writer = WriteBuffer()
+    
+    catalog_thread = threading.Thread(target=catalog_stage, daemon=True)
+    match_threads = [threading.Thread(target=match_worker, daemon=True) for _ in range(MATCH_WORKERS)]
+    news_threads = [threading.Thread(target=news_worker, daemon=True) for _ in range(NEWS_WORKERS)]
+    for thread in [catalog_thread] + match_threads + news_threads:
+        thread.start()
+    
+    try:
+        # join с таймаутом: главный поток остается отзывчивым к Ctrl+C
+        while catalog_thread.is_alive():
+            catalog_thread.join(0.5)
+        if catalog_errors:
+            stop.set()
+            raise catalog_errors[0]
+        if not pipeline_state.is_stage_done(run, 'catalog'):
+            if stats['catalog'] == 0:
+                # Как в последовательном режиме: пустой обход - прогон не удался, на resume каталог снова
+                print("\n✗ Товары не найдены, парсинг остановлен")
+                stop.set()
+                return False
+            pipeline_state.complete_stage(run, 'catalog')
+        
+        for thread in match_threads:
+            while thread.is_alive():
+                thread.join(0.5)
+        pipeline_state.complete_stage(run, 'match')
+        
+        # Товары, пришедшие в каталоге, пока их аромат уже искался: URL аромата и новости
+        writer.flush()
+        conn = sqlite3.connect('fragrantica_news.db', timeout=30)
+        try:
+            perfume_entities.fan_out(conn)
+            _, to_news = _pending_products(conn, stale_days)
+        finally:
+            conn.close()
+        dispatch([], to_news)
+        
+        for _ in range(NEWS_WORKERS):
+            put(news_queue, _STOP)
+        for thread in news_threads:
+            while thread.is_alive():
+                thread.join(0.5)
+        pipeline_state.complete_stage(run, 'news')
+    except KeyboardInterrupt:
+        stop.set()
+        raise
+    finally:
+        # Все, что успели обработать, записывается (теряется не больше интервала сброса)
+        writer.close()
+        conn = sqlite3.connect('fragrantica_news.db', timeout=30)
+        try:
+            perfume_entities.fan_out(conn)
+        finally:
+            conn.close()
+    
+    elapsed = time.time() - start_time
     
     print(f"\n{'='*80}")
-    print(f"РЕЗУЛЬТАТЫ ПАРСИНГА НОВОСТЕЙ:")
-    print(f"  Всего новостей: {total_news}")
-    print(f"  Ароматов с новостями: {products_with_news}/{len(products)}")
+    print("РЕЗУЛЬТАТЫ ПОТОКОВОГО ПРОГОНА:")
+    print(f"  Каталог: {stats['catalog']} товаров (новых: {stats['added']}), {busy['catalog']:.1f}с")
+    print(f"  Поиск: {stats['to_match']} ароматов, найдено {stats['found']}, не найдено {stats['not_found']}, "
+          f"ошибок {stats['match_errors']} (работа потоков: {busy['match']:.1f}с)")
+    print(f"  Новости: {stats['news_checked']} товаров, новостей {stats['news']}, "
+          f"ошибок {stats['news_errors']} (работа потоков: {busy['news']:.1f}с)")
+    print(f"  Страниц новостей: {stats['news_pages']}, дедупликация сэкономила {stats['news_dedup']} запросов")
+    print(f"  Общее время: {elapsed:.1f}с (сумма этапов: "
+          f"{busy['catalog'] + busy['match'] + busy['news']:.1f}с)")
+    print(f"  Записей в БД: {writer.rows} за {writer.transactions} транзакций")
     print(f"{'='*80}")
+    return True
 
 # ============================================================================
 # ГЛАВНАЯ ФУНКЦИЯ
 # ============================================================================
 
+def parse_args(argv):
+    """
+    --full: полный цикл с очисткой БД; --stale-days N: срок устаревания;
+    --sequential: этапы по очереди вместо потокового режима;
+    --since / --until YYYY[-MM-DD]: окно дат новостей [since, until)
+    """
+    full = '--full' in argv
+    sequential = '--sequential' in argv
+    stale_days = STALE_DAYS
+    if '--stale-days' in argv:
+        stale_days = int(argv[argv.index('--stale-days') + 1])
+    since, until = NEWS_WINDOW
+    if '--since' in argv:
+        since = parse_window_date(argv[argv.index('--since') + 1])
+    if '--until' in argv:
+        until = parse_window_date(argv[argv.index('--until') + 1])
+    return full, stale_days, sequential, (since, until)
+
 def main():
+    full, stale_days, sequential, window = parse_args(sys.argv[1:])
+    mode = 'full' if full else 'incremental'
+    
     print("\n" + "="*80)
-    print("ГЛОБАЛЬНЫЙ ПАРСИНГ - ПОЛНЫЙ ЦИКЛ")
+    print("ГЛОБАЛЬНЫЙ ПАРСИНГ - ПОЛНЫЙ ЦИКЛ" if full else
+          f"ГЛОБАЛЬНЫЙ ПАРСИНГ - ИНКРЕМЕНТАЛЬНЫЙ (устаревание: {stale_days} дн.)")
     print("="*80)
     
     start_time = time.time()
     
+    # Чекпоинты: после падения или Ctrl+C прогон продолжается с последнего этапа
+    run = pipeline_state.start_run(mode)
+    if run['resumed']:
+        print(f"\n↻ Продолжаем прогон #{run['id']} после этапа: {run['last_stage'] or 'начало'}")
+    
+    # В полном режиме выбираем все, в инкрементальном - только новое и устаревшее
+    incremental_days = None if full else stale_days
+    
     try:
-        # Шаг 1: Очистка
-        clear_database()
+        # Шаг 1: Очистка (только полный цикл)
+        if not pipeline_state.is_stage_done(run, 'clear'):
+            if full:
+                clear_database()
+            pipeline_state.complete_stage(run, 'clear')
         
-        # Шаг 2: Парсинг Randewoo
-        products_count = parse_randewoo_catalog(MAX_PRODUCTS)
+        # Шаги 2-4 одновременно, через очереди
+        if not sequential:
+            if not run_streaming_pipeline(MAX_PRODUCTS, 0 if full else stale_days, run, window):
+                pipeline_state.finish_run(run, 'failed')
+                return
         
-        if products_count == 0:
-            print("\n✗ Товары не найдены, парсинг остановлен")
-            return
+        # Шаг 2: Парсинг Randewoo
+        if not pipeline_state.is_stage_done(run, 'catalog'):
+            products_count = parse_randewoo_catalog(MAX_PRODUCTS)
+            
+            if products_count == 0:
+                print("\n✗ Товары не найдены, парсинг остановлен")
+                pipeline_state.finish_run(run, 'failed')
+                return
+            pipeline_state.complete_stage(run, 'catalog')
         
         # Шаг 3: Поиск на Fragrantica
-        match_fragrantica_urls()
+        if not pipeline_state.is_stage_done(run, 'match'):
+            match_fragrantica_urls(incremental_days)
+            pipeline_state.complete_stage(run, 'match')
         
         # Шаг 4: Парсинг новостей
-        parse_all_news()
+        if not pipeline_state.is_stage_done(run, 'news'):
+            parse_all_news(incremental_days, window)
+            pipeline_state.complete_stage(run, 'news')
+        
+        pipeline_state.finish_run(run, 'done')
         
         elapsed = time.time() - start_time
         
@@ -508,12 +851,22 @@ def main():
         print(f"Время выполнения: {elapsed/60:.1f} минут")
         print("="*80 + "\n")
         
+        print_stats()
+        http_cache.print_stats()
+        hybrid_fetch.print_stats()
+        news_dates.print_stats()
+        
     except KeyboardInterrupt:
+        pipeline_state.finish_run(run, 'interrupted')
         print("\n\n⚠ Прервано пользователем")
+        print(f"  Следующий запуск продолжит прогон #{run['id']} с этапа после: {run['last_stage']}")
     except Exception as e:
+        pipeline_state.finish_run(run, 'failed')
         print(f"\n✗ Критическая ошибка: {e}")
         import traceback
         traceback.print_exc()
+    finally:
+        hybrid_fetch.close()
 
 if __name__ == '__main__':
     main()
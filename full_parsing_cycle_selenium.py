@@ -1,14 +1,15 @@
 import sqlite3
-import undetected_chromedriver as uc
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin
 import sys
 import io
+import math
 import time
-import unicodedata
-import re
-from rapidfuzz import fuzz
-import cloudscraper
+from browser_pool import DriverPool, BROWSER_WORKERS, PAGES_PER_DRIVER, LEGACY_FIRST_PAGE_WAIT
+from catalog_crawler import parse_catalog_html, save_products
+from fuzzy_matcher import match_brand
+from text_normalize import normalize_spaced as normalize_text
+from fetcher import get_scraper, print_stats
+from brand_index import find_in_index, resolve_brand
+from db_writer import WriteBuffer
 import warnings
 
 # Подавляем предупреждения
@@ -65,138 +66,85 @@ def clear_database():
 # ШАГ 2: ПАРСИНГ RANDEWOO С SELENIUM
 # ============================================================================
 
+def sorted_page_url(page):
+    """
+    URL страницы каталога с сортировкой по отзывам. Сортировка в каждом URL,
+    а не в сессии браузера: страницы грузят разные драйверы
+    """
+    url = f"{CATALOG_URL}?sorting=comments_count"
+    if page > 1:
+        url += f"&page={page}"
+    return url
+
 def parse_randewoo_with_selenium(max_products=1000):
-    """Парсит каталог Randewoo используя Selenium"""
+    """Парсит каталог Randewoo пулом браузеров Selenium"""
     print("\n" + "="*80, flush=True)
     print(f"ШАГ 2: ПАРСИНГ RANDEWOO (лимит: {max_products} товаров)", flush=True)
     print("="*80 + "\n", flush=True)
     
     conn = sqlite3.connect('fragrantica_news.db', timeout=30)
-    cursor = conn.cursor()
-    
-    # Проверяем текущее состояние БД
-    cursor.execute('SELECT COUNT(*) FROM randewoo_products')
-    existing_count = cursor.fetchone()[0]
-    print(f"📊 Товаров в БД: {existing_count}", flush=True)
-    
-    if existing_count >= max_products:
-        print(f"✓ Лимит уже достигнут ({existing_count}/{max_products})")
-        conn.close()
-        return existing_count
-    
-    # Настройки Chrome
-    options = uc.ChromeOptions()
-    options.headless = True  # Без GUI
-    options.add_argument('--no-sandbox')
-    options.add_argument('--disable-dev-shm-usage')
-    options.add_argument('--disable-gpu')
-    options.add_argument('--window-size=1920,1080')
-    
-    print("⏳ Инициализация Chrome (может занять 10-20 сек)...", flush=True)
-    print("   (Скачивание драйвера при первом запуске...)", flush=True)
-    
-    driver = uc.Chrome(options=options, version_main=None)
-    
-    print("✓ Chrome запущен!", flush=True)
-    
-    all_products = []
-    page = 1
+    pool = None
     
     try:
-        while len(all_products) < max_products:
-            if page == 1:
-                page_url = CATALOG_URL
-            else:
-                page_url = f"{CATALOG_URL}?page={page}"
-            
-            print(f"\nСтраница {page}: {page_url}", flush=True)
-            
-            try:
-                print("  🌐 Загружаю страницу...", end=" ", flush=True)
-                driver.get(page_url)
-                print("✓", flush=True)
-                
-                # На первой странице добавляем параметр сортировки в URL и перезагружаем
-                if page == 1:
-                    print("  🔽 Применяю сортировку по отзывам...", end=" ", flush=True)
-                    
-                    # Переходим на URL с сортировкой
-                    sorted_url = f"{CATALOG_URL}?sorting=comments_count"
-                    driver.get(sorted_url)
-                    
-                    print("✓", flush=True)
-                    print("  ⏳ Ждем загрузки отсортированных товаров (10 сек)...", end=" ", flush=True)
-                    time.sleep(10)
-                    print("✓", flush=True)
-                else:
-                    print("  ⏳ Ждем загрузки JS (8 сек)...", end=" ", flush=True)
-                    time.sleep(8)
-                    print("✓", flush=True)
-                
-                page_source = driver.page_source
-                soup = BeautifulSoup(page_source, 'html.parser')
-                
-                products = soup.find_all('li', class_='products__item')
-                
+        # Проверяем текущее состояние БД
+        existing_count = conn.execute('SELECT COUNT(*) FROM randewoo_products').fetchone()[0]
+        print(f"📊 Товаров в БД: {existing_count}", flush=True)
+        
+        if existing_count >= max_products:
+            print(f"✓ Лимит уже достигнут ({existing_count}/{max_products})")
+            return existing_count
+        
+        print(f"⏳ Пул из {BROWSER_WORKERS} Chrome (драйверы запускаются при первой странице)...", flush=True)
+        
+        pool = DriverPool(BROWSER_WORKERS, PAGES_PER_DRIVER)
+        pages = {}
+        
+        # Первая страница дает число страниц
+        print(f"\nСтраница 1: {sorted_page_url(1)}", flush=True)
+        for _, html in pool.load_pages([sorted_page_url(1)], legacy_wait=LEGACY_FIRST_PAGE_WAIT):
+            if html:
+                pages[1], total_pages = parse_catalog_html(html)
+        
+        first_products = pages.get(1)
+        if not first_products:
+            print("  ⚠ Нет товаров на странице 1")
+            return 0
+        print(f"  Найдено товаров: {len(first_products)}, всего страниц: {total_pages}")
+        
+        # Не грузим страницы, которые заведомо выйдут за лимит
+        needed = math.ceil(max(0, max_products - len(first_products)) / len(first_products))
+        last_page = min(total_pages, 1 + needed)
+        
+        if last_page > 1:
+            print(f"\nСтраницы 2-{last_page}: {len(pool.workers)} браузеров", flush=True)
+            urls = {sorted_page_url(page): page for page in range(2, last_page + 1)}
+            for url, html in pool.load_pages(urls):
+                if not html:
+                    continue
+                products, _ = parse_catalog_html(html)
+                pages[urls[url]] = products
                 if not products:
-                    print(f"  ⚠ Нет товаров на странице {page}")
-                    break
-                
-                print(f"  Найдено товаров: {len(products)}")
-                
-                for product in products:
-                    if len(all_products) >= max_products:
-                        break
-                    
-                    try:
-                        brand_div = product.find('div', class_='b-catalogItem__brand')
-                        name_div = product.find('div', class_='b-catalogItem__name')
-                        link = product.find('a', class_='b-catalogItem__descriptionLink')
-                        
-                        if brand_div and name_div and link:
-                            brand = brand_div.get_text(strip=True)
-                            name = name_div.get_text(strip=True)
-                            product_url = urljoin('https://randewoo.ru', link['href'])
-                            
-                            cursor.execute('''
-                                INSERT OR IGNORE INTO randewoo_products (brand, name, product_url)
-                                VALUES (?, ?, ?)
-                            ''', (brand, name, product_url))
-                            
-                            all_products.append({'brand': brand, 'name': name, 'url': product_url})
-                            
-                            # Показываем каждый товар
-                            print(f"  [{len(all_products)}/{max_products}] {brand} - {name}")
-                            
-                    except Exception as e:
-                        print(f"  ⚠ Ошибка парсинга товара: {e}")
-                
-                conn.commit()
-                print(f"  Всего собрано: {len(all_products)}/{max_products}")
-                
-                if len(all_products) >= max_products:
-                    print(f"\n✓ Достигнут лимит в {max_products} товаров")
-                    break
-                
-                # Проверяем пагинацию
-                pagination = soup.find('ol', class_='pager')
-                if pagination:
-                    next_link = pagination.find('a', class_='pager__link--forward')
-                    if not next_link:
-                        print(f"\n✓ Больше нет страниц")
-                        break
-                else:
-                    print(f"\n⚠ Пагинация не найдена")
-                    break
-                
-                page += 1
-                
-            except Exception as e:
-                print(f"  ✗ Ошибка загрузки страницы: {e}")
-                break
-    
+                    print(f"  ⚠ Нет товаров на странице {urls[url]}")
+        
+        # Браузеры больше не нужны - закрываем до записи в БД
+        pool.close()
+        pool.print_stats()
+        pool = None
+        
+        # Сохраняем в порядке страниц, как при последовательном обходе
+        all_products = []
+        for page in sorted(pages):
+            all_products.extend(pages[page])
+        all_products = all_products[:max_products]
+        
+        save_products(conn, all_products)
+        for i, product in enumerate(all_products, 1):
+            print(f"  [{i}/{max_products}] {product['brand']} - {product['name']}")
     finally:
-        driver.quit()
+        # На любом выходе (лимит, пустая первая страница, ошибка) - браузеры и соединение закрыты
+        if pool is not None:
+            pool.close()
+            pool.print_stats()
         conn.close()
     
     print(f"\n✓ Парсинг завершен: {len(all_products)} товаров")
@@ -206,12 +154,6 @@ def parse_randewoo_with_selenium(max_products=1000):
 # ШАГ 3: ПОИСК НА FRAGRANTICA
 # ============================================================================
 
-def normalize_text(text):
-    text = text.lower()
-    text = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('utf-8')
-    text = re.sub(r'[^a-z0-9]+', ' ', text)
-    return text.strip()
-
 def search_fragrantica(scraper, brand, name, brand_cache):
     """Проверенная функция поиска из add_fragrantica_url_final.py"""
     
@@ -220,48 +162,8 @@ def search_fragrantica(scraper, brand, name, brand_cache):
     if brand_key in brand_cache:
         perfume_links = brand_cache[brand_key]
         
-        name_normalized = normalize_text(name)
-        name_lower = name.lower().strip()
-        
-        best_match = None
-        best_match_score = 0
-        
-        for plink in perfume_links:
-            purl = plink['url']
-            ptext = plink['text']
-            
-            ptext_normalized = normalize_text(ptext)
-            ptext_lower = ptext.lower().strip()
-            
-            if name_normalized == ptext_normalized:
-                return purl
-            
-            fuzzy_score = fuzz.token_sort_ratio(name_lower, ptext_lower)
-            partial_score = fuzz.partial_ratio(name_lower, ptext_lower)
-            token_set_score = fuzz.token_set_ratio(name_lower, ptext_lower)
-            
-            max_fuzzy_score = max(fuzzy_score, partial_score, token_set_score)
-            
-            if max_fuzzy_score > best_match_score and max_fuzzy_score >= 70:
-                best_match = purl
-                best_match_score = max_fuzzy_score
-            
-            if len(name_normalized) > 5:
-                name_words = set(name_lower.split())
-                ptext_words = set(ptext_lower.split())
-                common_words = name_words & ptext_words
-                
-                if len(name_words) > 0:
-                    word_match_ratio = len(common_words) / len(name_words) * 100
-                    
-                    if word_match_ratio > best_match_score and word_match_ratio >= 70:
-                        best_match = purl
-                        best_match_score = word_match_ratio
-        
-        if best_match and best_match_score >= 70:
-            return best_match
-        
-        return None
+        # Нормализованные названия ароматов хранятся в индексе брендов
+        return match_brand([name], perfume_links, normalize_text)[0]
     
     # Формируем варианты URL страницы бренда
     brand_variants = [
@@ -269,72 +171,18 @@ def search_fragrantica(scraper, brand, name, brand_cache):
         brand,
     ]
     
-    brand_page_url = None
-    perfume_links = []
+    # Один запрос на вариант URL: проверка существования и разбор страницы
+    # по одному ответу, варианты с известным 404 пропускаются без запроса
+    brand_page_url, perfume_links = resolve_brand(
+        [f"https://www.fragrantica.ru/designers/{variant}.html" for variant in brand_variants],
+        scraper
+    )
     
-    for brand_variant in brand_variants:
-        test_url = f"https://www.fragrantica.ru/designers/{brand_variant}.html"
-        
-        try:
-            response = scraper.get(test_url, timeout=10)
-            
-            if response.status_code == 200:
-                brand_page_url = test_url
-                break
-        except:
-            continue
-        
-        time.sleep(2)  # Пауза между проверками URL бренда
-    
-    # Парсим страницу бренда
     if brand_page_url:
         try:
-            time.sleep(2)  # Пауза перед загрузкой страницы бренда
-            response = scraper.get(brand_page_url, timeout=30)
-            response.encoding = 'utf-8'
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            perfume_links_raw = soup.find_all('a', href=lambda x: x and '/perfume/' in x)
+            result_url = match_brand([name], perfume_links, normalize_text)[0]
             
-            name_normalized = normalize_text(name)
-            name_lower = name.lower().strip()
-            result_url = None
-            best_match_score = 0
-            
-            for plink in perfume_links_raw:
-                purl = urljoin('https://www.fragrantica.ru', plink.get('href'))
-                ptext = plink.get_text(strip=True)
-                perfume_links.append({'url': purl, 'text': ptext})
-                
-                ptext_normalized = normalize_text(ptext)
-                ptext_lower = ptext.lower().strip()
-                
-                if name_normalized == ptext_normalized:
-                    result_url = purl
-                    break
-                
-                fuzzy_score = fuzz.token_sort_ratio(name_lower, ptext_lower)
-                partial_score = fuzz.partial_ratio(name_lower, ptext_lower)
-                token_set_score = fuzz.token_set_ratio(name_lower, ptext_lower)
-                
-                max_fuzzy_score = max(fuzzy_score, partial_score, token_set_score)
-                
-                if max_fuzzy_score > best_match_score and max_fuzzy_score >= 70:
-                    result_url = purl
-                    best_match_score = max_fuzzy_score
-                
-                if len(name_normalized) > 5:
-                    name_words = set(name_lower.split())
-                    ptext_words = set(ptext_lower.split())
-                    common_words = name_words & ptext_words
-                    
-                    if len(name_words) > 0:
-                        word_match_ratio = len(common_words) / len(name_words) * 100
-                        if word_match_ratio > best_match_score and word_match_ratio >= 70:
-                            result_url = purl
-                            best_match_score = word_match_ratio
-            
-            # Кешируем результаты
+            # Кешируем бренд
             brand_cache[brand_key] = perfume_links
             
             if result_url:
@@ -343,6 +191,10 @@ def search_fragrantica(scraper, brand, name, brand_cache):
         except Exception as e:
             pass
     
+    # Страницы бренда нет - ищем по токенному индексу загруженных брендов
+    if not brand_page_url:
+        return find_in_index(brand, name)
+    
     # Кешируем пустой результат
     brand_cache[brand_key] = []
     return None
@@ -382,6 +234,15 @@ def match_fragrantica_urls():
     
     total_batches = (len(products) + BATCH_SIZE - 1) // BATCH_SIZE
     
+    # Кеш брендов живет весь прогон, а не один пакет
+    # Найденные URL пишем пачками, а не коммитом на каждый товар
+    writer = WriteBuffer()
+    
+    brand_cache = {}
+    
+    # Один scraper через прокси Smartproxy на весь прогон
+    scraper = get_scraper('https://www.fragrantica.ru', proxy=PROXY_URL)
+    
     for batch_num in range(0, len(products), BATCH_SIZE):
         batch_products = products[batch_num:batch_num + BATCH_SIZE]
         current_batch = batch_num // BATCH_SIZE + 1
@@ -390,16 +251,6 @@ def match_fragrantica_urls():
         print(f"ПАКЕТ {current_batch}/{total_batches}")
         print(f"{'='*80}\n")
         
-        scraper = cloudscraper.create_scraper(
-            browser={'browser': 'chrome', 'platform': 'windows', 'mobile': False}
-        )
-        # Настраиваем прокси Smartproxy
-        scraper.proxies = {
-            'http': PROXY_URL,
-            'https': PROXY_URL
-        }
-        brand_cache = {}
-        
         for idx_in_batch, (product_id, brand, name) in enumerate(batch_products, 1):
             global_idx = batch_num + idx_in_batch
             
@@ -410,9 +261,8 @@ def match_fragrantica_urls():
                 fragrantica_url = search_fragrantica(scraper, brand, name, brand_cache)
                 
                 if fragrantica_url:
-                    cursor.execute('UPDATE randewoo_products SET fragrantica_url = ? WHERE id = ?', 
-                                 (fragrantica_url, product_id))
-                    conn.commit()
+                    writer.add('UPDATE randewoo_products SET fragrantica_url = ? WHERE id = ?', 
+                               (fragrantica_url, product_id))
                     found += 1
                     print(f"✓ Найдено")
                     print(f"     {fragrantica_url}")
@@ -430,6 +280,7 @@ def match_fragrantica_urls():
             print(f"\n⏸  Пауза {BATCH_PAUSE} сек...\n")
             time.sleep(BATCH_PAUSE)
     
+    writer.close()
     conn.close()
     
     print(f"\n{'='*80}")
@@ -437,6 +288,8 @@ def match_fragrantica_urls():
     print(f"  Найдено: {found} ({found/len(products)*100:.1f}%)")
     print(f"  Не найдено: {not_found}")
     print(f"{'='*80}")
+    
+    print_stats()
 
 # ============================================================================
 # ГЛАВНАЯ ФУНКЦИЯ
@@ -0,0 +1,113 @@
+import numpy as np
+from rapidfuzz import fuzz, process
+
+from text_normalize import normalize_lower, normalize_spaced
+
+# ============================================================================
+# НАСТРОЙКИ
+# ============================================================================
+
+MATCH_THRESHOLD = 70   # Минимальный score совпадения, %
+MIN_WORD_MATCH_LEN = 5 # Проверка по словам - только для названий длиннее
+
+FUZZY_SCORERS = (fuzz.token_sort_ratio, fuzz.partial_ratio, fuzz.token_set_ratio)
+
+# ============================================================================
+# ПАКЕТНОЕ СОПОСТАВЛЕНИЕ
+# ============================================================================
+
+def _word_match_scores(queries_lower, candidates_lower):
+    """
+    Доля слов названия, найденных в кандидате (%), матрицей сразу для всех пар.
+    Эквивалент len(name_words & ptext_words) / len(name_words) * 100
+    """
+    query_words = [set(q.split()) for q in queries_lower]
+
+    vocabulary = {}
+    for words in query_words:
+        for word in words:
+            vocabulary.setdefault(word, len(vocabulary))
+
+    query_matrix = np.zeros((len(queries_lower), len(vocabulary)), dtype=np.int32)
+    for i, words in enumerate(query_words):
+        for word in words:
+            query_matrix[i, vocabulary[word]] = 1
+
+    # Слова кандидатов, которых нет ни в одном названии, на результат не влияют
+    candidate_matrix = np.zeros((len(candidates_lower), len(vocabulary)), dtype=np.int32)
+    for j, candidate in enumerate(candidates_lower):
+        for word in set(candidate.split()):
+            column = vocabulary.get(word)
+            if column is not None:
+                candidate_matrix[j, column] = 1
+
+    common = query_matrix @ candidate_matrix.T
+    lengths = query_matrix.sum(axis=1).astype(np.float64)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        scores = common / lengths[:, None] * 100
+    scores[lengths == 0, :] = 0
+    return scores
+
+
+def match_brand(names, perfume_links, normalize=normalize_spaced, threshold=MATCH_THRESHOLD, workers=-1,
+                names_normalized=None, candidates_normalized=None):
+    """
+    Сопоставляет все названия товаров одного бренда со всеми ароматами бренда.
+
+    Решения совпадают с построчным циклом: точное совпадение нормализованных
+    названий побеждает сразу (первое по порядку), иначе берется первый
+    кандидат с максимальным score из token_sort/partial/token_set ratio
+    и доли совпавших слов, если он не ниже порога.
+
+    Если у ароматов уже есть 'text_normalized' / 'text_lower' (индекс брендов),
+    названия ароматов повторно не нормализуются.
+    Возвращает список URL (или None) в порядке names
+    """
+    if not names:
+        return []
+    if not perfume_links:
+        return [None] * len(names)
+
+    if names_normalized is None:
+        names_normalized = [normalize(name) for name in names]
+    if candidates_normalized is None:
+        if normalize is normalize_spaced and all('text_normalized' in p for p in perfume_links):
+            candidates_normalized = [p['text_normalized'] for p in perfume_links]
+        else:
+            candidates_normalized = [normalize(p['text']) for p in perfume_links]
+
+    queries_lower = [normalize_lower(name) for name in names]
+    candidates_lower = [p['text_lower'] if 'text_lower' in p else normalize_lower(p['text'])
+                        for p in perfume_links]
+
+    # Первый кандидат для каждого нормализованного названия
+    exact_index = {}
+    for j, candidate in enumerate(candidates_normalized):
+        exact_index.setdefault(candidate, j)
+
+    # score_cutoff: пары ниже порога rapidfuzz не досчитывает и отдает 0
+    scores = np.zeros((len(names), len(perfume_links)), dtype=np.float64)
+    for scorer in FUZZY_SCORERS:
+        np.maximum(scores, process.cdist(queries_lower, candidates_lower, scorer=scorer,
+                                         dtype=np.float64, workers=workers,
+                                         score_cutoff=threshold), out=scores)
+
+    word_rows = [i for i, name in enumerate(names_normalized) if len(name) > MIN_WORD_MATCH_LEN]
+    if word_rows:
+        word_scores = _word_match_scores([queries_lower[i] for i in word_rows], candidates_lower)
+        word_scores[word_scores < threshold] = 0
+        scores[word_rows] = np.maximum(scores[word_rows], word_scores)
+
+    best = scores.argmax(axis=1)
+
+    results = []
+    for i, name_normalized in enumerate(names_normalized):
+        j = exact_index.get(name_normalized)
+        if j is not None:
+            results.append(perfume_links[j]['url'])
+        elif scores[i, best[i]] >= threshold:
+            results.append(perfume_links[best[i]]['url'])
+        else:
+            results.append(None)
+    return results
@@ -0,0 +1,179 @@
+import os
+import sys
+import io
+import json
+import time
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from fetcher import print_stats, set_min_interval
+import html_extract
+import http_cache
+import image_store
+import telegram_images
+from http_cache import cached_get
+from db_writer import WriteBuffer
+from parse_images import card_image_urls
+
+# Фикс кодировки для Windows консоли
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+
+# ============================================================================
+# НАСТРОЙКИ
+# ============================================================================
+
+ARTICLE_WORKERS = 4        # Статей обрабатывается одновременно
+ARTICLE_INTERVAL = 1.0     # Секунд между реальными запросами к fragrantica.ru (на все потоки)
+HARVEST_BATCH = 50         # Статей в пачке: картинки пачки качаются одним пулом
+IMAGES_DIR = 'images'
+
+# ============================================================================
+# ОДНА СТАТЬЯ
+# ============================================================================
+
+def get_news_to_harvest():
+    """Новости без полного текста или без изображений: [(id, title, url, нужен текст, нужны картинки)]"""
+    conn = sqlite3.connect('fragrantica_news.db')
+    cursor = conn.cursor()
+
+    # Колонки из add_full_news_column.py / add_images_column.py, если их еще нет
+    for column in ('news_full TEXT', 'images TEXT'):
+        try:
+            cursor.execute(f'ALTER TABLE news ADD COLUMN {column}')
+        except sqlite3.OperationalError:
+            pass
+    conn.commit()
+
+    cursor.execute('''
+        SELECT id, title, url, news_full IS NULL, images IS NULL
+        FROM news
+        WHERE news_full IS NULL OR images IS NULL
+    ''')
+    news_list = cursor.fetchall()
+
+    conn.close()
+    return news_list
+
+def harvest_article(url):
+    """
+    Загружает статью один раз и берет из одного разбора и текст, и картинки.
+    Возвращает (текст, [URL картинок]) или None - страница не загрузилась.
+    Текста на странице нет - '': статья проверена и при следующем запуске не грузится
+    """
+    try:
+        response = cached_get(url, timeout=30)
+        response.raise_for_status()
+        response.encoding = 'utf-8'
+    except Exception as e:
+        print(f"  ✗ Ошибка загрузки {url}: {e}")
+        return None
+
+    card = html_extract.news_card(response.text)
+    if not card:
+        print(f"  ⚠ Не найден блок card: {url}")
+        return '', []
+
+    return card['text'] or '', card_image_urls(card, url)
+
+
+def image_paths_for(image_urls, paths):
+    """Пути картинок статьи по порядку; разные URL одного файла - один раз"""
+    result = []
+    for img_url in image_urls:
+        filepath = paths.get(img_url)
+        if filepath and filepath not in result:
+            result.append(filepath)
+    return result
+
+# ============================================================================
+# ВСЕ СТАТЬИ
+# ============================================================================
+
+def main():
+    print("=== Сбор текста и изображений статей ===\n")
+
+    os.makedirs(IMAGES_DIR, exist_ok=True)
+
+    news_list = get_news_to_harvest()
+    if not news_list:
+        print("✓ У всех новостей уже есть текст и изображения")
+        return
+
+    need_text = sum(1 for news in news_list if news[3])
+    need_images = sum(1 for news in news_list if news[4])
+    print(f"Новостей: {len(news_list)} (без текста: {need_text}, без изображений: {need_images})")
+    # Раньше parse_full_news.py и parse_images.py грузили статью каждый своей загрузкой
+    print(f"Загрузок страниц: {len(news_list)} вместо {need_text + need_images} двумя скриптами\n")
+
+    # Потоки ждут общего планировщика: интервал к fragrantica.ru соблюдается на всех
+    set_min_interval('https://www.fragrantica.ru', ARTICLE_INTERVAL)
+
+    counts = {'text': 0, 'images': 0, 'failed': 0}
+    start_time = time.time()
+
+    # Текст и картинки - одним UPDATE; COALESCE не затирает то, что уже было
+    writer = WriteBuffer()
+    idx = 0
+    try:
+        with ThreadPoolExecutor(max_workers=ARTICLE_WORKERS) as executor:
+            for batch_start in range(0, len(news_list), HARVEST_BATCH):
+                batch = news_list[batch_start:batch_start + HARVEST_BATCH]
+
+                # 1. Страницы статей пачки
+                futures = {executor.submit(harvest_article, url): (news_id, title, text_missing, images_missing)
+                           for news_id, title, url, text_missing, images_missing in batch}
+                harvested = []
+                for future in as_completed(futures):
+                    news_id, title, text_missing, images_missing = futures[future]
+                    result = future.result()
+                    if result is None:
+                        idx += 1
+                        print(f"[{idx}/{len(news_list)}] {title[:50]}...")
+                        counts['failed'] += 1
+                        continue
+                    harvested.append((news_id, title, text_missing, images_missing) + result)
+
+                # 2. Картинки всей пачки - одним пулом с лимитом на хост
+                paths = image_store.fetch_images(
+                    [img_url for _, _, _, images_missing, _, image_urls in harvested if images_missing
+                     for img_url in image_urls], IMAGES_DIR)
+
+                # 3. Запись
+                batch_images = []
+                for news_id, title, text_missing, images_missing, full_text, image_urls in harvested:
+                    idx += 1
+                    print(f"[{idx}/{len(news_list)}] {title[:50]}...")
+                    image_paths = image_paths_for(image_urls, paths) if images_missing else []
+                    writer.add('''
+                        UPDATE news SET news_full = COALESCE(news_full, ?), images = COALESCE(images, ?)
+                        WHERE id = ?
+                    ''', (full_text, json.dumps(image_paths, ensure_ascii=False) if images_missing else None, news_id))
+
+                    if full_text and text_missing:
+                        counts['text'] += 1
+                    counts['images'] += len(image_paths)
+                    batch_images.extend(image_paths)
+                    print(f"  ✓ Текст: {len(full_text) if full_text else 0} символов, изображений: {len(image_paths)}")
+
+                # 4. Версии для Telegram - сейчас, а не при каждой публикации
+                telegram_images.prepare_images(batch_images)
+    finally:
+        writer.close()
+
+    elapsed = time.time() - start_time
+
+    print("\n=== Результат ===")
+    print(f"Текстов сохранено: {counts['text']}")
+    print(f"Изображений скачано: {counts['images']}")
+    print(f"Ошибок загрузки: {counts['failed']}")
+    print(f"Время: {elapsed:.1f}с (потоков: {ARTICLE_WORKERS}, интервал: {ARTICLE_INTERVAL}с)")
+
+    print_stats()
+    http_cache.print_stats()
+    image_store.print_stats()
+    telegram_images.print_stats()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,476 @@
+import threading
+from functools import partial
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
+
+# ============================================================================
+# НАСТРОЙКИ
+# ============================================================================
+
+# Парсер HTML: 'selectolax', 'lxml', 'bs4' или 'auto' (самый быстрый из установленных).
+# bs4 (html.parser) - эталон и запасной вариант без дополнительных библиотек.
+# 'auto' - потому что check_html_extract.py проходит без расхождений по fixtures/html
+# с эталонами *.json. lexbor/lxml иначе чинят невалидную вложенность (<div> внутри <p>
+# обрезает автора новости) - после изменений верстки сайта прогнать проверку по HTTP-кешу
+# и при расхождениях вернуть 'bs4'
+HTML_BACKEND = 'auto'
+
+RANDEWOO_URL = 'https://randewoo.ru'
+FRAGRANTICA_URL = 'https://www.fragrantica.ru'
+
+# Строки внутри этих тегов BeautifulSoup не считает текстом (get_text их пропускает)
+NON_TEXT_TAGS = ('script', 'style', 'template', 'rt', 'rp')
+
+STREAM_CHUNK_SIZE = 64 * 1024  # Байт на одну подачу в потоковый разбор
+
+# ============================================================================
+# РЕЗУЛЬТАТЫ РАЗБОРА (одинаковые для всех парсеров)
+# ============================================================================
+#
+# catalog_page(html)   -> (products [{'brand', 'name', 'product_url'}], total_pages)
+# designer_links(html) -> [(href, text)] ссылок на /perfume/ в порядке на странице
+# news_blocks(html)    -> [{'date', 'title', 'href', 'author'}] по div.newslist
+#                         (первые div.right-bottom-corner-abs, h4, a[href], p; None - если нет)
+# iter_news_blocks(html) -> (date, fields) по тем же блокам; fields() -> {'title', 'href', 'author'}
+#                         достает остальное только по запросу (фильтр по дате - news_dates)
+# news_card(html)      -> {'text', 'images' [(src, width)]} основного div.card или None
+#
+# designer_links_stream(chunks) -> то же, что designer_links, но из потока байтов
+
+def _join_text(parts, separator):
+    """Как get_text(separator, strip=True): каждая строка без краевых пробелов, пустые выкидываются"""
+    return separator.join(part for part in (p.strip() for p in parts) if part)
+
+# ============================================================================
+# BEAUTIFULSOUP (ЭТАЛОН)
+# ============================================================================
+
+class Bs4Backend:
+    name = 'bs4'
+
+    def catalog_page(self, html):
+        soup = BeautifulSoup(html, 'html.parser')
+
+        products = []
+        for product in soup.find_all('li', class_='products__item'):
+            brand_div = product.find('div', class_='b-catalogItem__brand')
+            name_div = product.find('div', class_='b-catalogItem__name')
+            link = product.find('a', class_='b-catalogItem__descriptionLink')
+
+            if brand_div and name_div and link and link.get('href'):
+                products.append({
+                    'brand': brand_div.get_text(strip=True),
+                    'name': name_div.get_text(strip=True),
+                    'product_url': urljoin(RANDEWOO_URL, link['href'])
+                })
+
+        # Число страниц берем из ссылок пагинатора data-page
+        total_pages = 1
+        pagination = soup.find('ol', class_='pager')
+        if pagination:
+            for link in pagination.find_all('a', class_='pager__link'):
+                data_page = link.get('data-page')
+                if data_page and data_page.isdigit():
+                    total_pages = max(total_pages, int(data_page))
+
+        return products, total_pages
+
+    def designer_links(self, html):
+        soup = BeautifulSoup(html, 'html.parser')
+        return [(link.get('href'), link.get_text(strip=True))
+                for link in soup.find_all('a', href=lambda x: x and '/perfume/' in x)]
+
+    def iter_news_blocks(self, html):
+        soup = BeautifulSoup(html, 'html.parser')
+        for block in soup.find_all('div', class_='newslist'):
+            date_div = block.find('div', class_='right-bottom-corner-abs')
+            yield date_div.get_text(strip=True) if date_div else None, partial(self._news_fields, block)
+
+    def _news_fields(self, block):
+        title_tag = block.find('h4')
+        link_tag = block.find('a', href=True)
+        author_tag = block.find('p')
+        return {
+            'title': title_tag.get_text(strip=True) if title_tag else None,
+            'href': link_tag['href'] if link_tag else None,
+            'author': author_tag.get_text(strip=True) if author_tag else None
+        }
+
+    def news_card(self, html):
+        soup = BeautifulSoup(html, 'html.parser')
+
+        # Ищем div с классом card и style="width: 100%; position: relative;"
+        card_div = soup.find('div', class_='card', style=lambda value: value and 'width: 100%' in value and 'position: relative' in value)
+        if not card_div:
+            # Если не найден точный div, берем любой card на странице новости
+            card_div = soup.find('div', class_='card')
+        if not card_div:
+            return None
+
+        return {
+            'text': card_div.get_text(separator='\n', strip=True),
+            'images': [(img.get('src'), img.get('width')) for img in card_div.find_all('img')]
+        }
+
+# ============================================================================
+# LXML (XPATH)
+# ============================================================================
+
+def _xpath_class(name):
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+class LxmlBackend:
+    name = 'lxml'
+
+    def __init__(self):
+        # Выражения компилируются один раз
+        self._products = etree.XPath(f"//li[{_xpath_class('products__item')}]")
+        self._brand = etree.XPath(f"descendant::div[{_xpath_class('b-catalogItem__brand')}][1]")
+        self._name = etree.XPath(f"descendant::div[{_xpath_class('b-catalogItem__name')}][1]")
+        self._product_link = etree.XPath(f"descendant::a[{_xpath_class('b-catalogItem__descriptionLink')}][1]")
+        self._pager = etree.XPath(f"(//ol[{_xpath_class('pager')}])[1]")
+        self._pager_links = etree.XPath(f"descendant::a[{_xpath_class('pager__link')}]")
+
+        self._perfume_links = etree.XPath("//a[contains(@href, '/perfume/')]")
+
+        self._newslist = etree.XPath(f"//div[{_xpath_class('newslist')}]")
+        self._news_date = etree.XPath(f"descendant::div[{_xpath_class('right-bottom-corner-abs')}][1]")
+        self._news_title = etree.XPath("descendant::h4[1]")
+        self._news_link = etree.XPath("descendant::a[@href][1]")
+        self._news_author = etree.XPath("descendant::p[1]")
+
+        self._card_main = etree.XPath(f"(//div[{_xpath_class('card')} and contains(@style, 'width: 100%') "
+                                      f"and contains(@style, 'position: relative')])[1]")
+        self._card_any = etree.XPath(f"(//div[{_xpath_class('card')}])[1]")
+        self._card_images = etree.XPath("descendant::img")
+
+        not_text = ' or '.join(f'ancestor::{tag}' for tag in NON_TEXT_TAGS)
+        self._texts = etree.XPath(f"descendant::text()[not({not_text})]")
+
+        self._local = threading.local()  # Парсер lxml - свой на поток
+
+    def _parse(self, html):
+        parser = getattr(self._local, 'parser', None)
+        if parser is None:
+            parser = self._local.parser = etree.HTMLParser(encoding='utf-8')
+        return etree.fromstring(html.encode('utf-8'), parser)
+
+    def _text(self, element, separator=''):
+        return _join_text(self._texts(element), separator)
+
+    def _first(self, xpath, element):
+        found = xpath(element)
+        return found[0] if found else None
+
+    def catalog_page(self, html):
+        root = self._parse(html)
+        if root is None:
+            return [], 1
+
+        products = []
+        for product in self._products(root):
+            brand_div = self._first(self._brand, product)
+            name_div = self._first(self._name, product)
+            link = self._first(self._product_link, product)
+
+            if brand_div is not None and name_div is not None and link is not None and link.get('href'):
+                products.append({
+                    'brand': self._text(brand_div),
+                    'name': self._text(name_div),
+                    'product_url': urljoin(RANDEWOO_URL, link.get('href'))
+                })
+
+        total_pages = 1
+        pagination = self._first(self._pager, root)
+        if pagination is not None:
+            for link in self._pager_links(pagination):
+                data_page = link.get('data-page')
+                if data_page and data_page.isdigit():
+                    total_pages = max(total_pages, int(data_page))
+
+        return products, total_pages
+
+    def designer_links(self, html):
+        root = self._parse(html)
+        if root is None:
+            return []
+        return [(link.get('href'), self._text(link)) for link in self._perfume_links(root)]
+
+    def iter_news_blocks(self, html):
+        root = self._parse(html)
+        if root is None:
+            return
+        for block in self._newslist(root):
+            date_div = self._first(self._news_date, block)
+            yield self._text(date_div) if date_div is not None else None, partial(self._news_fields, block)
+
+    def _news_fields(self, block):
+        title_tag = self._first(self._news_title, block)
+        link_tag = self._first(self._news_link, block)
+        author_tag = self._first(self._news_author, block)
+        return {
+            'title': self._text(title_tag) if title_tag is not None else None,
+            'href': link_tag.get('href') if link_tag is not None else None,
+            'author': self._text(author_tag) if author_tag is not None else None
+        }
+
+    def news_card(self, html):
+        root = self._parse(html)
+        if root is None:
+            return None
+
+        card_div = self._first(self._card_main, root)
+        if card_div is None:
+            card_div = self._first(self._card_any, root)
+        if card_div is None:
+            return None
+
+        return {
+            'text': self._text(card_div, '\n'),
+            'images': [(img.get('src'), img.get('width')) for img in self._card_images(card_div)]
+        }
+
+# ============================================================================
+# SELECTOLAX (LEXBOR, CSS)
+# ============================================================================
+
+class SelectolaxBackend:
+    name = 'selectolax'
+
+    # CSS-селекторы по типам страниц
+    PRODUCTS = 'li.products__item'
+    BRAND = 'div.b-catalogItem__brand'
+    NAME = 'div.b-catalogItem__name'
+    PRODUCT_LINK = 'a.b-catalogItem__descriptionLink'
+    PAGER = 'ol.pager'
+    PAGER_LINKS = 'a.pager__link'
+    PERFUME_LINKS = 'a[href*="/perfume/"]'
+    NEWSLIST = 'div.newslist'
+    NEWS_DATE = 'div.right-bottom-corner-abs'
+    NEWS_LINK = 'a[href]'
+    CARD_MAIN = 'div.card[style*="width: 100%"][style*="position: relative"]'
+    CARD_ANY = 'div.card'
+    NON_TEXT = ', '.join(NON_TEXT_TAGS)
+
+    def _text(self, node, separator=''):
+        # Скрипты и стили get_text не учитывает - убираем их из поддерева
+        for skipped in node.css(self.NON_TEXT):
+            skipped.decompose()
+        # text(strip=True) обрезает каждую строку, но оставляет пустые - их выкидываем сами
+        return _join_text(node.text(deep=True, separator='\x00', strip=True).split('\x00'), separator)
+
+    def catalog_page(self, html):
+        tree = LexborHTMLParser(html)
+
+        products = []
+        for product in tree.css(self.PRODUCTS):
+            brand_div = product.css_first(self.BRAND)
+            name_div = product.css_first(self.NAME)
+            link = product.css_first(self.PRODUCT_LINK)
+
+            if brand_div is not None and name_div is not None and link is not None and link.attributes.get('href'):
+                products.append({
+                    'brand': self._text(brand_div),
+                    'name': self._text(name_div),
+                    'product_url': urljoin(RANDEWOO_URL, link.attributes['href'])
+                })
+
+        total_pages = 1
+        pagination = tree.css_first(self.PAGER)
+        if pagination is not None:
+            for link in pagination.css(self.PAGER_LINKS):
+                data_page = link.attributes.get('data-page')
+                if data_page and data_page.isdigit():
+                    total_pages = max(total_pages, int(data_page))
+
+        return products, total_pages
+
+    def designer_links(self, html):
+        tree = LexborHTMLParser(html)
+        return [(link.attributes.get('href'), self._text(link)) for link in tree.css(self.PERFUME_LINKS)]
+
+    def iter_news_blocks(self, html):
+        tree = LexborHTMLParser(html)
+        for block in tree.css(self.NEWSLIST):
+            date_div = block.css_first(self.NEWS_DATE)
+            yield self._text(date_div) if date_div is not None else None, partial(self._news_fields, block)
+
+    def _news_fields(self, block):
+        title_tag = block.css_first('h4')
+        link_tag = block.css_first(self.NEWS_LINK)
+        author_tag = block.css_first('p')
+        return {
+            'title': self._text(title_tag) if title_tag is not None else None,
+            'href': link_tag.attributes.get('href') if link_tag is not None else None,
+            'author': self._text(author_tag) if author_tag is not None else None
+        }
+
+    def news_card(self, html):
+        tree = LexborHTMLParser(html)
+
+        card_div = tree.css_first(self.CARD_MAIN)
+        if card_div is None:
+            card_div = tree.css_first(self.CARD_ANY)
+        if card_div is None:
+            return None
+
+        images = [(img.attributes.get('src'), img.attributes.get('width')) for img in card_div.css('img')]
+        return {
+            'text': self._text(card_div, '\n'),
+            'images': images
+        }
+
+# ============================================================================
+# ВЫБОР ПАРСЕРА
+# ============================================================================
+
+_BACKEND_CLASSES = {
+    'selectolax': (SelectolaxBackend, LexborHTMLParser is not None),
+    'lxml': (LxmlBackend, etree is not None),
+    'bs4': (Bs4Backend, True),
+}
+
+_instances = {}
+_instances_lock = threading.Lock()
+
+
+def available_backends():
+    """Установленные парсеры, от быстрого к эталонному"""
+    return [name for name, (_, installed) in _BACKEND_CLASSES.items() if installed]
+
+
+def get_backend(name=None):
+    """Экземпляр парсера; неустановленный или неизвестный заменяется на bs4"""
+    name = name or HTML_BACKEND
+    if name == 'auto':
+        name = available_backends()[0]
+    if name not in _BACKEND_CLASSES or not _BACKEND_CLASSES[name][1]:
+        name = 'bs4'
+
+    with _instances_lock:
+        backend = _instances.get(name)
+        if backend is None:
+            backend = _instances[name] = _BACKEND_CLASSES[name][0]()
+    return backend
+
+
+def catalog_page(html, backend=None):
+    """Товары и число страниц каталога Randewoo"""
+    return get_backend(backend).catalog_page(html)
+
+
+def designer_links(html, backend=None):
+    """Ссылки на ароматы со страницы бренда Fragrantica: [(href, text)]"""
+    return get_backend(backend).designer_links(html)
+
+
+def iter_news_blocks(html, backend=None):
+    """Блоки новостей лениво: (дата, fields), заголовок/ссылка/автор - только при вызове fields()"""
+    return get_backend(backend).iter_news_blocks(html)
+
+
+def news_blocks(html, backend=None):
+    """Блоки новостей div.newslist со страницы аромата"""
+    return [{'date': date, **fields()} for date, fields in iter_news_blocks(html, backend)]
+
+
+def news_card(html, backend=None):
+    """Текст и картинки основного блока статьи (None - блока нет)"""
+    return get_backend(backend).news_card(html)
+
+
+# ============================================================================
+# ПОТОКОВЫЙ РАЗБОР СТРАНИЦ БРЕНДОВ
+# ============================================================================
+
+def iter_chunks(data, size=STREAM_CHUNK_SIZE):
+    """
+    Режет уже загруженный ответ на куски для потокового разбора.
+    Тело при этом целиком в памяти - экономится только дерево документа;
+    ответ из сети без буфера - response.iter_content(STREAM_CHUNK_SIZE)
+    """
+    for start in range(0, len(data), size):
+        yield data[start:start + size]
+
+
+def _drop_parsed(element):
+    """Удаляет разобранное: сам элемент и все, что стоит перед ним и его предками"""
+    element.clear()
+    for node in [element] + list(element.iterancestors()):
+        parent = node.getparent()
+        if parent is None:
+            break
+        while node.getprevious() is not None:
+            del parent[0]
+
+
+def _link_text(element, backend):
+    """Текст ссылки как get_text(strip=True); без скриптов внутри - быстрым itertext"""
+    if (next(element.iter(*NON_TEXT_TAGS), None) is None
+            and next(element.iterancestors(*NON_TEXT_TAGS), None) is None):
+        return _join_text(element.itertext(), '')
+    return backend._text(element)
+
+
+def _collect_perfume_links(parser, backend, links, open_links):
+    """
+    Забирает готовые события парсера (только теги <a>). После каждой ссылки
+    вне ссылок на ароматы разобранная часть документа удаляется -
+    в памяти остается путь до текущего узла и хвост после последней ссылки
+    """
+    for event, element in parser.read_events():
+        is_link = '/perfume/' in (element.get('href') or '')
+
+        if event == 'start':
+            if is_link:
+                open_links += 1
+            continue
+
+        if is_link:
+            links.append((element.get('href'), _link_text(element, backend)))
+            open_links -= 1
+
+        if open_links == 0:
+            _drop_parsed(element)
+
+    return open_links
+
+
+def designer_links_stream(chunks):
+    """
+    Ссылки на ароматы со страницы бренда: [(href, text)], как designer_links.
+    chunks - куски ответа (bytes или str) по мере получения; полное дерево
+    документа не строится. Совпадение с bs4 проверяет check_html_extract.py
+    (fixtures/html/designer). Без lxml или при HTML_BACKEND = 'bs4' - обычный
+    разбор целиком выбранным парсером
+    """
+    if etree is None or get_backend().name == 'bs4':
+        data = b''.join(chunk.encode('utf-8') if isinstance(chunk, str) else chunk for chunk in chunks)
+        return designer_links(data.decode('utf-8', errors='replace'))
+
+    backend = get_backend('lxml')
+    parser = etree.HTMLPullParser(events=('start', 'end'), tag='a', encoding='utf-8')
+
+    links = []
+    open_links = 0
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode('utf-8')
+        parser.feed(chunk)
+        open_links = _collect_perfume_links(parser, backend, links, open_links)
+
+    parser.close()
+    _collect_perfume_links(parser, backend, links, open_links)
+    return links
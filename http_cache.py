@@ -0,0 +1,259 @@
+import hashlib
+import sqlite3
+import threading
+import time
+import zlib
+
+from fetcher import get_scraper
+
+# ============================================================================
+# НАСТРОЙКИ
+# ============================================================================
+
+CACHE_DB_PATH = 'http_cache.db'
+
+HOUR = 3600
+DAY = 24 * HOUR
+
+# Классы URL: (название, признак в URL, TTL в секундах)
+URL_CLASSES = [
+    ('catalog', 'randewoo.ru/category/', 6 * HOUR),
+    ('designer', '/designers/', 7 * DAY),
+    ('perfume', '/perfume/', 3 * DAY),
+    ('news', '/news/', 30 * DAY),
+]
+
+# Кешируем успешные ответы и 404 (несуществующие страницы брендов)
+CACHEABLE_STATUSES = (200, 404)
+
+# ============================================================================
+# ОТВЕТ ИЗ КЕША
+# ============================================================================
+
+class CachedResponse:
+    """Минимальная замена requests.Response для ответов из кеша"""
+
+    def __init__(self, url, status_code, content, headers=None, from_cache=True):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+        self.encoding = 'utf-8'
+        self.from_cache = from_cache
+
+    @property
+    def ok(self):
+        return self.status_code < 400
+
+    @property
+    def text(self):
+        return self.content.decode(self.encoding or 'utf-8', errors='replace')
+
+    def raise_for_status(self):
+        if not self.ok:
+            raise RuntimeError(f"HTTP {self.status_code} для {self.url}")
+
+    def close(self):
+        pass
+
+# ============================================================================
+# ХРАНИЛИЩЕ
+# ============================================================================
+
+_conn = None
+_lock = threading.Lock()
+
+stats = {
+    'hits': 0,          # Свежий ответ из кеша, без сети
+    'revalidated': 0,   # 304 Not Modified
+    'network': 0,       # Запросов в сеть (включая условные)
+    'stored': 0         # Сохранено новых ответов
+}
+
+
+def _count(key):
+    with _lock:
+        stats[key] += 1
+
+
+def _get_conn():
+    global _conn
+    if _conn is None:
+        _conn = sqlite3.connect(CACHE_DB_PATH, check_same_thread=False, timeout=30)
+        _conn.execute('PRAGMA journal_mode=WAL')
+        _conn.execute('''
+            CREATE TABLE IF NOT EXISTS http_bodies (
+                hash TEXT PRIMARY KEY,
+                body BLOB NOT NULL
+            )
+        ''')
+        _conn.execute('''
+            CREATE TABLE IF NOT EXISTS http_responses (
+                url TEXT PRIMARY KEY,
+                url_class TEXT NOT NULL,
+                status INTEGER NOT NULL,
+                body_hash TEXT,
+                etag TEXT,
+                last_modified TEXT,
+                fetched_at REAL NOT NULL
+            )
+        ''')
+        _conn.commit()
+    return _conn
+
+
+def classify_url(url):
+    """Возвращает (класс, TTL) для URL или (None, None), если URL не кешируется"""
+    for url_class, marker, ttl in URL_CLASSES:
+        if marker in url:
+            return url_class, ttl
+    return None, None
+
+
+def _lookup(url):
+    with _lock:
+        row = _get_conn().execute('''
+            SELECT r.status, r.etag, r.last_modified, r.fetched_at, b.body
+            FROM http_responses r
+            LEFT JOIN http_bodies b ON b.hash = r.body_hash
+            WHERE r.url = ?
+        ''', (url,)).fetchone()
+
+    if not row:
+        return None
+
+    status, etag, last_modified, fetched_at, body = row
+    return {
+        'status': status,
+        'etag': etag,
+        'last_modified': last_modified,
+        'fetched_at': fetched_at,
+        'content': zlib.decompress(body) if body else b''
+    }
+
+
+def _store(url, url_class, status, content, etag, last_modified):
+    body_hash = hashlib.sha256(content).hexdigest() if content else None
+
+    with _lock:
+        conn = _get_conn()
+        old = conn.execute('SELECT body_hash FROM http_responses WHERE url = ?', (url,)).fetchone()
+
+        if body_hash:
+            conn.execute('INSERT OR IGNORE INTO http_bodies (hash, body) VALUES (?, ?)',
+                         (body_hash, zlib.compress(content)))
+
+        conn.execute('''
+            INSERT OR REPLACE INTO http_responses
+            (url, url_class, status, body_hash, etag, last_modified, fetched_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        ''', (url, url_class, status, body_hash, etag, last_modified, time.time()))
+
+        # Удаляем тело, на которое больше никто не ссылается
+        if old and old[0] and old[0] != body_hash:
+            conn.execute('''
+                DELETE FROM http_bodies WHERE hash = ?
+                AND NOT EXISTS (SELECT 1 FROM http_responses WHERE body_hash = ?)
+            ''', (old[0], old[0]))
+
+        conn.commit()
+        stats['stored'] += 1
+
+
+def _touch(url):
+    with _lock:
+        conn = _get_conn()
+        conn.execute('UPDATE http_responses SET fetched_at = ? WHERE url = ?', (time.time(), url))
+        conn.commit()
+
+
+def saved_pages(url_class, limit=None):
+    """
+    Сохраненные страницы класса (200, с телом) для проверок и бенчмарков.
+    Возвращает [(url, html)]
+    """
+    query = '''
+        SELECT r.url, b.body FROM http_responses r
+        JOIN http_bodies b ON b.hash = r.body_hash
+        WHERE r.url_class = ? AND r.status = 200
+        ORDER BY r.url
+    '''
+    params = [url_class]
+    if limit:
+        query += ' LIMIT ?'
+        params.append(limit)
+
+    with _lock:
+        rows = _get_conn().execute(query, params).fetchall()
+    return [(url, zlib.decompress(body).decode('utf-8', errors='replace')) for url, body in rows]
+
+# ============================================================================
+# ЗАПРОСЫ ЧЕРЕЗ КЕШ
+# ============================================================================
+
+def is_fresh(url):
+    """True, если для URL есть свежий ответ и сеть не понадобится"""
+    _, ttl = classify_url(url)
+    if ttl is None:
+        return False
+    cached = _lookup(url)
+    return bool(cached) and time.time() - cached['fetched_at'] < ttl
+
+
+def cached_get(url, scraper=None, timeout=30, **kwargs):
+    """
+    GET через кеш на диске.
+    Свежий ответ отдается без сети, устаревший - перепроверяется
+    условным запросом (If-None-Match / If-Modified-Since).
+    """
+    if scraper is None:
+        scraper = get_scraper(url)
+
+    url_class, ttl = classify_url(url)
+    if url_class is None:
+        _count('network')
+        return scraper.get(url, timeout=timeout, **kwargs)
+
+    cached = _lookup(url)
+    if cached and time.time() - cached['fetched_at'] < ttl:
+        _count('hits')
+        return CachedResponse(url, cached['status'], cached['content'])
+
+    headers = dict(kwargs.pop('headers', None) or {})
+    if cached and cached['status'] == 200:
+        if cached['etag']:
+            headers['If-None-Match'] = cached['etag']
+        if cached['last_modified']:
+            headers['If-Modified-Since'] = cached['last_modified']
+
+    _count('network')
+    response = scraper.get(url, timeout=timeout, headers=headers, **kwargs)
+
+    if response.status_code == 304 and cached:
+        _count('revalidated')
+        _touch(url)
+        return CachedResponse(url, cached['status'], cached['content'])
+
+    # cacheable=False - ответ-заглушка (например, проверка Cloudflare, см. hybrid_fetch)
+    if response.status_code in CACHEABLE_STATUSES and getattr(response, 'cacheable', True):
+        content = response.content if response.status_code == 200 else b''
+        _store(url, url_class, response.status_code, content,
+               response.headers.get('ETag'), response.headers.get('Last-Modified'))
+        return CachedResponse(url, response.status_code, content,
+                              dict(response.headers), from_cache=False)
+
+    return response
+
+
+def print_stats():
+    """Печатает статистику кеша"""
+    total = stats['hits'] + stats['network']
+    if not total:
+        return
+
+    print(f"\n{'='*80}")
+    print("HTTP КЕШ:")
+    print(f"  Из кеша без сети: {stats['hits']} ({stats['hits']/total*100:.1f}%)")
+    print(f"  Запросов в сеть: {stats['network']} (304 Not Modified: {stats['revalidated']})")
+    print(f"  Сохранено ответов: {stats['stored']}")
+    print(f"{'='*80}")
@@ -0,0 +1,195 @@
+import threading
+from functools import partial
+from urllib.parse import urlparse
+
+from cloudscraper.exceptions import CloudflareException
+
+from browser_pool import ALLOWED_DOMAINS, DriverPool, create_driver
+from fetcher import get_scraper
+from http_cache import CachedResponse
+
+# ============================================================================
+# НАСТРОЙКИ
+# ============================================================================
+
+HYBRID_BROWSER_WORKERS = 1   # Браузеров для запасного пути (запускаются при первом challenge)
+
+# Признаки страницы Cloudflare вместо контента
+CHALLENGE_STATUSES = (403, 429, 503)
+CHALLENGE_MARKERS = (b'_cf_chl_opt', b'<title>Just a moment...</title>')
+
+# Страницы, которые без товаров считаются недогруженными (контент рисует JS):
+# признак в URL -> (маркер в HTML, CSS-селектор, которого ждет браузер)
+READY_MARKERS = {
+    'randewoo.ru/category/': (b'products__item', 'li.products__item'),
+}
+
+# ============================================================================
+# РАСПОЗНАВАНИЕ
+# ============================================================================
+
+def is_challenge(response):
+    """True, если вместо страницы пришла проверка Cloudflare"""
+    if response.headers.get('cf-mitigated') == 'challenge':
+        return True
+    if response.status_code in CHALLENGE_STATUSES and 'cloudflare' in response.headers.get('Server', '').lower():
+        return True
+    content = response.content or b''
+    return any(marker in content for marker in CHALLENGE_MARKERS)
+
+
+def fallback_reason(url, response):
+    """Почему ответ HTTP-пути не годится: 'challenge', 'empty' или None"""
+    if is_challenge(response):
+        return 'challenge'
+    if response.status_code == 200:
+        for url_part, (marker, _) in READY_MARKERS.items():
+            if url_part in url and marker not in (response.content or b''):
+                return 'empty'
+    return None
+
+
+def ready_selector(url):
+    """Чего ждать в браузере: селектор контента или None (только конец проверки Cloudflare)"""
+    for url_part, (_, selector) in READY_MARKERS.items():
+        if url_part in url:
+            return selector
+    return None
+
+# ============================================================================
+# ГИБРИДНЫЙ SCRAPER
+# ============================================================================
+
+_pools = {}   # host -> DriverPool
+_pool_lock = threading.Lock()
+_lock = threading.Lock()
+_hybrid = {}   # (host, proxy) -> HybridScraper
+
+stats = {}     # host -> {'http', 'browser', 'challenge', 'empty', 'failed'}
+
+
+def _count(host, *keys):
+    with _lock:
+        host_stats = stats.setdefault(host, {'http': 0, 'browser': 0, 'challenge': 0, 'empty': 0, 'failed': 0})
+        for key in keys:
+            host_stats[key] += 1
+
+
+def allowed_domains(url):
+    """
+    Домены, которые резолвит экономный браузер для этого URL: сам хост
+    (без www.) и проверка Cloudflare. Иначе fragrantica.ru попала бы под MAP * ~NOTFOUND
+    """
+    host = urlparse(url).netloc
+    if host.startswith('www.'):
+        host = host[4:]
+    return tuple(dict.fromkeys(ALLOWED_DOMAINS + (host,)))
+
+
+def get_pool(url):
+    """Пул браузеров запасного пути для хоста url; Chrome стартует только при первой странице"""
+    host = urlparse(url).netloc
+    with _pool_lock:
+        pool = _pools.get(host)
+        if pool is None:
+            factory = partial(create_driver, allowed_domains=allowed_domains(url))
+            pool = DriverPool(HYBRID_BROWSER_WORKERS, driver_factory=factory, selector=None)
+            _pools[host] = pool
+        return pool
+
+
+class HybridScraper:
+    """
+    Обертка над общим scraper хоста: сначала дешевый HTTP-запрос,
+    браузер - только для URL, где пришел challenge или пустой список товаров.
+    Куки браузера (cf_clearance) и его User-Agent переходят в HTTP-сессию,
+    так что следующие запросы снова идут без браузера.
+    Остальные атрибуты (headers, cookies) - от scraper, поэтому обертку
+    можно передавать в cached_get и crawl_catalog вместо scraper
+    """
+
+    def __init__(self, scraper):
+        self.scraper = scraper
+
+    def __getattr__(self, name):
+        return getattr(self.scraper, name)
+
+    def get(self, url, **kwargs):
+        host = urlparse(url).netloc
+        try:
+            response = self.scraper.get(url, **kwargs)
+            reason = fallback_reason(url, response)
+        except CloudflareException as e:
+            response = None
+            reason = 'challenge'
+            print(f"  ⚠ Cloudflare: {e}")
+
+        if reason is None:
+            _count(host, 'http')
+            return response
+
+        print(f"  🌐 Браузер ({'проверка Cloudflare' if reason == 'challenge' else 'нет товаров'}): {url}",
+              flush=True)
+        try:
+            html, cookies, user_agent = get_pool(url).fetch(url, selector=ready_selector(url))
+        except Exception as e:
+            _count(host, reason, 'failed')
+            print(f"  ✗ Браузер не помог: {e}")
+            if response is None:
+                raise
+            # Страница проверки или пустой список - не в кеш, следующий запуск попробует снова
+            response.cacheable = False
+            return response
+
+        self._share_cookies(cookies, user_agent)
+        _count(host, reason, 'browser')
+        return CachedResponse(url, 200, html.encode('utf-8'), from_cache=False)
+
+    def _share_cookies(self, cookies, user_agent):
+        # cf_clearance действует только с тем же User-Agent
+        if user_agent:
+            self.scraper.headers['User-Agent'] = user_agent
+        for cookie in cookies:
+            self.scraper.cookies.set(cookie['name'], cookie['value'],
+                                     domain=cookie.get('domain'), path=cookie.get('path', '/'))
+
+
+def get_hybrid_scraper(url, proxy=None):
+    """HybridScraper поверх общего scraper хоста (один на хост и прокси)"""
+    key = (urlparse(url).netloc, proxy)
+    with _lock:
+        hybrid = _hybrid.get(key)
+        if hybrid is None:
+            hybrid = HybridScraper(get_scraper(url, proxy))
+            _hybrid[key] = hybrid
+    return hybrid
+
+
+def close():
+    """Закрывает браузеры запасного пути, если они запускались"""
+    with _pool_lock:
+        for pool in _pools.values():
+            pool.close()
+        _pools.clear()
+
+
+def print_stats():
+    """Доля страниц, отданных HTTP-путем и браузером"""
+    with _lock:
+        hosts = {host: dict(values) for host, values in stats.items()}
+    if not hosts:
+        return
+
+    print(f"\n{'='*80}")
+    print("ГИБРИДНАЯ ЗАГРУЗКА:")
+    for host, values in hosts.items():
+        total = values['http'] + values['browser'] + values['failed']
+        if not total:
+            continue
+        print(f"  {host}: {total} страниц")
+        print(f"    HTTP: {values['http']} ({values['http']/total*100:.1f}%), "
+              f"браузер: {values['browser']} ({values['browser']/total*100:.1f}%), "
+              f"не загружено: {values['failed']}")
+        if values['challenge'] or values['empty']:
+            print(f"    Причины: проверка Cloudflare {values['challenge']}, пустой список товаров {values['empty']}")
+    print(f"{'='*80}")
@@ -0,0 +1,313 @@
+import asyncio
+import hashlib
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+from catalog_crawler import HostLimiter
+from fetcher import get_scraper
+
+# ============================================================================
+# НАСТРОЙКИ
+# ============================================================================
+
+DB_PATH = 'fragrantica_news.db'
+IMAGES_DIR = 'images'
+
+IMAGE_CONCURRENCY = 4     # Одновременных скачиваний с одного хоста
+IMAGE_RATE = 4.0          # Запросов в секунду к одному хосту
+IMAGE_BURST = 4
+REVALIDATE_DAYS = 30      # Известный URL проверяется HEAD-запросом не чаще раза в N дней
+CHUNK_SIZE = 64 * 1024    # Байт на запись во временный файл
+
+IMAGE_EXTENSIONS = ('jpg', 'jpeg', 'png', 'gif', 'webp')
+CONTENT_TYPE_EXTENSIONS = {'image/png': 'png', 'image/gif': 'gif', 'image/webp': 'webp'}
+
+DAY = 24 * 3600
+
+# ============================================================================
+# ТАБЛИЦЫ
+# ============================================================================
+
+def create_tables(conn):
+    """
+    image_blobs - файлы по хешу содержимого (BLAKE2b), один файл на картинку;
+    image_urls - какой URL ведет на какой файл, с ETag для проверки без скачивания
+    """
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS image_blobs (
+            hash TEXT PRIMARY KEY,
+            path TEXT NOT NULL,
+            size INTEGER NOT NULL,
+            created_at REAL NOT NULL
+        )
+    ''')
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS image_urls (
+            url TEXT PRIMARY KEY,
+            host TEXT NOT NULL,
+            blob_hash TEXT NOT NULL,
+            etag TEXT,
+            last_modified TEXT,
+            checked_at REAL NOT NULL
+        )
+    ''')
+    conn.commit()
+
+# ============================================================================
+# СТАТИСТИКА
+# ============================================================================
+
+_lock = threading.Lock()        # Проверка "такой файл уже есть" + запись - атомарно между потоками
+_tables_ready = False
+
+stats = {
+    'requested': 0,     # Уникальных URL запрошено
+    'cached': 0,        # Известный URL, проверен недавно - без сети
+    'head_skips': 0,    # HEAD/ETag: картинка не менялась, тело не качали
+    'downloaded': 0,    # Новых файлов
+    'dedup_hits': 0,    # Скачано, но такое содержимое уже есть (другой URL той же картинки)
+    'bytes': 0,         # Байт скачано
+    'dedup_bytes': 0,   # Байт не записано на диск повторно
+    'failed': 0,
+    'elapsed': 0.0,     # Время пакетных скачиваний
+}
+
+
+def _count(key, value=1):
+    with _lock:
+        stats[key] += value
+
+
+def _connect():
+    global _tables_ready
+    conn = sqlite3.connect(DB_PATH, timeout=30)
+    if not _tables_ready:
+        create_tables(conn)
+        _tables_ready = True
+    return conn
+
+# ============================================================================
+# ОДНА КАРТИНКА
+# ============================================================================
+
+def _extension(url, content_type=None):
+    extension = url.split('.')[-1].split('?')[0][:4].lower()
+    if extension in IMAGE_EXTENSIONS:
+        return extension
+    return CONTENT_TYPE_EXTENSIONS.get((content_type or '').split(';')[0].strip(), 'jpg')
+
+
+def _known(conn, url):
+    """(hash, etag, last_modified, checked_at, path) известного URL, если файл на месте"""
+    row = conn.execute('''
+        SELECT u.blob_hash, u.etag, u.last_modified, u.checked_at, b.path
+        FROM image_urls u JOIN image_blobs b ON b.hash = u.blob_hash
+        WHERE u.url = ?
+    ''', (url,)).fetchone()
+    if row and os.path.exists(row[4]):
+        return row
+    return None
+
+
+def _unchanged(scraper, url, etag, last_modified):
+    """HEAD с условными заголовками: True - картинка та же, скачивать не нужно"""
+    if not etag and not last_modified:
+        return False
+    headers = {}
+    if etag:
+        headers['If-None-Match'] = etag
+    if last_modified:
+        headers['If-Modified-Since'] = last_modified
+    try:
+        response = scraper.head(url, timeout=15, headers=headers, allow_redirects=True)
+    except Exception:
+        return False
+    if response.status_code == 304:
+        return True
+    if response.status_code != 200:
+        return False
+    if etag:
+        return response.headers.get('ETag') == etag
+    return response.headers.get('Last-Modified') == last_modified
+
+
+def _remember_url(conn, url, digest, etag, last_modified):
+    conn.execute('''
+        INSERT OR REPLACE INTO image_urls (url, host, blob_hash, etag, last_modified, checked_at)
+        VALUES (?, ?, ?, ?, ?, ?)
+    ''', (url, urlparse(url).netloc, digest, etag, last_modified, time.time()))
+    conn.commit()
+
+
+def _stream_to_temp(response, images_dir):
+    """Тело ответа - во временный файл кусками, хеш считается по ходу. (hash, size, путь)"""
+    hasher = hashlib.blake2b(digest_size=16)
+    size = 0
+    fd, temp_path = tempfile.mkstemp(suffix='.part', dir=images_dir)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                if chunk:
+                    hasher.update(chunk)
+                    f.write(chunk)
+                    size += len(chunk)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+    return hasher.hexdigest(), size, temp_path
+
+
+def _store_blob(conn, digest, size, temp_path, extension, images_dir):
+    """Файл по хешу: такое содержимое уже есть - временный файл удаляется"""
+    with _lock:
+        row = conn.execute('SELECT path FROM image_blobs WHERE hash = ?', (digest,)).fetchone()
+        if row and os.path.exists(row[0]):
+            os.remove(temp_path)
+            stats['dedup_hits'] += 1
+            stats['dedup_bytes'] += size
+            return row[0]
+
+        path = os.path.join(images_dir, f"{digest}.{extension}")
+        os.replace(temp_path, path)
+        conn.execute('INSERT OR REPLACE INTO image_blobs (hash, path, size, created_at) VALUES (?, ?, ?, ?)',
+                     (digest, path, size, time.time()))
+        conn.commit()
+        stats['downloaded'] += 1
+        return path
+
+
+def fetch_image(url, images_dir=IMAGES_DIR):
+    """
+    Путь к файлу картинки (None - не удалось). Потокобезопасна.
+    Известный URL проверяется HEAD-запросом, одинаковое содержимое
+    с разных URL (варианты CDN, ресайз в query) хранится одним файлом
+    """
+    _count('requested')
+    return _fetch(url, images_dir)
+
+
+def _fetch(url, images_dir):
+    """fetch_image без учета в 'requested': URL пакета считает fetch_images_async"""
+    conn = _connect()
+    try:
+        scraper = get_scraper(url)
+        known = _known(conn, url)
+        if known:
+            digest, etag, last_modified, checked_at, path = known
+            if time.time() - checked_at < REVALIDATE_DAYS * DAY:
+                _count('cached')
+                return path
+            if _unchanged(scraper, url, etag, last_modified):
+                conn.execute('UPDATE image_urls SET checked_at = ? WHERE url = ?', (time.time(), url))
+                conn.commit()
+                _count('head_skips')
+                return path
+
+        response = scraper.get(url, timeout=30, stream=True)
+        try:
+            response.raise_for_status()
+            # ETag уникален только для своего URL (nginx строит его из mtime и размера) -
+            # храним для перепроверки этого же URL, одинаковость картинок - только по хешу
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            digest, size, temp_path = _stream_to_temp(response, images_dir)
+        finally:
+            response.close()
+
+        _count('bytes', size)
+        path = _store_blob(conn, digest, size, temp_path, _extension(url, response.headers.get('Content-Type')),
+                           images_dir)
+        _remember_url(conn, url, digest, etag, last_modified)
+        return path
+
+    except Exception as e:
+        _count('failed')
+        print(f"    ✗ Ошибка скачивания {url[:50]}: {e}")
+        return None
+    finally:
+        conn.close()
+
+# ============================================================================
+# ПУЛ СКАЧИВАНИЙ
+# ============================================================================
+
+def _fresh_paths(urls):
+    """Известные и недавно проверенные URL - сразу, без очереди к хостам"""
+    conn = _connect()
+    try:
+        paths = {}
+        for url in urls:
+            known = _known(conn, url)
+            if known and time.time() - known[3] < REVALIDATE_DAYS * DAY:
+                paths[url] = known[4]
+        return paths
+    finally:
+        conn.close()
+
+
+async def _fetch_one(limiter, executor, url, images_dir):
+    loop = asyncio.get_running_loop()
+    semaphore, bucket = limiter.for_host(urlparse(url).netloc)
+    async with semaphore:
+        await bucket.acquire()
+        return url, await loop.run_in_executor(executor, _fetch, url, images_dir)
+
+
+async def fetch_images_async(urls, images_dir=IMAGES_DIR, concurrency=IMAGE_CONCURRENCY,
+                             rate=IMAGE_RATE, burst=IMAGE_BURST):
+    """
+    Скачивает картинки параллельно: до concurrency одновременно и не больше
+    rate в секунду на каждый хост. Возвращает {url: путь или None}
+    """
+    unique = list(dict.fromkeys(url for url in urls if url))
+    if not unique:
+        return {}
+    os.makedirs(images_dir, exist_ok=True)
+    start_time = time.time()
+
+    # Каждый URL учитывается один раз: свежие - здесь, остальные - исходом _fetch
+    paths = _fresh_paths(unique)
+    _count('requested', len(unique))
+    _count('cached', len(paths))
+
+    pending = [url for url in unique if url not in paths]
+    if pending:
+        hosts = {urlparse(url).netloc for url in pending}
+        limiter = HostLimiter(concurrency, rate, burst)
+        with ThreadPoolExecutor(max_workers=concurrency * len(hosts)) as executor:
+            results = await asyncio.gather(*(_fetch_one(limiter, executor, url, images_dir) for url in pending))
+        paths.update(results)
+
+    _count('elapsed', time.time() - start_time)
+    return paths
+
+
+def fetch_images(urls, images_dir=IMAGES_DIR, concurrency=IMAGE_CONCURRENCY, rate=IMAGE_RATE, burst=IMAGE_BURST):
+    """Синхронная обертка над fetch_images_async"""
+    return asyncio.run(fetch_images_async(urls, images_dir, concurrency, rate, burst))
+
+
+def print_stats():
+    """Скачано, проверено без скачивания, сэкономлено дедупликацией"""
+    with _lock:
+        values = dict(stats)
+    if not values['requested'] and not values['downloaded']:
+        return
+
+    resolved = values['requested'] - values['failed']
+    print(f"\n{'='*80}")
+    print("ИЗОБРАЖЕНИЯ:")
+    print(f"  URL: {values['requested']}, без сети: {values['cached']}, "
+          f"HEAD/ETag без скачивания: {values['head_skips']}")
+    print(f"  Новых файлов: {values['downloaded']}, скачано {values['bytes']/1024/1024:.1f} МБ, "
+          f"ошибок: {values['failed']}")
+    print(f"  Дедупликация: {values['dedup_hits']} повторов содержимого, "
+          f"{values['dedup_bytes']/1024/1024:.2f} МБ не записано повторно")
+    if values['elapsed']:
+        print(f"  Скорость: {resolved/values['elapsed']:.1f} изображений/сек")
+    print(f"{'='*80}")
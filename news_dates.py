@@ -0,0 +1,128 @@
+import threading
+from datetime import datetime
+from functools import lru_cache
+
+# ============================================================================
+# НАСТРОЙКИ
+# ============================================================================
+
+# Окно дат новостей по умолчанию: [NEWS_SINCE, NEWS_UNTIL), None - без границы
+NEWS_SINCE = datetime(2025, 1, 1)
+NEWS_UNTIL = datetime(2026, 1, 1)
+
+DATE_CACHE_SIZE = 16384  # Разных строк дат в LRU: одни и те же новости есть на многих страницах
+
+# ============================================================================
+# РАЗБОР ДАТЫ
+# ============================================================================
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def parse_news_date(date_str):
+    """
+    Дата блока новости Fragrantica: '07/27/25 03:05' или '07/27/2025 03:05'.
+    Без strptime - разбор по разделителям; год из двух цифр - как %y
+    (69-99 -> 19xx, 00-68 -> 20xx). None - строка не похожа на дату
+    """
+    try:
+        day_part, time_part = date_str.split()
+        month, day, year = day_part.split('/')
+        hour, minute = time_part.split(':')
+        full_year = int(year)
+        if len(year) == 2:
+            full_year += 1900 if full_year >= 69 else 2000
+        return datetime(full_year, int(month), int(day), int(hour), int(minute))
+    except (ValueError, AttributeError):
+        return None
+
+
+def parse_window_date(value):
+    """Граница окна из командной строки: 'YYYY-MM-DD' или 'YYYY'"""
+    if len(value) == 4:
+        return datetime(int(value), 1, 1)
+    return datetime.strptime(value, '%Y-%m-%d')
+
+# ============================================================================
+# ФИЛЬТР ПО ОКНУ ДАТ
+# ============================================================================
+
+_lock = threading.Lock()
+stats = {
+    'pages': 0,        # Страниц через фильтр
+    'blocks': 0,       # Просмотрено блоков
+    'kept': 0,         # В окне - разобраны полностью
+    'skipped': 0,      # Вне окна или без даты - заголовок, ссылка и автор не разбирались
+    'early_stops': 0,  # Страниц, где просмотр остановлен на первой старой новости
+}
+
+
+def news_in_window(blocks, since=NEWS_SINCE, until=NEWS_UNTIL):
+    """
+    Блоки новостей с датой в [since, until): [(datetime, fields())].
+    blocks - (строка даты, fields) как из html_extract.iter_news_blocks;
+    fields() вызывается только для новостей из окна.
+    Новости на странице идут от новых к старым: пока порядок не нарушен,
+    первая новость старше since заканчивает просмотр страницы
+    """
+    result = []
+    counts = {'blocks': 0, 'kept': 0, 'skipped': 0}
+    early_stop = False
+    previous = None
+    ordered = True
+
+    for date_str, fields in blocks:
+        counts['blocks'] += 1
+        news_date = parse_news_date(date_str) if date_str else None
+        if news_date is None:
+            counts['skipped'] += 1
+            continue
+
+        if previous is not None and news_date > previous:
+            ordered = False
+        previous = news_date
+
+        if since is not None and news_date < since:
+            counts['skipped'] += 1
+            if ordered:
+                early_stop = True
+                break
+            continue
+        if until is not None and news_date >= until:
+            counts['skipped'] += 1
+            continue
+
+        counts['kept'] += 1
+        result.append((news_date, fields()))
+
+    with _lock:
+        stats['pages'] += 1
+        for key, value in counts.items():
+            stats[key] += value
+        if early_stop:
+            stats['early_stops'] += 1
+    return result
+
+
+def describe_window(since=NEWS_SINCE, until=NEWS_UNTIL):
+    """Окно дат для вывода: '2025-01-01 … 2026-01-01'"""
+    left = since.strftime('%Y-%m-%d') if since else '…'
+    right = until.strftime('%Y-%m-%d') if until else '…'
+    return f"{left} … {right}"
+
+
+def print_stats():
+    """Сколько блоков новостей отброшено по дате без полного разбора"""
+    with _lock:
+        values = dict(stats)
+    if not values['pages']:
+        return
+
+    cache = parse_news_date.cache_info()
+    lookups = cache.hits + cache.misses
+    print(f"\n{'='*80}")
+    print("ФИЛЬТР НОВОСТЕЙ ПО ДАТЕ:")
+    print(f"  Страниц: {values['pages']}, блоков просмотрено: {values['blocks']}")
+    print(f"  В окне: {values['kept']}, пропущено без разбора: {values['skipped']}")
+    print(f"  Ранняя остановка: {values['early_stops']} страниц")
+    if lookups:
+        print(f"  Кеш дат: {cache.hits}/{lookups} ({cache.hits/lookups*100:.1f}%) из кеша")
+    print(f"{'='*80}")
@@ -1,11 +1,12 @@
 import sqlite3
-import cloudscraper
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
 import sys
 import io
 import time
 import os
+from fetcher import get_scraper, print_stats
+import html_extract
 
 # Фикс кодировки для Windows консоли
 if sys.platform == 'win32':
@@ -34,13 +35,7 @@ def parse_news():
     """Парсит новости с главной страницы Fragrantica"""
     url = 'https://www.fragrantica.ru/'
     
-    scraper = cloudscraper.create_scraper(
-        browser={
-            'browser': 'chrome',
-            'platform': 'windows',
-            'mobile': False
-        }
-    )
+    scraper = get_scraper(url)
     
     print(f"Загружаю страницу {url}...")
     time.sleep(1)
@@ -84,19 +79,12 @@ def parse_full_news(url, scraper):
         response.raise_for_status()
         response.encoding = 'utf-8'
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        # Основной div.card статьи (style="width: 100%; position: relative;"), иначе любой card
+        card = html_extract.news_card(response.text)
         
-        # Ищем div с классом card и style="width: 100%; position: relative;"
-        card_div = soup.find('div', class_='card', style=lambda value: value and 'width: 100%' in value and 'position: relative' in value)
-        
-        if not card_div:
-            # Если не найден точный div, попробуем найти любой card на странице новости
-            card_div = soup.find('div', class_='card')
-        
-        if card_div:
-            # Извлекаем только текст без HTML разметки
-            text = card_div.get_text(separator='\n', strip=True)
-            return text
+        if card:
+            # Только текст без HTML разметки
+            return card['text']
         else:
             return None
                 
@@ -113,13 +101,7 @@ def save_to_database(conn, news_list, parse_full_text=True):
     
     scraper = None
     if parse_full_text:
-        scraper = cloudscraper.create_scraper(
-            browser={
-                'browser': 'chrome',
-                'platform': 'windows',
-                'mobile': False
-            }
-        )
+        scraper = get_scraper('https://www.fragrantica.ru')
     
     for idx, news in enumerate(news_list, 1):
         try:
@@ -171,6 +153,7 @@ def main():
         print(f"✗ Ошибка: {e}")
     finally:
         conn.close()
+        print_stats()
 
 if __name__ == '__main__':
     main()
@@ -1,9 +1,12 @@
 import sqlite3
-import cloudscraper
-from bs4 import BeautifulSoup
 import sys
 import io
 import time
+from fetcher import print_stats
+import html_extract
+import http_cache
+from http_cache import cached_get
+from db_writer import WriteBuffer
 
 # Фикс кодировки для Windows консоли
 if sys.platform == 'win32':
@@ -23,32 +26,17 @@ def get_news_without_full_text():
 
 def parse_full_news(url):
     """Парсит полный текст новости со страницы"""
-    scraper = cloudscraper.create_scraper(
-        browser={
-            'browser': 'chrome',
-            'platform': 'windows',
-            'mobile': False
-        }
-    )
-    
     try:
-        response = scraper.get(url, timeout=30)
+        response = cached_get(url, timeout=30)
         response.raise_for_status()
         response.encoding = 'utf-8'
         
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        # Ищем div с классом card и style="width: 100%; position: relative;"
-        card_div = soup.find('div', class_='card', style=lambda value: value and 'width: 100%' in value and 'position: relative' in value)
+        # Основной div.card статьи (style="width: 100%; position: relative;"), иначе любой card
+        card = html_extract.news_card(response.text)
         
-        if not card_div:
-            # Если не найден точный div, попробуем найти любой card на странице новости
-            card_div = soup.find('div', class_='card')
-        
-        if card_div:
-            # Извлекаем только текст без HTML разметки
-            text = card_div.get_text(separator='\n', strip=True)
-            return text
+        if card:
+            # Только текст без HTML разметки
+            return card['text']
         else:
             print(f"  ⚠ Не найден блок card на странице")
             return None
@@ -57,8 +45,12 @@ def parse_full_news(url):
         print(f"  ✗ Ошибка при парсинге: {e}")
         return None
 
-def update_news_full_text(news_id, full_text):
-    """Обновляет полный текст новости в базе"""
+def update_news_full_text(news_id, full_text, writer=None):
+    """Обновляет полный текст новости в базе (через буфер записи, если он передан)"""
+    if writer is not None:
+        writer.add('UPDATE news SET news_full = ? WHERE id = ?', (full_text, news_id))
+        return
+    
     conn = sqlite3.connect('fragrantica_news.db')
     cursor = conn.cursor()
     
@@ -81,26 +73,36 @@ def main():
     processed = 0
     failed = 0
     
+    # Тексты пишем пачками, а не коммитом на каждую новость
+    writer = WriteBuffer()
+    
     for news_id, title, url in news_list:
         print(f"[{processed + failed + 1}/{len(news_list)}] {title[:50]}...")
         
+        network_before = http_cache.stats['network']
         full_text = parse_full_news(url)
         
         if full_text:
-            update_news_full_text(news_id, full_text)
+            update_news_full_text(news_id, full_text, writer)
             processed += 1
             print(f"  ✓ Сохранено ({len(full_text)} символов)")
         else:
             failed += 1
             print(f"  ✗ Не удалось получить текст")
         
-        # Небольшая задержка между запросами
-        time.sleep(2)
+        # Небольшая задержка между запросами (только если был запрос в сеть)
+        if http_cache.stats['network'] > network_before:
+            time.sleep(2)
+    
+    writer.close()
     
     print(f"\n=== Результат ===")
     print(f"Обработано успешно: {processed}")
     print(f"Ошибок: {failed}")
     print(f"Всего: {len(news_list)}")
+    
+    print_stats()
+    http_cache.print_stats()
 
 if __name__ == '__main__':
     main()
@@ -1,13 +1,15 @@
 import sqlite3
-import cloudscraper
-from bs4 import BeautifulSoup
 import sys
 import io
 import time
 import os
 import json
 from urllib.parse import urljoin
-import hashlib
+from fetcher import print_stats
+import html_extract
+import http_cache
+import image_store
+from http_cache import cached_get
 
 # Фикс кодировки для Windows консоли
 if sys.platform == 'win32':
@@ -26,79 +28,39 @@ def get_news_without_images():
     return news_list
 
 def download_image(url, save_dir='images'):
-    """Скачивает изображение и возвращает путь к файлу"""
-    try:
-        # Создаем имя файла из URL (используем hash для уникальности)
-        url_hash = hashlib.md5(url.encode()).hexdigest()
-        extension = url.split('.')[-1].split('?')[0][:4]  # Берем расширение
-        if extension.lower() not in ['jpg', 'jpeg', 'png', 'gif', 'webp']:
-            extension = 'jpg'
-        
-        filename = f"{url_hash}.{extension}"
-        filepath = os.path.join(save_dir, filename)
-        
-        # Если уже скачано, пропускаем
-        if os.path.exists(filepath):
-            return filepath
-        
-        # Скачиваем
-        scraper = cloudscraper.create_scraper()
-        response = scraper.get(url, timeout=30, stream=True)
-        response.raise_for_status()
-        
-        # Сохраняем
-        with open(filepath, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
-        
-        return filepath
-        
-    except Exception as e:
-        print(f"    ✗ Ошибка скачивания {url[:50]}: {e}")
-        return None
+    """Скачивает изображение и возвращает путь к файлу (файлы по хешу содержимого, см. image_store)"""
+    return image_store.fetch_image(url, save_dir)
+
+def card_image_urls(card, page_url):
+    """Абсолютные URL картинок статьи без иконок (результат html_extract.news_card)"""
+    images = []
+    for img_url, width in card['images']:
+        if img_url:
+            # Преобразуем относительные URL в абсолютные
+            img_url = urljoin(page_url, img_url)
+            
+            # Пропускаем маленькие изображения (иконки и т.д.)
+            width = width or ''
+            if width and width.isdigit() and int(width) < 100:
+                continue
+            
+            images.append(img_url)
+    return images
 
 def parse_images_from_news(url):
     """Парсит изображения со страницы новости"""
-    scraper = cloudscraper.create_scraper(
-        browser={
-            'browser': 'chrome',
-            'platform': 'windows',
-            'mobile': False
-        }
-    )
-    
     try:
-        response = scraper.get(url, timeout=30)
+        response = cached_get(url, timeout=30)
         response.raise_for_status()
         response.encoding = 'utf-8'
         
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
         # Ищем основной div с новостью
-        card_div = soup.find('div', class_='card', style=lambda value: value and 'width: 100%' in value and 'position: relative' in value)
+        card = html_extract.news_card(response.text)
         
-        if not card_div:
-            card_div = soup.find('div', class_='card')
-        
-        if not card_div:
+        if not card:
             return []
         
-        # Ищем все изображения
-        images = []
-        for img in card_div.find_all('img'):
-            img_url = img.get('src')
-            if img_url:
-                # Преобразуем относительные URL в абсолютные
-                img_url = urljoin(url, img_url)
-                
-                # Пропускаем маленькие изображения (иконки и т.д.)
-                width = img.get('width', '')
-                if width and width.isdigit() and int(width) < 100:
-                    continue
-                
-                images.append(img_url)
-        
-        return images
+        return card_image_urls(card, url)
         
     except Exception as e:
         print(f"  ✗ Ошибка парсинга: {e}")
@@ -132,15 +94,15 @@ def process_news_images(news_id, title, url):
     
     print(f"  📸 Найдено изображений: {len(image_urls)}")
     
-    # Скачиваем изображения
+    # Скачиваем изображения параллельно (лимит запросов к хосту - в image_store)
+    paths = image_store.fetch_images(image_urls)
     downloaded = []
     for i, img_url in enumerate(image_urls, 1):
-        print(f"  [{i}/{len(image_urls)}] Скачиваю: {img_url[:60]}...")
-        filepath = download_image(img_url)
-        if filepath:
+        filepath = paths.get(img_url)
+        # Разные URL одной картинки - один файл, в новость он попадает один раз
+        if filepath and filepath not in downloaded:
             downloaded.append(filepath)
-            print(f"    ✓ Сохранено: {filepath}")
-        time.sleep(0.5)  # Небольшая задержка
+            print(f"  [{i}/{len(image_urls)}] ✓ {img_url[:60]} -> {filepath}")
     
     # Сохраняем в БД
     save_images_to_db(news_id, downloaded)
@@ -187,6 +149,10 @@ def main():
     print(f"Скачано изображений: {total_images}")
     print(f"Средне на новость: {total_images/processed:.1f}")
     print(f"{'='*80}\n")
+    
+    print_stats()
+    http_cache.print_stats()
+    image_store.print_stats()
 
 if __name__ == '__main__':
     main()
@@ -1,11 +1,13 @@
 import sqlite3
-import cloudscraper
 from bs4 import BeautifulSoup
 import sys
 import io
 import time
-from datetime import datetime
+from functools import partial
 from urllib.parse import urljoin
+from fetcher import get_scraper, print_stats
+import news_dates
+from news_dates import news_in_window, describe_window
 
 # Фикс кодировки для Windows консоли
 if sys.platform == 'win32':
@@ -39,28 +41,39 @@ def create_perfume_news_table():
     conn.commit()
     return conn
 
-def parse_date(date_str):
-    """
-    Парсит дату формата '07/27/25 03:05' в datetime объект
-    Возвращает None если не удалось распарсить
-    """
-    try:
-        # Формат: MM/DD/YY HH:MM
-        date_obj = datetime.strptime(date_str.strip(), '%m/%d/%y %H:%M')
-        return date_obj
-    except Exception as e:
+def _news_fields(block):
+    """Заголовок, ссылка и автор блока (None - блок не похож на новость)"""
+    # Заголовок и ссылка
+    link = block.find('a', href=lambda x: x and '/news/' in x)
+    if not link:
+        return None
+    
+    h4 = link.find('h4')
+    if not h4:
         return None
+    
+    # Автор
+    author = None
+    author_tag = block.find('i')
+    if author_tag:
+        author = author_tag.get_text(strip=True)
+    
+    return {
+        'title': h4.get_text(strip=True),
+        'url': urljoin('https://www.fragrantica.ru', link['href']),
+        'author': author
+    }
 
-def is_2025(date_obj):
-    """Проверяет, что дата относится к 2025 году"""
-    if date_obj is None:
-        return False
-    return date_obj.year == 2025
+def _news_blocks(soup):
+    """(дата, fields) по блокам newslist - остальное разбирается только для новостей из окна"""
+    for block in soup.find_all('div', class_='newslist'):
+        date_div = block.find('div', class_='right-bottom-corner-abs')
+        yield date_div.get_text(strip=True) if date_div else None, partial(_news_fields, block)
 
-def parse_perfume_news(scraper, fragrantica_url):
+def parse_perfume_news(scraper, fragrantica_url, since=news_dates.NEWS_SINCE, until=news_dates.NEWS_UNTIL):
     """
     Парсит новости со страницы аромата на Fragrantica
-    Возвращает список новостей за 2025 год
+    Возвращает список новостей за окно дат [since, until)
     """
     try:
         response = scraper.get(fragrantica_url, timeout=30)
@@ -68,52 +81,12 @@ def parse_perfume_news(scraper, fragrantica_url):
         
         soup = BeautifulSoup(response.text, 'html.parser')
         
-        # Ищем все блоки с новостями
-        news_blocks = soup.find_all('div', class_='newslist')
-        
         news_list = []
-        
-        for block in news_blocks:
-            try:
-                # Дата
-                date_div = block.find('div', class_='right-bottom-corner-abs')
-                if not date_div:
-                    continue
-                
-                date_str = date_div.get_text(strip=True)
-                date_obj = parse_date(date_str)
-                
-                # Проверяем, что дата в 2025 году
-                if not is_2025(date_obj):
-                    continue
-                
-                # Заголовок и ссылка
-                link = block.find('a', href=lambda x: x and '/news/' in x)
-                if not link:
-                    continue
-                
-                h4 = link.find('h4')
-                if not h4:
-                    continue
-                
-                title = h4.get_text(strip=True)
-                news_url = urljoin('https://www.fragrantica.ru', link['href'])
-                
-                # Автор
-                author = None
-                author_tag = block.find('i')
-                if author_tag:
-                    author = author_tag.get_text(strip=True)
-                
-                news_list.append({
-                    'title': title,
-                    'url': news_url,
-                    'date': date_obj.strftime('%Y-%m-%d %H:%M:%S'),
-                    'author': author
-                })
-                
-            except Exception as e:
+        for date_obj, news in news_in_window(_news_blocks(soup), since, until):
+            if news is None:
                 continue
+            news['date'] = date_obj.strftime('%Y-%m-%d %H:%M:%S')
+            news_list.append(news)
         
         return news_list
         
@@ -142,14 +115,8 @@ def process_all_perfumes():
     
     print(f"\nНайдено ароматов для обработки: {len(products)}\n")
     
-    # Создаем scraper
-    scraper = cloudscraper.create_scraper(
-        browser={
-            'browser': 'chrome',
-            'platform': 'windows',
-            'mobile': False
-        }
-    )
+    # Общий scraper хоста
+    scraper = get_scraper('https://www.fragrantica.ru')
     
     # Статистика
     total_news = 0
@@ -170,15 +137,6 @@ def process_all_perfumes():
         print(f"ПАКЕТ {current_batch}/{total_batches} (ароматы {batch_num + 1}-{min(batch_num + BATCH_SIZE, len(products))})")
         print(f"{'='*80}\n")
         
-        # Новый scraper для каждого пакета
-        scraper = cloudscraper.create_scraper(
-            browser={
-                'browser': 'chrome',
-                'platform': 'windows',
-                'mobile': False
-            }
-        )
-        
         for idx_in_batch, (product_id, brand, name, fragrantica_url) in enumerate(batch_products, 1):
             global_idx = batch_num + idx_in_batch
             
@@ -190,7 +148,7 @@ def process_all_perfumes():
                 
                 if news_list:
                     products_with_news += 1
-                    print(f"  ✓ Найдено новостей (2025): {len(news_list)}")
+                    print(f"  ✓ Найдено новостей ({describe_window()}): {len(news_list)}")
                     
                     # Сохраняем в БД
                     added = 0
@@ -215,7 +173,7 @@ def process_all_perfumes():
                             print(f"      - {news['title'][:60]}... ({news['date']})")
                 else:
                     products_without_news += 1
-                    print(f"  ⊘ Нет новостей за 2025 год")
+                    print(f"  ⊘ Нет новостей за {describe_window()}")
                 
                 # Пауза между запросами
                 time.sleep(0.5)
@@ -240,12 +198,15 @@ def process_all_perfumes():
     print(f"\n{'='*80}")
     print(f"РЕЗУЛЬТАТЫ:")
     print(f"  Обработано ароматов: {len(products)}")
-    print(f"  С новостями (2025): {products_with_news}")
+    print(f"  С новостями ({describe_window()}): {products_with_news}")
     print(f"  Без новостей: {products_without_news}")
     print(f"  Всего найдено новостей: {total_news}")
     print(f"{'='*80}")
+    
+    print_stats()
+    news_dates.print_stats()
 
 if __name__ == '__main__':
-    print("=== Парсер новостей ароматов Fragrantica (2025) ===\n")
+    print(f"=== Парсер новостей ароматов Fragrantica ({describe_window()}) ===\n")
     process_all_perfumes()
 
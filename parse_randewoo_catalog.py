@@ -1,10 +1,8 @@
 import sqlite3
-import cloudscraper
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin
 import sys
 import io
-import time
+from fetcher import get_scraper, print_stats
+from catalog_crawler import crawl_catalog, print_throughput_report
 
 # Фикс кодировки для Windows консоли
 if sys.platform == 'win32':
@@ -29,116 +27,11 @@ def create_database():
     conn.commit()
     return conn
 
-def parse_catalog_page(scraper, url, page_num=None):
-    """Парсит одну страницу каталога"""
-    if page_num:
-        page_url = f"{url}?page={page_num}"
-    else:
-        page_url = url
-    
-    print(f"Загружаю страницу: {page_url}")
-    time.sleep(2)
-    
-    try:
-        response = scraper.get(page_url, timeout=30)
-        response.raise_for_status()
-        response.encoding = 'utf-8'
-        
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        # Находим все товары
-        products = soup.find_all('li', class_='products__item')
-        print(f"  Найдено товаров: {len(products)}")
-        
-        products_list = []
-        
-        for product in products:
-            try:
-                # Бренд
-                brand_div = product.find('div', class_='b-catalogItem__brand')
-                if not brand_div:
-                    continue
-                brand = brand_div.get_text(strip=True)
-                
-                # Название
-                name_div = product.find('div', class_='b-catalogItem__name')
-                if not name_div:
-                    continue
-                name = name_div.get_text(strip=True)
-                
-                # Ссылка
-                link = product.find('a', class_='b-catalogItem__descriptionLink')
-                if not link or not link.get('href'):
-                    continue
-                product_url = urljoin('https://randewoo.ru', link['href'])
-                
-                products_list.append({
-                    'brand': brand,
-                    'name': name,
-                    'product_url': product_url
-                })
-                
-            except Exception as e:
-                print(f"  ⚠ Ошибка при парсинге товара: {e}")
-                continue
-        
-        # Проверяем есть ли следующая страница
-        has_next = False
-        max_pages = 1
-        
-        # Ищем пагинатор
-        pagination = soup.find('ol', class_='pager')
-        if pagination:
-            # Проверяем наличие кнопки "Вперед"
-            next_link = pagination.find('a', class_='pager__link--forward', attrs={'data-role': 'pagination-next-page'})
-            if next_link:
-                has_next = True
-            
-            # Определяем максимальное количество страниц
-            page_links = pagination.find_all('a', class_='pager__link')
-            for link in page_links:
-                data_page = link.get('data-page')
-                if data_page and data_page.isdigit():
-                    max_pages = max(max_pages, int(data_page))
-        
-        return products_list, has_next, max_pages
-        
-    except Exception as e:
-        print(f"  ✗ Ошибка при загрузке страницы: {e}")
-        return [], False, 1
-
 def parse_all_catalog(scraper, base_url):
-    """Парсит все страницы каталога"""
-    all_products = []
-    page = 1
-    total_pages = None
-    
-    while True:
-        products, has_next, max_pages = parse_catalog_page(scraper, base_url, page if page > 1 else None)
-        
-        if total_pages is None and max_pages > 1:
-            total_pages = max_pages
-            print(f"\n  Обнаружено страниц: {total_pages}\n")
-        
-        if not products:
-            print(f"  ⚠ Нет товаров на странице {page}")
-            break
-        
-        all_products.extend(products)
-        print(f"  Прогресс: страница {page}/{total_pages or '?'}, собрано товаров: {len(all_products)}")
-        
-        if not has_next:
-            print("\n  ✓ Достигнута последняя страница")
-            break
-        
-        page += 1
-        
-        # Защита от бесконечного цикла
-        if total_pages and page > total_pages:
-            print(f"\n  ✓ Обработаны все {total_pages} страниц")
-            break
-    
-    return all_products
+    """Парсит все страницы каталога (параллельно, под лимитами хоста)"""
+    products, stats = crawl_catalog(base_url, scraper=scraper)
+    print_throughput_report(stats)
+    return products
 
 def save_to_database(conn, products_list):
     """Сохраняет товары в базу данных"""
@@ -169,18 +62,12 @@ def main():
     conn = create_database()
     print("✓ База данных создана/открыта\n")
     
-    # Создаем scraper
-    scraper = cloudscraper.create_scraper(
-        browser={
-            'browser': 'chrome',
-            'platform': 'windows',
-            'mobile': False
-        }
-    )
-    
     # URL каталога
     catalog_url = 'https://randewoo.ru/category/parfyumeriya'
     
+    # Общий scraper хоста
+    scraper = get_scraper(catalog_url)
+    
     try:
         # Парсим все страницы каталога
         print("Начинаю парсинг каталога...\n")
@@ -204,6 +91,7 @@ def main():
         traceback.print_exc()
     finally:
         conn.close()
+        print_stats()
 
 if __name__ == '__main__':
     main()
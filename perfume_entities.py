@@ -0,0 +1,236 @@
+import re
+import sqlite3
+
+from text_normalize import normalize_lower
+
+# ============================================================================
+# НАСТРОЙКИ
+# ============================================================================
+
+# Части названия Randewoo, которые отличают SKU, а не аромат.
+# Концентрацию (EDP, EDT, extrait) не трогаем: на Fragrantica это разные ароматы
+_VOLUME = re.compile(
+    r'\b\d+(?:[.,]\d+)?\s*(?:[xх×]\s*\d+(?:[.,]\d+)?\s*)?(?:мл|ml|г|g|oz)(?=\W|$)',
+    re.IGNORECASE
+)
+_SKU_WORDS = re.compile(
+    r'(?<!\w)(?:тестер|tester|пробник|sample|миниатюра|отливант|уценка|refill|рефил'
+    r'|(?:подарочный\s+)?набор|без\s+крышки|без\s+коробки|без\s+упаковки)(?!\w)',
+    re.IGNORECASE
+)
+_EMPTY_BRACKETS = re.compile(r'\(\s*[,\-/]*\s*\)|\[\s*\]')
+_EDGE_PUNCT = re.compile(r'^[\s,\-/+]+|[\s,\-/+]+$')
+_SPACES = re.compile(r'\s+')
+_KEY_SEPARATORS = re.compile(r'[\W_]+')
+
+# ============================================================================
+# ТАБЛИЦЫ
+# ============================================================================
+
+def create_tables(conn):
+    """Таблица ароматов и ссылки на нее из товаров и новостей"""
+    cursor = conn.cursor()
+
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS perfume_entities (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            entity_key TEXT NOT NULL UNIQUE,
+            brand TEXT NOT NULL,
+            base_name TEXT NOT NULL,
+            fragrantica_url TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+    for table in ('randewoo_products', 'perfume_news'):
+        try:
+            cursor.execute(f'ALTER TABLE {table} ADD COLUMN entity_id INTEGER')
+        except sqlite3.OperationalError:
+            pass
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_products_entity ON randewoo_products(entity_id)')
+
+    conn.commit()
+
+# ============================================================================
+# КАНОНИЧЕСКОЕ НАЗВАНИЕ
+# ============================================================================
+
+def base_name(name):
+    """
+    Название аромата без объема и пометок SKU:
+    "Libre 50 мл (тестер)" -> "Libre"
+    """
+    base = _VOLUME.sub(' ', name)
+    base = _SKU_WORDS.sub(' ', base)
+    base = _EMPTY_BRACKETS.sub(' ', base)
+    base = _EDGE_PUNCT.sub('', _SPACES.sub(' ', base))
+    # Название целиком из служебных слов - оставляем как есть
+    return base or name.strip()
+
+
+def _key_part(text):
+    # Не normalize_spaced: он отбрасывает кириллицу, и русские названия слились бы в один ключ
+    return _KEY_SEPARATORS.sub(' ', normalize_lower(text)).strip()
+
+
+def entity_key(brand, name):
+    """Ключ аромата: бренд и базовое название в нижнем регистре, слова через пробел"""
+    return f"{_key_part(brand)}|{_key_part(base_name(name))}"
+
+# ============================================================================
+# ГРУППИРОВКА ТОВАРОВ
+# ============================================================================
+
+def assign_entities(conn, product_urls=None):
+    """
+    Привязывает товары без entity_id к ароматам (создает недостающие).
+    Новый объем или тестер уже найденного аромата сразу получает его
+    fragrantica_url - повторный поиск не нужен.
+    product_urls: только эти товары (страница каталога). Возвращает число привязанных
+    """
+    query = 'SELECT id, brand, name FROM randewoo_products WHERE entity_id IS NULL'
+    params = []
+    if product_urls is not None:
+        query += f" AND product_url IN ({','.join('?' * len(product_urls))})"
+        params = list(product_urls)
+    products = conn.execute(query, params).fetchall()
+    if not products:
+        return 0
+
+    keys = {}
+    for product_id, brand, name in products:
+        key = entity_key(brand, name)
+        keys.setdefault(key, (brand, base_name(name), []))[2].append(product_id)
+
+    conn.executemany('''
+        INSERT OR IGNORE INTO perfume_entities (entity_key, brand, base_name) VALUES (?, ?, ?)
+    ''', [(key, brand, base) for key, (brand, base, _) in keys.items()])
+    conn.executemany('''
+        UPDATE randewoo_products
+        SET entity_id = (SELECT id FROM perfume_entities WHERE entity_key = ?)
+        WHERE id = ?
+    ''', [(key, product_id) for key, (_, _, ids) in keys.items() for product_id in ids])
+
+    # Аромат уже сопоставлен (или URL задан вручную у одного из товаров) - отдаем его новым SKU
+    fan_out(conn)
+    conn.commit()
+    return len(products)
+
+
+def fan_out(conn):
+    """
+    Раздает результаты аромата всем его товарам: fragrantica_url товара <-> аромата,
+    entity_id новостей - по товару, к которому новость записана
+    """
+    conn.execute('''
+        UPDATE perfume_entities
+        SET fragrantica_url = (
+            SELECT p.fragrantica_url FROM randewoo_products p
+            WHERE p.entity_id = perfume_entities.id AND p.fragrantica_url IS NOT NULL
+            ORDER BY p.id LIMIT 1
+        )
+        WHERE fragrantica_url IS NULL
+    ''')
+    conn.execute('''
+        UPDATE randewoo_products
+        SET fragrantica_url = (SELECT e.fragrantica_url FROM perfume_entities e WHERE e.id = randewoo_products.entity_id),
+            matched_at = CURRENT_TIMESTAMP
+        WHERE fragrantica_url IS NULL
+          AND entity_id IN (SELECT id FROM perfume_entities WHERE fragrantica_url IS NOT NULL)
+    ''')
+    conn.execute('''
+        UPDATE perfume_news
+        SET entity_id = (SELECT p.entity_id FROM randewoo_products p WHERE p.id = perfume_news.product_id)
+        WHERE entity_id IS NULL
+    ''')
+    conn.commit()
+
+
+def set_product_url(conn, product_id, fragrantica_url):
+    """
+    URL, заданный пользователем для товара (None - сброшен), - URL всего аромата.
+    Товары аромата с его прежним URL получают новый; сброшенный URL
+    снова ищется (matched_at = NULL). Вызывать после assign_entities:
+    fan_out здесь не запускается, отредактированный товар остается как задан
+    """
+    row = conn.execute('''
+        SELECT p.entity_id, e.fragrantica_url
+        FROM randewoo_products p LEFT JOIN perfume_entities e ON e.id = p.entity_id
+        WHERE p.id = ?
+    ''', (product_id,)).fetchone()
+    if row is None:
+        return
+    entity_id, old_url = row
+
+    matched = 'CASE WHEN ? IS NULL THEN NULL ELSE CURRENT_TIMESTAMP END'
+    conn.execute(f'UPDATE randewoo_products SET fragrantica_url = ?, matched_at = {matched} WHERE id = ?',
+                 (fragrantica_url, fragrantica_url, product_id))
+    if entity_id is not None:
+        conn.execute(f'''
+            UPDATE randewoo_products SET fragrantica_url = ?, matched_at = {matched}
+            WHERE entity_id = ? AND id != ? AND fragrantica_url IS ?
+        ''', (fragrantica_url, fragrantica_url, entity_id, product_id, old_url))
+        conn.execute('UPDATE perfume_entities SET fragrantica_url = ? WHERE id = ?', (fragrantica_url, entity_id))
+    conn.commit()
+
+
+def set_match(writer, entity_id, fragrantica_url):
+    """
+    Результат поиска аромата - через WriteBuffer всем его товарам без URL
+    (None - не найден: только отметка matched_at)
+    """
+    if fragrantica_url:
+        writer.add('UPDATE perfume_entities SET fragrantica_url = ? WHERE id = ?',
+                   (fragrantica_url, entity_id))
+        writer.add('''
+            UPDATE randewoo_products SET fragrantica_url = ?, matched_at = CURRENT_TIMESTAMP
+            WHERE entity_id = ? AND fragrantica_url IS NULL
+        ''', (fragrantica_url, entity_id))
+    else:
+        writer.add('''
+            UPDATE randewoo_products SET matched_at = CURRENT_TIMESTAMP
+            WHERE entity_id = ? AND fragrantica_url IS NULL
+        ''', (entity_id,))
+
+
+def entities_to_match(conn, stale_days=None):
+    """
+    Ароматы, у которых есть товары без fragrantica_url (stale_days - как в поиске:
+    не найденные повторно ищутся не чаще раза в stale_days дней).
+    Возвращает [(entity_id, brand, base_name)] и число товаров за ними
+    """
+    query = '''
+        SELECT e.id, e.brand, e.base_name, COUNT(*)
+        FROM randewoo_products p JOIN perfume_entities e ON e.id = p.entity_id
+        WHERE p.fragrantica_url IS NULL
+    '''
+    params = []
+    if stale_days is not None:
+        query += " AND (p.matched_at IS NULL OR p.matched_at < datetime('now', ?))"
+        params.append(f'-{stale_days} days')
+    query += ' GROUP BY e.id ORDER BY MIN(p.id)'
+
+    entities = []
+    products_count = 0
+    for entity_id, brand, base, count in conn.execute(query, params):
+        entities.append((entity_id, brand, base))
+        products_count += count
+    return entities, products_count
+
+
+def member_ids(conn, entity_id):
+    """id товаров аромата"""
+    return [row[0] for row in conn.execute(
+        'SELECT id FROM randewoo_products WHERE entity_id = ? ORDER BY id', (entity_id,))]
+
+
+def get_stats(conn):
+    """Ароматов, товаров в них и средний размер группы"""
+    entities, products = conn.execute('''
+        SELECT COUNT(DISTINCT entity_id), COUNT(*) FROM randewoo_products WHERE entity_id IS NOT NULL
+    ''').fetchone()
+    return {
+        'entities': entities,
+        'products': products,
+        'duplicate_factor': products / entities if entities else 0.0
+    }
@@ -0,0 +1,117 @@
+import sqlite3
+import time
+
+# ============================================================================
+# НАСТРОЙКИ
+# ============================================================================
+
+DB_PATH = 'fragrantica_news.db'
+RESUME_HOURS = 24  # Незавершенный прогон моложе этого продолжаем, старше - начинаем заново
+
+# Этапы полного цикла по порядку
+STAGES = ('clear', 'catalog', 'match', 'news')
+
+# ============================================================================
+# ТАБЛИЦЫ
+# ============================================================================
+
+def create_tables(conn):
+    """Таблица прогонов и отметки времени по товарам для инкрементального режима"""
+    cursor = conn.cursor()
+
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS pipeline_runs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            mode TEXT NOT NULL,
+            status TEXT NOT NULL,
+            last_stage TEXT,
+            started_at REAL NOT NULL,
+            updated_at REAL NOT NULL,
+            finished_at REAL
+        )
+    ''')
+
+    # Когда товар последний раз был в каталоге, сопоставлялся и проверялся на новости
+    for column in ('fragrantica_url TEXT', 'last_seen_at TIMESTAMP',
+                   'matched_at TIMESTAMP', 'news_checked_at TIMESTAMP'):
+        try:
+            cursor.execute(f'ALTER TABLE randewoo_products ADD COLUMN {column}')
+        except sqlite3.OperationalError:
+            pass
+
+    conn.commit()
+
+# ============================================================================
+# ЧЕКПОИНТЫ
+# ============================================================================
+
+def start_run(mode):
+    """
+    Начинает прогон или продолжает незавершенный (упал, прерван Ctrl+C)
+    того же режима не старше RESUME_HOURS.
+    Возвращает {'id', 'mode', 'last_stage', 'resumed'}
+    """
+    conn = sqlite3.connect(DB_PATH, timeout=30)
+    try:
+        create_tables(conn)
+        now = time.time()
+
+        row = conn.execute('''
+            SELECT id, last_stage, started_at FROM pipeline_runs
+            WHERE mode = ? AND status != 'done'
+            ORDER BY id DESC LIMIT 1
+        ''', (mode,)).fetchone()
+
+        if row and now - row[2] < RESUME_HOURS * 3600:
+            conn.execute('''
+                UPDATE pipeline_runs SET status = 'running', updated_at = ? WHERE id = ?
+            ''', (now, row[0]))
+            conn.commit()
+            return {'id': row[0], 'mode': mode, 'last_stage': row[1], 'resumed': True}
+
+        # Старые незавершенные прогоны больше не продолжаем
+        conn.execute('''
+            UPDATE pipeline_runs SET status = 'abandoned'
+            WHERE mode = ? AND status != 'done'
+        ''', (mode,))
+        cursor = conn.execute('''
+            INSERT INTO pipeline_runs (mode, status, started_at, updated_at)
+            VALUES (?, 'running', ?, ?)
+        ''', (mode, now, now))
+        conn.commit()
+        return {'id': cursor.lastrowid, 'mode': mode, 'last_stage': None, 'resumed': False}
+    finally:
+        conn.close()
+
+
+def is_stage_done(run, stage):
+    """True, если этап уже завершен в этом прогоне"""
+    if run['last_stage'] is None:
+        return False
+    return STAGES.index(stage) <= STAGES.index(run['last_stage'])
+
+
+def complete_stage(run, stage):
+    """Записывает чекпоинт: этап завершен"""
+    run['last_stage'] = stage
+    conn = sqlite3.connect(DB_PATH, timeout=30)
+    try:
+        conn.execute('''
+            UPDATE pipeline_runs SET last_stage = ?, updated_at = ? WHERE id = ?
+        ''', (stage, time.time(), run['id']))
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def finish_run(run, status):
+    """Закрывает прогон: done / interrupted / failed"""
+    conn = sqlite3.connect(DB_PATH, timeout=30)
+    try:
+        now = time.time()
+        conn.execute('''
+            UPDATE pipeline_runs SET status = ?, updated_at = ?, finished_at = ? WHERE id = ?
+        ''', (status, now, now if status == 'done' else None, run['id']))
+        conn.commit()
+    finally:
+        conn.close()
@@ -1,11 +1,12 @@
 import sqlite3
 import sys
 import io
-import time
 from openai import OpenAI
-import requests
 import json
 import os
+import telegram_images
+import telegram_sender
+from telegram_sender import get_sender
 
 # Фикс кодировки для Windows консоли
 if sys.platform == 'win32':
@@ -98,6 +99,8 @@ def publish_to_telegram(text, bot_token, channel_id, image_paths=None):
         
         if existing_images:
             print(f"   📸 Отправляю пост с {len(existing_images)} изображениями...")
+            # Уменьшенные версии из кеша вместо многомегабайтных оригиналов
+            existing_images = telegram_images.telegram_paths(existing_images)
             
             # Отправляем media group с текстом внутри
             success = send_media_group_with_caption(bot_token, channel_id, existing_images, text)
@@ -114,8 +117,6 @@ def publish_to_telegram(text, bot_token, channel_id, image_paths=None):
 
 def send_media_group_with_caption(bot_token, channel_id, photo_paths, caption):
     """Отправляет несколько фото как media group с текстом внутри"""
-    url = f"https://api.telegram.org/bot{bot_token}/sendMediaGroup"
-    
     # Telegram позволяет до 10 медиа в одной группе
     photo_paths = photo_paths[:10]
     
@@ -124,65 +125,84 @@ def send_media_group_with_caption(bot_token, channel_id, photo_paths, caption):
         print(f"      ⚠ Caption слишком длинный ({len(caption)} символов), обрезаю до 1024")
         caption = caption[:1021] + "..."
     
+    # Картинки, которые бот уже загружал, отправляем по file_id - без байтов.
+    # Ключи картинок - из имен версий и image_blobs, файлы не перечитываются
+    keys = telegram_images.media_keys(photo_paths)
+    file_ids = telegram_images.known_file_ids(bot_token, keys)
+    if file_ids:
+        print(f"      ♻ По file_id: {len(file_ids)}/{len(photo_paths)} (без загрузки)")
+    
+    result = post_media_group(bot_token, channel_id, photo_paths, caption, file_ids)
+    
+    # file_id устарел или от другого бота - забываем и загружаем файлы.
+    # Другие ошибки (caption, 429, чат) к file_id не относятся - повтор файлами не поможет
+    if (result is not None and not result.get('ok') and file_ids
+            and telegram_images.file_id_rejected(result.get('description'))):
+        print(f"      ⚠ Telegram не принял file_id ({result.get('description')}), загружаю файлы...")
+        telegram_images.forget_file_ids(bot_token, keys, list(file_ids))
+        file_ids = {}
+        result = post_media_group(bot_token, channel_id, photo_paths, caption, file_ids)
+    
+    if result is None:
+        return False
+    
+    if result.get('ok'):
+        telegram_images.record_upload(photo_paths, file_ids)
+        # Запоминаем file_id загруженных файлов (самый большой размер фото)
+        uploaded = [(path, message['photo'][-1]['file_id'])
+                    for path, message in zip(photo_paths, result['result'])
+                    if path not in file_ids and message.get('photo')]
+        telegram_images.remember_file_ids(bot_token, keys, uploaded)
+        return True
+    
+    print(f"      ✗ Ошибка: {result.get('description', 'Unknown error')}")
+    return False
+
+def post_media_group(bot_token, channel_id, photo_paths, caption, file_ids):
+    """
+    Один запрос sendMediaGroup: картинки из file_ids - по file_id, остальные файлами.
+    Возвращает ответ Telegram (dict) или None, если файл не открылся
+    """
+    files = {}
+    
     try:
         # Подготавливаем медиа
         media = []
-        files = {}
         
         for i, photo_path in enumerate(photo_paths):
-            attach_name = f"photo{i}"
-            files[attach_name] = open(photo_path, 'rb')
+            if photo_path in file_ids:
+                item = {"type": "photo", "media": file_ids[photo_path]}
+            else:
+                attach_name = f"photo{i}"
+                files[attach_name] = open(photo_path, 'rb')
+                item = {"type": "photo", "media": f"attach://{attach_name}"}
             
             # Добавляем caption только к первому фото
             if i == 0:
-                media.append({
-                    "type": "photo",
-                    "media": f"attach://{attach_name}",
-                    "caption": caption
-                })
-            else:
-                media.append({
-                    "type": "photo",
-                    "media": f"attach://{attach_name}"
-                })
+                item["caption"] = caption
+            media.append(item)
         
+        # С файлами - multipart, где media передается JSON-строкой;
+        # без файлов - один маленький JSON-запрос
         data = {
             'chat_id': channel_id,
-            'media': json.dumps(media, ensure_ascii=False)
+            'media': json.dumps(media, ensure_ascii=False) if files else media
         }
         
-        response = requests.post(url, data=data, files=files, timeout=60)
+        return get_sender().call(bot_token, 'sendMediaGroup', data, files=files)
         
-        # Закрываем файлы
-        for f in files.values():
-            f.close()
-        
-        if response.status_code == 200:
-            result = response.json()
-            if result.get('ok'):
-                return True
-        
-        # Показываем ошибку если есть
-        try:
-            result = response.json()
-            error_desc = result.get('description', 'Unknown error')
-            print(f"      ✗ Ошибка: {error_desc}")
-        except:
-            print(f"      ✗ HTTP Error {response.status_code}")
-        
-        return False
-        
-    except Exception as e:
+    except OSError as e:
         print(f"      ✗ Ошибка: {e}")
-        # Закрываем файлы в случае ошибки
+        return None
+    finally:
+        # Закрываем файлы
         for f in files.values():
             if not f.closed:
                 f.close()
-        return False
 
 def send_text_only(text, bot_token, channel_id):
     """Отправляет только текст без изображений"""
-    url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
+    sender = get_sender()
     
     # Telegram лимит: 4096 символов
     MAX_LENGTH = 4096
@@ -210,30 +230,14 @@ def send_text_only(text, bot_token, channel_id):
         
         print(f"   📝 Отправляю {len(parts)} частей...")
         
-        # Отправляем все части
+        # Отправляем все части по порядку; паузы между ними выдерживает sender
         for i, part in enumerate(parts, 1):
-            data = {"chat_id": channel_id, "text": part}
+            result = sender.call(bot_token, 'sendMessage', {"chat_id": channel_id, "text": part})
             
-            try:
-                response = requests.post(url, json=data, timeout=30)
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    if result.get('ok'):
-                        print(f"      ✓ Часть {i}/{len(parts)} отправлена")
-                    else:
-                        print(f"      ✗ Ошибка части {i}: {result.get('description')}")
-                        return False
-                else:
-                    print(f"      ✗ HTTP {response.status_code}")
-                    return False
-                
-                # Небольшая задержка между частями
-                if i < len(parts):
-                    time.sleep(0.5)
-                    
-            except Exception as e:
-                print(f"      ✗ Ошибка: {e}")
+            if result.get('ok'):
+                print(f"      ✓ Часть {i}/{len(parts)} отправлена")
+            else:
+                print(f"      ✗ Ошибка части {i}: {result.get('description')}")
                 return False
         
         return True
@@ -244,58 +248,40 @@ def send_text_only(text, bot_token, channel_id):
         "text": text
     }
     
-    try:
-        response = requests.post(url, json=data, timeout=30)
-        
-        if response.status_code == 200:
-            result = response.json()
-            if result.get('ok'):
-                print(f"   ✓ Опубликовано в канал {channel_id}")
-                message_id = result['result']['message_id']
-                print(f"   Message ID: {message_id}")
-                return True
-        
-        # Если ошибка, показываем детали
-        try:
-            result = response.json()
-            error_description = result.get('description', 'Unknown error')
-            error_code = result.get('error_code', response.status_code)
-            
-            print(f"✗ Telegram API Error {error_code}: {error_description}")
-            
-            # Подсказки по исправлению
-            if "chat not found" in error_description.lower():
-                print("\n💡 Решение:")
-                print("  1. Проверьте правильность Channel ID")
-                print("  2. Для публичного канала: @channelname")
-                print("  3. Для приватного канала: -100xxxxxxxxxx")
-                print("  4. Получить ID можно через @userinfobot")
-            elif "bot was blocked" in error_description.lower() or "forbidden" in error_description.lower():
-                print("\n💡 Решение:")
-                print("  1. Добавьте бота в канал")
-                print("  2. Сделайте бота администратором канала")
-                print("  3. Дайте боту право 'Post messages'")
-            elif "message is too long" in error_description.lower():
-                print("\n💡 Решение:")
-                print(f"  Текст слишком длинный ({len(text)} символов)")
-                print("  Максимум: 4096 символов")
-            
-            return False
-            
-        except:
-            print(f"✗ HTTP Error {response.status_code}")
-            print(f"  Response: {response.text[:200]}")
-            return False
-            
-    except requests.exceptions.Timeout:
-        print("✗ Timeout: Telegram API не отвечает")
-        return False
-    except requests.exceptions.ConnectionError:
-        print("✗ Connection Error: Проверьте интернет соединение")
-        return False
-    except Exception as e:
-        print(f"✗ Неожиданная ошибка: {e}")
-        return False
+    result = sender.call(bot_token, 'sendMessage', data, timeout=30)
+    
+    if result.get('ok'):
+        print(f"   ✓ Опубликовано в канал {channel_id}")
+        message_id = result['result']['message_id']
+        print(f"   Message ID: {message_id}")
+        return True
+    
+    # Если ошибка, показываем детали
+    error_description = result.get('description', 'Unknown error')
+    error_code = result.get('error_code', '')
+    
+    print(f"✗ Telegram API Error {error_code}: {error_description}")
+    
+    # Подсказки по исправлению
+    if "chat not found" in error_description.lower():
+        print("\n💡 Решение:")
+        print("  1. Проверьте правильность Channel ID")
+        print("  2. Для публичного канала: @channelname")
+        print("  3. Для приватного канала: -100xxxxxxxxxx")
+        print("  4. Получить ID можно через @userinfobot")
+    elif "bot was blocked" in error_description.lower() or "forbidden" in error_description.lower():
+        print("\n💡 Решение:")
+        print("  1. Добавьте бота в канал")
+        print("  2. Сделайте бота администратором канала")
+        print("  3. Дайте боту право 'Post messages'")
+    elif "message is too long" in error_description.lower():
+        print("\n💡 Решение:")
+        print(f"  Текст слишком длинный ({len(text)} символов)")
+        print("  Максимум: 4096 символов")
+    elif "timed out" in error_description.lower() or "connection" in error_description.lower():
+        print("\n💡 Telegram API не отвечает - проверьте интернет соединение")
+    
+    return False
 
 def process_and_publish(news_id, force_rewrite=False):
     """Обрабатывает и публикует новость"""
@@ -407,6 +393,9 @@ def main():
         except KeyboardInterrupt:
             print("\n\n⊘ Отменено")
 
+    telegram_images.print_stats()
+    telegram_sender.print_stats()
+
 if __name__ == '__main__':
     main()
 
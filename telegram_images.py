@@ -0,0 +1,317 @@
+import hashlib
+import os
+import re
+import sqlite3
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:
+    Image = None  # Без Pillow в Telegram уходят оригиналы
+
+# ============================================================================
+# НАСТРОЙКИ
+# ============================================================================
+
+DB_PATH = 'fragrantica_news.db'
+TELEGRAM_DIR = os.path.join('images', 'telegram')
+
+MAX_EDGE = 1280                   # Длинная сторона: Telegram все равно ужимает фото до 1280
+QUALITY = 85
+FORMAT = 'JPEG'                   # 'JPEG' или 'WEBP'
+PASSTHROUGH_BYTES = 300 * 1024    # JPEG не больше MAX_EDGE и этого размера отправляется как есть
+PREPARE_PROCESSES = os.cpu_count() or 1
+
+EXTENSIONS = {'JPEG': 'jpg', 'WEBP': 'webp'}
+
+# Ответы Telegram, в которых виноват сам file_id (устарел, от другого бота) - только тогда
+# он забывается и файлы загружаются заново; остальные ошибки (caption, 429, чат) - как есть
+FILE_ID_ERRORS = ('file identifier', 'file_reference', 'file reference', 'media_empty')
+
+# ============================================================================
+# КЛЮЧ КЕША
+# ============================================================================
+
+def source_hash(path):
+    """
+    Хеш содержимого исходника: из image_blobs (image_store), для старых
+    файлов с именем по URL - BLAKE2b файла
+    """
+    conn = sqlite3.connect(DB_PATH, timeout=30)
+    try:
+        digest = _blob_hash(conn, path)
+    finally:
+        conn.close()
+    return digest or file_hash(path)
+
+
+def _blob_hash(conn, path):
+    """Хеш файла из image_blobs без чтения файла; None - файла там нет"""
+    try:
+        row = conn.execute('SELECT hash FROM image_blobs WHERE path = ?', (path,)).fetchone()
+    except sqlite3.OperationalError:
+        return None  # Таблицы image_store еще нет
+    return row[0] if row else None
+
+
+def file_hash(path):
+    """BLAKE2b содержимого файла"""
+    hasher = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(64 * 1024), b''):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def derived_path(digest, max_edge=MAX_EDGE, quality=QUALITY, image_format=FORMAT):
+    """Файл версии для Telegram: хеш исходника + настройки, другие настройки - другой файл"""
+    return os.path.join(TELEGRAM_DIR, f"{digest}_{max_edge}q{quality}.{EXTENSIONS[image_format]}")
+
+
+_DERIVED_NAME = re.compile(r'[0-9a-f]+_\d+q\d+\.\w+$')
+
+
+def media_key(conn, path):
+    """
+    Ключ содержимого картинки без чтения файла: у версии для Telegram - имя файла
+    (хеш исходника + настройки), у исходника - хеш из image_blobs.
+    BLAKE2b файла - только для старых файлов, которых нет в image_blobs
+    """
+    name = os.path.basename(path)
+    if (_DERIVED_NAME.match(name)
+            and os.path.normpath(os.path.dirname(path)) == os.path.normpath(TELEGRAM_DIR)):
+        return os.path.splitext(name)[0]
+    return _blob_hash(conn, path) or file_hash(path)
+
+# ============================================================================
+# ПОДГОТОВКА ОДНОЙ КАРТИНКИ
+# ============================================================================
+
+def _encode(path, target, max_edge, quality, image_format):
+    """Уменьшает и перекодирует path в target (через временный файл)"""
+    with Image.open(path) as image:
+        image = ImageOps.exif_transpose(image)
+        if image.mode in ('RGBA', 'LA', 'P'):
+            # Прозрачность - на белый фон: в JPEG ее нет, Telegram все равно рисует фото без нее
+            image = image.convert('RGBA')
+            background = Image.new('RGB', image.size, (255, 255, 255))
+            background.paste(image, mask=image.getchannel('A'))
+            image = background
+        elif image.mode != 'RGB':
+            image = image.convert('RGB')
+        image.thumbnail((max_edge, max_edge), Image.LANCZOS)
+
+        fd, temp_path = tempfile.mkstemp(suffix='.part', dir=TELEGRAM_DIR)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                if image_format == 'JPEG':
+                    image.save(f, 'JPEG', quality=quality, optimize=True, progressive=True)
+                else:
+                    image.save(f, image_format, quality=quality)
+            os.replace(temp_path, target)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+
+def prepare_image(path, max_edge=MAX_EDGE, quality=QUALITY, image_format=FORMAT):
+    """
+    Путь к версии картинки для Telegram и что произошло:
+    ('reused' | 'created' | 'passthrough' | 'failed', путь, байт исходника, байт результата).
+    Функция верхнего уровня - выполняется в ProcessPoolExecutor
+    """
+    source_bytes = os.path.getsize(path)
+    if Image is None:
+        return 'passthrough', path, source_bytes, source_bytes
+
+    try:
+        target = derived_path(source_hash(path), max_edge, quality, image_format)
+        if os.path.exists(target):
+            return 'reused', target, source_bytes, os.path.getsize(target)
+
+        with Image.open(path) as image:
+            small_jpeg = (image.format == 'JPEG' and max(image.size) <= max_edge
+                          and source_bytes <= PASSTHROUGH_BYTES)
+        if small_jpeg:
+            return 'passthrough', path, source_bytes, source_bytes
+
+        os.makedirs(TELEGRAM_DIR, exist_ok=True)
+        _encode(path, target, max_edge, quality, image_format)
+        return 'created', target, source_bytes, os.path.getsize(target)
+
+    except Exception as e:
+        print(f"    ⚠ Не удалось подготовить {path}: {e}")
+        return 'failed', path, source_bytes, source_bytes
+
+# ============================================================================
+# ПАКЕТ КАРТИНОК
+# ============================================================================
+
+_lock = threading.Lock()
+stats = {
+    'reused': 0,        # Версия уже была - без перекодирования
+    'created': 0,       # Перекодировано сейчас
+    'passthrough': 0,   # Исходник уже подходит (или нет Pillow)
+    'failed': 0,        # Не открылась - отправляется оригинал
+    'source_bytes': 0,
+    'telegram_bytes': 0,
+    'file_id_reused': 0,    # Отправлено по file_id - без загрузки байтов
+    'uploaded': 0,          # Загружено файлом
+    'upload_bytes_saved': 0,
+}
+
+
+def _record(results):
+    with _lock:
+        for status, _, source_bytes, telegram_bytes in results:
+            stats[status] += 1
+            stats['source_bytes'] += source_bytes
+            stats['telegram_bytes'] += telegram_bytes
+
+
+def prepare_images(paths, processes=PREPARE_PROCESSES):
+    """
+    Готовит версии для Telegram в пуле процессов: перекодирование - чистый CPU.
+    Возвращает {исходный путь: путь для отправки}
+    """
+    unique = [path for path in dict.fromkeys(paths) if path and os.path.exists(path)]
+    if not unique:
+        return {}
+
+    if processes > 1 and len(unique) > 1:
+        with ProcessPoolExecutor(max_workers=min(processes, len(unique))) as executor:
+            results = list(executor.map(prepare_image, unique))
+    else:
+        results = [prepare_image(path) for path in unique]
+
+    _record(results)
+    return {path: result[1] for path, result in zip(unique, results)}
+
+
+def telegram_paths(paths):
+    """
+    Пути для отправки в Telegram в том же порядке; обычно версии уже
+    подготовлены при сборе статей, недостающие готовятся здесь
+    """
+    prepared = prepare_images(paths, processes=1)
+    return [prepared.get(path, path) for path in paths]
+
+
+# ============================================================================
+# FILE_ID УЖЕ ЗАГРУЖЕННЫХ КАРТИНОК
+# ============================================================================
+
+def create_tables(conn):
+    """
+    telegram_media - file_id, который Telegram вернул за загруженный файл.
+    file_id действует только для своего бота - ключ (media_key файла, id бота)
+    """
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS telegram_media (
+            file_hash TEXT NOT NULL,
+            bot_id TEXT NOT NULL,
+            file_id TEXT NOT NULL,
+            created_at REAL NOT NULL,
+            PRIMARY KEY (file_hash, bot_id)
+        )
+    ''')
+    conn.commit()
+
+
+def _bot_id(bot_token):
+    return bot_token.split(':')[0]
+
+
+def media_keys(paths):
+    """{путь: media_key} - считается один раз на публикацию и передается дальше"""
+    conn = sqlite3.connect(DB_PATH, timeout=30)
+    try:
+        return {path: media_key(conn, path) for path in dict.fromkeys(paths)}
+    finally:
+        conn.close()
+
+
+def known_file_ids(bot_token, keys):
+    """{путь: file_id} для картинок, которые этот бот уже загружал; keys - из media_keys"""
+    conn = sqlite3.connect(DB_PATH, timeout=30)
+    try:
+        create_tables(conn)
+        file_ids = {}
+        for path, key in keys.items():
+            row = conn.execute('SELECT file_id FROM telegram_media WHERE file_hash = ? AND bot_id = ?',
+                               (key, _bot_id(bot_token))).fetchone()
+            if row:
+                file_ids[path] = row[0]
+        return file_ids
+    finally:
+        conn.close()
+
+
+def remember_file_ids(bot_token, keys, uploaded):
+    """uploaded: [(путь, file_id)] из ответа sendMediaGroup"""
+    if not uploaded:
+        return
+    conn = sqlite3.connect(DB_PATH, timeout=30)
+    try:
+        create_tables(conn)
+        conn.executemany('''
+            INSERT OR REPLACE INTO telegram_media (file_hash, bot_id, file_id, created_at) VALUES (?, ?, ?, ?)
+        ''', [(keys[path], _bot_id(bot_token), file_id, time.time()) for path, file_id in uploaded])
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def file_id_rejected(description):
+    """True, если Telegram отклонил запрос из-за самого file_id (см. FILE_ID_ERRORS)"""
+    description = (description or '').lower()
+    return any(error in description for error in FILE_ID_ERRORS)
+
+
+def forget_file_ids(bot_token, keys, paths):
+    """Telegram не принял file_id - в следующий раз загружаем файл заново"""
+    conn = sqlite3.connect(DB_PATH, timeout=30)
+    try:
+        create_tables(conn)
+        conn.executemany('DELETE FROM telegram_media WHERE file_hash = ? AND bot_id = ?',
+                         [(keys[path], _bot_id(bot_token)) for path in paths])
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def record_upload(paths, file_ids):
+    """Статистика одной отправки: сколько файлов ушло по file_id, сколько байтов не загружено"""
+    with _lock:
+        for path in paths:
+            if path in file_ids:
+                stats['file_id_reused'] += 1
+                stats['upload_bytes_saved'] += os.path.getsize(path)
+            else:
+                stats['uploaded'] += 1
+
+
+def print_stats():
+    """Сколько версий переиспользовано и насколько уменьшилась отправка"""
+    with _lock:
+        values = dict(stats)
+    total = (values['reused'] + values['created'] + values['passthrough'] + values['failed']
+             + values['file_id_reused'] + values['uploaded'])
+    if not total:
+        return
+
+    print(f"\n{'='*80}")
+    print(f"ИЗОБРАЖЕНИЯ ДЛЯ TELEGRAM ({MAX_EDGE}px, {FORMAT} q{QUALITY}):")
+    if values['source_bytes']:
+        print(f"  Перекодировано: {values['created']}, из кеша: {values['reused']}, "
+              f"как есть: {values['passthrough']}, ошибок: {values['failed']}")
+        print(f"  Размер: {values['source_bytes']/1024/1024:.1f} МБ -> {values['telegram_bytes']/1024/1024:.1f} МБ "
+              f"({values['telegram_bytes']/values['source_bytes']*100:.0f}%)")
+    if values['file_id_reused'] or values['uploaded']:
+        print(f"  Отправлено по file_id: {values['file_id_reused']} "
+              f"({values['upload_bytes_saved']/1024/1024:.1f} МБ не загружено), файлом: {values['uploaded']}")
+    print(f"{'='*80}")
@@ -0,0 +1,268 @@
+import atexit
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+
+# ============================================================================
+# НАСТРОЙКИ
+# ============================================================================
+
+API_URL = 'https://api.telegram.org/bot{token}/{method}'
+
+# Лимиты Telegram Bot API: ~30 сообщений в секунду на бота,
+# ~1 в секунду в один чат и не больше 20 в минуту в группу/канал
+GLOBAL_PER_SECOND = 30
+CHAT_INTERVAL = 1.0
+CHAT_PER_MINUTE = 20
+
+MAX_RETRIES = 5
+BACKOFF_BASE = 1.0      # Секунд до первого повтора при 5xx/сетевой ошибке, дальше x2
+BACKOFF_MAX = 30.0
+RESULT_TIMEOUT = 120    # Секунд ждать результата из очереди (submit) - чтобы не зависнуть навсегда
+POOL_SIZE = 8           # Keep-alive соединений к api.telegram.org
+
+# ============================================================================
+# ЛИМИТЫ
+# ============================================================================
+
+class RateLimiter:
+    """
+    Расписание отправок: общий лимит бота и лимиты каждого чата.
+    Слот резервируется под блокировкой, ждем - без нее
+    """
+
+    def __init__(self, global_per_second=GLOBAL_PER_SECOND, chat_interval=CHAT_INTERVAL,
+                 chat_per_minute=CHAT_PER_MINUTE):
+        self.global_interval = 1.0 / global_per_second
+        self.chat_interval = chat_interval
+        self.chat_per_minute = chat_per_minute
+        self.lock = threading.Lock()
+        self.global_next = 0.0
+        self.chat_sent = {}         # chat_id -> deque последних слотов (не больше chat_per_minute)
+        self.blocked_until = {}     # chat_id -> время, до которого Telegram просил подождать (429)
+
+    def _chat_slot(self, chat_id, now, min_interval):
+        sent = self.chat_sent.setdefault(chat_id, deque(maxlen=self.chat_per_minute))
+        slot = max(now, self.blocked_until.get(chat_id, 0.0))
+        if sent:
+            slot = max(slot, sent[-1] + max(self.chat_interval, min_interval))
+        if len(sent) == self.chat_per_minute:
+            slot = max(slot, sent[0] + 60.0)
+        sent.append(slot)
+        return slot
+
+    def wait(self, chat_id, min_interval=0.0):
+        """Ждет слота для сообщения в chat_id. Возвращает секунды ожидания"""
+        waited = 0.0
+        with self.lock:
+            slot = self._chat_slot(chat_id, time.time(), min_interval)
+        while True:
+            delay = slot - time.time()
+            if delay > 0:
+                time.sleep(delay)
+                waited += delay
+            # Пока ждали, чат получил 429 - новый слот после блокировки, порядок сообщений сохраняется
+            with self.lock:
+                if slot >= self.blocked_until.get(chat_id, 0.0):
+                    break
+                slot = self._chat_slot(chat_id, time.time(), min_interval)
+
+        # Общий лимит - уже в момент отправки: чаты, ждущие своего слота, его не занимают
+        with self.lock:
+            slot = max(time.time(), self.global_next)
+            self.global_next = slot + self.global_interval
+        delay = slot - time.time()
+        if delay > 0:
+            time.sleep(delay)
+            waited += delay
+        return waited
+
+    def block(self, chat_id, seconds):
+        """429: следующие сообщения в чат - не раньше, чем через retry_after"""
+        with self.lock:
+            self.blocked_until[chat_id] = max(self.blocked_until.get(chat_id, 0.0), time.time() + seconds)
+
+# ============================================================================
+# ОТПРАВКА
+# ============================================================================
+
+_stats_lock = threading.Lock()
+stats = {
+    'sent': 0,          # Успешных запросов
+    'rejected': 0,      # Telegram ответил ok=false (4xx) - без повторов
+    'failed': 0,        # Повторы кончились
+    'retries_429': 0,   # Повторов после Too Many Requests
+    'retries_5xx': 0,   # Повторов после 5xx и ошибок соединения
+    'waited': 0.0,      # Секунд ожидания лимитов
+}
+
+
+def _count(key, value=1):
+    with _stats_lock:
+        stats[key] += value
+
+
+def _not_sent(error):
+    """
+    Ошибка до отправки запроса: соединение не установилось, Telegram поста не видел.
+    После отправки тела (таймаут чтения, обрыв) повтор мог бы опубликовать пост дважды
+    """
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    if isinstance(error, requests.exceptions.ConnectionError) and error.args:
+        return isinstance(getattr(error.args[0], 'reason', None), NewConnectionError)
+    return False
+
+
+class TelegramSender:
+    """
+    Отправка в Bot API через одну keep-alive сессию: лимиты бота и чатов,
+    retry_after из 429, экспоненциальная пауза со случайным разбросом для 5xx.
+    Сообщения одного чата идут строго по очереди (своя очередь на чат),
+    разные чаты - параллельно
+    """
+
+    def __init__(self, limiter=None):
+        self.limiter = limiter or RateLimiter()
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=POOL_SIZE)
+        self.session.mount('https://', adapter)
+        self.lock = threading.Lock()
+        self.chat_locks = {}        # chat_id -> Lock: прямые call() в один чат не перемешиваются
+        self.chat_queues = {}       # chat_id -> ThreadPoolExecutor(1): очередь submit() в порядке постановки
+
+    def _chat(self, chat_id):
+        with self.lock:
+            if chat_id not in self.chat_locks:
+                self.chat_locks[chat_id] = threading.Lock()
+                self.chat_queues[chat_id] = ThreadPoolExecutor(max_workers=1)
+            return self.chat_locks[chat_id], self.chat_queues[chat_id]
+
+    def call(self, bot_token, method, data, files=None, min_interval=0.0, timeout=60):
+        """
+        Запрос к Bot API с повторами. data - поля запроса (chat_id обязателен),
+        files - открытые файлы для multipart, перед повтором перематываются.
+        min_interval - пауза между сообщениями в этот чат, если нужна больше лимита.
+        Возвращает ответ Telegram (dict); при неудаче - {'ok': False, 'description': ...}.
+        Повторяются только 429, 5xx и ошибки соединения до отправки запроса
+        """
+        chat_lock, _ = self._chat(str(data['chat_id']))
+        with chat_lock:
+            return self._call(bot_token, method, data, files, min_interval, timeout)
+
+    def _call(self, bot_token, method, data, files, min_interval, timeout):
+        url = API_URL.format(token=bot_token, method=method)
+        chat_id = str(data['chat_id'])
+        description = 'Unknown error'
+
+        for attempt in range(MAX_RETRIES + 1):
+            _count('waited', self.limiter.wait(chat_id, min_interval))
+            for f in (files or {}).values():
+                f.seek(0)
+
+            try:
+                if files:
+                    response = self.session.post(url, data=data, files=files, timeout=timeout)
+                else:
+                    response = self.session.post(url, json=data, timeout=timeout)
+            except requests.exceptions.RequestException as e:
+                description = str(e)
+                if not _not_sent(e):
+                    # Запрос мог дойти: не повторяем, чтобы не опубликовать дважды
+                    print(f"      ✗ {description[:80]} - без повтора (запрос мог быть доставлен)")
+                    break
+                self._backoff(attempt, description)
+                continue
+
+            try:
+                result = response.json()
+            except ValueError:
+                result = {'ok': False, 'description': f"HTTP Error {response.status_code}"}
+
+            if response.status_code == 429:
+                retry_after = (result.get('parameters') or {}).get('retry_after', 1)
+                print(f"      ⏳ Telegram: подождать {retry_after}с (чат {chat_id})")
+                self.limiter.block(chat_id, retry_after)
+                _count('retries_429')
+                description = result.get('description', 'Too Many Requests')
+                continue
+
+            if response.status_code >= 500:
+                description = result.get('description', f"HTTP Error {response.status_code}")
+                self._backoff(attempt, description)
+                continue
+
+            _count('sent' if result.get('ok') else 'rejected')
+            return result
+
+        _count('failed')
+        return {'ok': False, 'description': description}
+
+    def submit(self, bot_token, method, data, files=None, min_interval=0.0, timeout=60):
+        """
+        Поставить запрос в очередь чата: Future с результатом call().
+        Посты одного чата уходят в порядке постановки
+        """
+        _, chat_queue = self._chat(str(data['chat_id']))
+        return chat_queue.submit(self.call, bot_token, method, data, files, min_interval, timeout)
+
+    def close(self):
+        """Ждет поставленные посты, останавливает потоки очередей чатов и закрывает сессию"""
+        with self.lock:
+            chat_queues = list(self.chat_queues.values())
+            self.chat_queues.clear()
+        for chat_queue in chat_queues:
+            chat_queue.shutdown(wait=True)
+        self.session.close()
+
+    def _backoff(self, attempt, description):
+        if attempt >= MAX_RETRIES:
+            return
+        delay = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt) * random.uniform(0.5, 1.5)
+        print(f"      ⚠ {description[:80]} - повтор через {delay:.1f}с")
+        _count('retries_5xx')
+        time.sleep(delay)
+
+
+_sender = None
+_sender_lock = threading.Lock()
+
+
+def get_sender():
+    """Общий отправитель процесса: одна сессия и одни лимиты на все потоки"""
+    global _sender
+    with _sender_lock:
+        if _sender is None:
+            _sender = TelegramSender()
+            atexit.register(close_sender)
+        return _sender
+
+
+def close_sender():
+    """Закрывает общий отправитель: потоки очередей чатов не живут до конца процесса"""
+    global _sender
+    with _sender_lock:
+        sender, _sender = _sender, None
+    if sender is not None:
+        sender.close()
+
+
+def print_stats():
+    """Отправлено, повторы и время ожидания лимитов"""
+    with _stats_lock:
+        values = dict(stats)
+    if not (values['sent'] or values['rejected'] or values['failed']):
+        return
+
+    print(f"\n{'='*80}")
+    print("TELEGRAM:")
+    print(f"  Отправлено: {values['sent']}, отклонено: {values['rejected']}, не доставлено: {values['failed']}")
+    print(f"  Повторы: 429 - {values['retries_429']}, 5xx/сеть - {values['retries_5xx']}")
+    print(f"  Ожидание лимитов: {values['waited']:.1f}с")
+    print(f"{'='*80}")
@@ -0,0 +1,93 @@
+import re
+import sys
+import unicodedata
+from functools import lru_cache
+
+# ============================================================================
+# НАСТРОЙКИ
+# ============================================================================
+
+NORMALIZE_CACHE_SIZE = 65536  # Сколько разных строк помнить в LRU
+
+# Режимы нормализации
+SPACED = 'spaced'    # NFKD → ASCII, не буквы/цифры → пробел ("Eau de Parfum" → "eau de parfum")
+COMPACT = 'compact'  # NFD без диакритики, только буквы/цифры ("L'Eau" → "leau")
+LOWER = 'lower'      # Только lower() + strip() - вход для fuzzy-сравнения
+
+# ============================================================================
+# ПРЕДКОМПИЛИРОВАННЫЕ ШАБЛОНЫ
+# ============================================================================
+
+_NON_ALNUM_RUN = re.compile(r'[^a-z0-9]+')
+_NON_ALNUM = re.compile(r'[^a-z0-9]')
+
+_combining_marks = None  # Таблица translate: диакритические знаки (категория Mn) → удалить
+
+
+def _get_combining_marks():
+    """Таблица для str.translate, строится один раз при первой не-ASCII строке"""
+    global _combining_marks
+    if _combining_marks is None:
+        _combining_marks = {
+            code: None for code in range(sys.maxunicode + 1)
+            if unicodedata.category(chr(code)) == 'Mn'
+        }
+    return _combining_marks
+
+# ============================================================================
+# НОРМАЛИЗАЦИЯ
+# ============================================================================
+
+def _spaced(text):
+    text = text.lower()
+    # Для ASCII-строк NFKD ничего не меняет - пропускаем
+    if not text.isascii():
+        text = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('utf-8')
+    return _NON_ALNUM_RUN.sub(' ', text).strip()
+
+
+def _compact(text):
+    if not text.isascii():
+        text = unicodedata.normalize('NFD', text).translate(_get_combining_marks())
+    return _NON_ALNUM.sub('', text.lower())
+
+
+def _lower(text):
+    return text.lower().strip()
+
+
+_MODES = {
+    SPACED: _spaced,
+    COMPACT: _compact,
+    LOWER: _lower,
+}
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def normalize(text, mode=SPACED):
+    """
+    Нормализует текст для сравнения названий.
+    Результат кешируется по (строка, режим): одни и те же названия
+    товаров и ароматов встречаются в каждом прогоне
+    """
+    return _MODES[mode](text)
+
+
+def normalize_spaced(text):
+    """NFKD → ASCII, слова через один пробел (поиск в full_parsing_cycle)"""
+    return normalize(text, SPACED)
+
+
+def normalize_compact(text):
+    """Без диакритики и разделителей (add_fragrantica_url_final)"""
+    return normalize(text, COMPACT)
+
+
+def normalize_lower(text):
+    """Нижний регистр без крайних пробелов"""
+    return normalize(text, LOWER)
+
+
+def cache_info():
+    """Статистика LRU-кеша нормализации"""
+    return normalize.cache_info()
@@ -2,11 +2,14 @@ from flask import Flask, render_template, request, jsonify
 import sqlite3
 from openai import OpenAI
 import httpx
-import requests
 import json
 import os
 from datetime import datetime
 import threading
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+import perfume_entities
+from telegram_sender import RESULT_TIMEOUT, get_sender
 
 app = Flask(__name__)
 app.secret_key = os.environ.get('SECRET_KEY', 'dev-secret-key-change-in-production')
@@ -17,10 +20,17 @@ DB_PATH = 'fragrantica_news.db'
 # DATABASE HELPERS
 # ============================================================================
 
+_entity_tables_ready = False
+
 def get_db_connection():
     """Создает подключение к БД"""
+    global _entity_tables_ready
     conn = sqlite3.connect(DB_PATH)
     conn.row_factory = sqlite3.Row
+    # Группировка товаров по ароматам - таблица и колонки, если парсер их еще не создал
+    if not _entity_tables_ready:
+        perfume_entities.create_tables(conn)
+        _entity_tables_ready = True
     return conn
 
 def get_config(key):
@@ -71,9 +81,12 @@ def get_products():
         cursor = conn.cursor()
         
         cursor.execute('''
-            SELECT id, brand, name, product_url, fragrantica_url, parsed_at
-            FROM randewoo_products
-            ORDER BY id DESC
+            SELECT p.id, p.brand, p.name, p.product_url, p.fragrantica_url, p.parsed_at,
+                   p.entity_id, e.base_name AS entity_name,
+                   (SELECT COUNT(*) FROM randewoo_products m WHERE m.entity_id = p.entity_id) AS entity_size
+            FROM randewoo_products p
+            LEFT JOIN perfume_entities e ON e.id = p.entity_id
+            ORDER BY p.id DESC
         ''')
         
         products = []
@@ -84,7 +97,10 @@ def get_products():
                 'name': row['name'],
                 'product_url': row['product_url'],
                 'fragrantica_url': row['fragrantica_url'],
-                'parsed_at': row['parsed_at']
+                'parsed_at': row['parsed_at'],
+                'entity_id': row['entity_id'],
+                'entity_name': row['entity_name'],
+                'entity_size': row['entity_size']
             })
         
         conn.close()
@@ -134,7 +150,8 @@ def add_product():
         brand = data.get('brand', '').strip()
         name = data.get('name', '').strip()
         product_url = data.get('product_url', '').strip()
-        fragrantica_url = data.get('fragrantica_url', '').strip()
+        # Пустой URL - NULL: иначе '' разошелся бы по товарам аромата как найденный URL
+        fragrantica_url = data.get('fragrantica_url', '').strip() or None
         
         if not brand or not name:
             return jsonify({'success': False, 'error': 'Brand and name are required'}), 400
@@ -150,6 +167,7 @@ def add_product():
         product_id = cursor.lastrowid
         
         conn.commit()
+        perfume_entities.assign_entities(conn)
         conn.close()
         
         return jsonify({'success': True, 'id': product_id, 'message': 'Product added successfully'})
@@ -166,7 +184,7 @@ def update_product(product_id):
         brand = data.get('brand', '').strip()
         name = data.get('name', '').strip()
         product_url = data.get('product_url', '').strip()
-        fragrantica_url = data.get('fragrantica_url', '').strip()
+        fragrantica_url = data.get('fragrantica_url', '').strip() or None
         
         if not brand or not name:
             return jsonify({'success': False, 'error': 'Brand and name are required'}), 400
@@ -174,13 +192,17 @@ def update_product(product_id):
         conn = get_db_connection()
         cursor = conn.cursor()
         
+        # Бренд или название могли измениться - аромат определяется заново
         cursor.execute('''
             UPDATE randewoo_products
-            SET brand = ?, name = ?, product_url = ?, fragrantica_url = ?
+            SET brand = ?, name = ?, product_url = ?, entity_id = NULL
             WHERE id = ?
-        ''', (brand, name, product_url, fragrantica_url, product_id))
+        ''', (brand, name, product_url, product_id))
         
         conn.commit()
+        perfume_entities.assign_entities(conn)
+        # URL пользователя - после группировки: он исправляет URL аромата, а не наоборот
+        perfume_entities.set_product_url(conn, product_id, fragrantica_url)
         conn.close()
         
         return jsonify({'success': True, 'message': 'Product updated successfully'})
@@ -205,6 +227,50 @@ def delete_product(product_id):
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
+@app.route('/api/entities')
+def get_entities():
+    """Ароматы: товары Randewoo (объемы, тестеры), сгруппированные по бренду и базовому названию"""
+    try:
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            SELECT e.id, e.brand, e.base_name, e.fragrantica_url,
+                   (SELECT COUNT(*) FROM perfume_news n WHERE n.entity_id = e.id) AS news_count
+            FROM perfume_entities e
+            WHERE EXISTS (SELECT 1 FROM randewoo_products p WHERE p.entity_id = e.id)
+            ORDER BY e.brand, e.base_name
+        ''')
+        entities = {}
+        for row in cursor.fetchall():
+            entities[row['id']] = {
+                'id': row['id'],
+                'brand': row['brand'],
+                'base_name': row['base_name'],
+                'fragrantica_url': row['fragrantica_url'],
+                'news_count': row['news_count'],
+                'products': []
+            }
+        
+        cursor.execute('''
+            SELECT id, name, product_url, entity_id FROM randewoo_products
+            WHERE entity_id IS NOT NULL ORDER BY id
+        ''')
+        for row in cursor.fetchall():
+            if row['entity_id'] in entities:
+                entities[row['entity_id']]['products'].append({
+                    'id': row['id'],
+                    'name': row['name'],
+                    'product_url': row['product_url']
+                })
+        
+        conn.close()
+        
+        return jsonify({'success': True, 'entities': list(entities.values())})
+        
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
 @app.route('/api/settings')
 def get_settings():
     """Получить настройки"""
@@ -243,7 +309,7 @@ def publish():
         
         product_ids = data.get('product_ids', [])
         prompt_template = data.get('prompt', '')
-        delay_seconds = data.get('delay', 5)  # Пауза между постами
+        delay_seconds = data.get('delay', 0)  # Минимальная пауза между постами сверх лимитов Telegram
         
         if not product_ids:
             return jsonify({'success': False, 'error': 'No products selected'}), 400
@@ -271,9 +337,11 @@ def publish():
         
         placeholders = ','.join('?' * len(product_ids))
         cursor.execute(f'''
-            SELECT id, brand, name, product_url, fragrantica_url
-            FROM randewoo_products
-            WHERE id IN ({placeholders})
+            SELECT p.id, p.brand, p.name, p.product_url, p.fragrantica_url, p.entity_id, e.base_name
+            FROM randewoo_products p
+            LEFT JOIN perfume_entities e ON e.id = p.entity_id
+            WHERE p.id IN ({placeholders})
+            ORDER BY p.id
         ''', product_ids)
         
         products = cursor.fetchall()
@@ -282,16 +350,41 @@ def publish():
         if not products:
             return jsonify({'success': False, 'error': 'No products found'}), 404
         
+        # Объемы и тестеры одного аромата - один текст GPT и один пост
+        groups = {}
+        for product in products:
+            key = product['entity_id'] if product['entity_id'] is not None else f"product-{product['id']}"
+            groups.setdefault(key, []).append(product)
+        
         # Результаты публикации
         results = []
         published_count = 0
         failed_count = 0
-        
-        # Публикуем каждый товар
-        for idx, product in enumerate(products):
-            product_id = product['id']
+        pending_count = 0
+        
+        def add_results(members, success, value, pending=False):
+            """Результат поста - каждому товару аромата (pending - исход неизвестен)"""
+            for member in members:
+                result = {
+                    'product_id': member['id'],
+                    'product_name': f"{member['brand']} - {member['name']}",
+                    'success': success
+                }
+                if pending:
+                    result['pending'] = True
+                result['message_id' if success else 'error'] = value
+                results.append(result)
+        
+        # Посты уходят в очередь отправителя, пока GPT пишет следующий текст;
+        # паузы между постами - по лимитам Telegram (и не меньше delay, если задан)
+        sender = get_sender()
+        queued = []
+        
+        # Публикуем каждый аромат
+        for members in groups.values():
+            product = members[0]
             brand = product['brand']
-            name = product['name']
+            name = product['base_name'] if len(members) > 1 and product['base_name'] else product['name']
             product_url = product['product_url']
             fragrantica_url = product['fragrantica_url']
             
@@ -336,55 +429,50 @@ def publish():
                     full_text = full_text[:4093] + "..."
                 
                 # Публикуем в Telegram
-                url = f"https://api.telegram.org/bot{tg_token}/sendMessage"
-                
-                response = requests.post(url, json={
+                future = sender.submit(tg_token, 'sendMessage', {
                     "chat_id": tg_channel,
                     "text": full_text,
                     "disable_web_page_preview": False
-                }, timeout=30)
-                
-                result = response.json()
-                
-                if result.get('ok'):
-                    message_id = result['result']['message_id']
-                    published_count += 1
-                    results.append({
-                        'product_id': product_id,
-                        'product_name': f"{brand} - {name}",
-                        'success': True,
-                        'message_id': message_id
-                    })
-                else:
-                    error_desc = result.get('description', 'Unknown error')
-                    failed_count += 1
-                    results.append({
-                        'product_id': product_id,
-                        'product_name': f"{brand} - {name}",
-                        'success': False,
-                        'error': error_desc
-                    })
-                
-                # Пауза между постами (кроме последнего)
-                if idx < len(products) - 1:
-                    import time
-                    time.sleep(delay_seconds)
+                }, min_interval=delay_seconds, timeout=30)
+                queued.append((members, future, None))
                     
             except Exception as e:
-                failed_count += 1
-                results.append({
-                    'product_id': product_id,
-                    'product_name': f"{brand} - {name}",
-                    'success': False,
-                    'error': str(e)
-                })
+                queued.append((members, None, str(e)))
+        
+        # Ждем отправки всех постов; результаты - в порядке ароматов.
+        # После таймаута очередь чата стоит: остальные посты не ждем, а снимаем с очереди
+        timed_out = False
+        for members, future, error in queued:
+            if future is None:
+                result = {'ok': False, 'description': error}
+            else:
+                try:
+                    result = future.result(timeout=0 if timed_out else RESULT_TIMEOUT)
+                except FutureTimeoutError:
+                    timed_out = True
+                    if not future.cancel():
+                        # Отправка уже идет - пост еще может выйти: не "ошибка", иначе повтор даст дубль
+                        pending_count += len(members)
+                        add_results(members, False, f'Отправка идет дольше {RESULT_TIMEOUT}с - проверьте канал '
+                                                    'перед повтором', pending=True)
+                        continue
+                    result = {'ok': False, 'description': f'Не отправлено: очередь Telegram не успела за '
+                                                          f'{RESULT_TIMEOUT}с, пост снят с очереди'}
+            if result.get('ok'):
+                published_count += len(members)
+                add_results(members, True, result['result']['message_id'])
+            else:
+                failed_count += len(members)
+                add_results(members, False, result.get('description', 'Unknown error'))
         
         # Возвращаем результаты
         return jsonify({
             'success': True,
             'total': len(products),
+            'posts': len(groups),
             'published': published_count,
             'failed': failed_count,
+            'pending': pending_count,
             'results': results
         })
         